@@ -0,0 +1,207 @@
+"""Labirintlarni ko'plab yaratib yechadigan buyruq qatori vositasi.
+
+    python batch.py -n 10000 --level Hard --algorithm astar --out hard.jsonl
+    python batch.py -n 500 --rows 201 --cols 201 --workers 8 --format csv --out big.csv
+    python batch.py -n 100 --save-dir mazes
+    python batch.py --load mazes/*.bin --algorithm bfs
+
+Ish ``ProcessPoolExecutor`` bo'ylab bo'laklarga (``--chunk``) bo'lib
+tarqatiladi, natijalar tayyor bo'lishi bilan JSONL yoki CSV ga yoziladi.
+Har bir labirint ``--seed + index`` seed bilan yaratiladi, shuning uchun
+natijalar takrorlanadi. Labirint fayllari ``mazefile`` binar formatida
+yoki ``CompactGrid.to_text()`` matn formatida ('#' devor, '.' yo'lak,
+'S' start, 'F' finish) bo'lishi mumkin.
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import core
+import distfield
+import mazefile
+import mazegen
+import pqueue
+import solvers
+
+FIELDS = ["index", "source", "rows", "cols", "algorithm", "found", "path_length",
+          "expanded", "pushed", "stale", "time_ms", "error"]
+
+def build_maze(task):
+    """Vazifa bo'yicha (grid, start, finish) qaytaradi."""
+    if "path" in task:
+        with open(task["path"], "rb") as f:
+            binary = f.read(len(mazefile.MAGIC)) == mazefile.MAGIC
+        if binary:
+            grid, _ = mazefile.load(task["path"])
+        else:
+            with open(task["path"]) as f:
+                grid = core.CompactGrid.from_text(f.read())
+        start, finish = grid.marks.find(core.START), grid.marks.find(core.FINISH)
+        if start < 0 or finish < 0:
+            raise ValueError("%s: start (S) yoki finish (F) yo'q" % task["path"])
+        return grid, start, finish
+
+    rows, cols = task["rows"], task["cols"]
+    rng = random.Random(task["seed"])
+    grid = core.CompactGrid(rows, cols)
+    mazegen.generate(grid, task["generator"], rng)
+    mazegen.add_extra_paths(grid, task["extra"], rng)
+    start = grid[1][1]
+    if task["finish"] == "corner":
+        finish = grid[rows - 2 - (rows % 2 == 0)][cols - 2 - (cols % 2 == 0)]
+        finish.wall = False
+    else:
+        finish = core.random_finish(grid, start, rng, distfield.DistanceField(grid, start.idx).dist)
+    grid.marks[start.idx] = core.START
+    grid.marks[finish.idx] = core.FINISH
+    return grid, start.idx, finish.idx
+
+def solve_task(task):
+    """Bitta labirintni yechadi; o'qib bo'lmasa yoki navbat mos kelmasa ``error`` to'ldiriladi."""
+    try:
+        grid, start, finish = build_maze(task)
+        solver = solvers.make_solver(grid, start, finish, task["algorithm"], task.get("queue"))
+    except (OSError, ValueError) as e:
+        # Bitta yomon fayl butun to'plamni to'xtatmasin
+        row = dict.fromkeys(FIELDS)
+        row.update(index=task["index"], source=task.get("path", task.get("seed")),
+                   algorithm=task["algorithm"], found=False, error=str(e))
+        return row
+    path = solver.run()
+    if task.get("save_dir"):
+        name = os.path.join(task["save_dir"], "maze_%06d.%s" % (task["index"], task["save_format"]))
+        if task["save_format"] == "bin":
+            mazefile.save(name, grid, start, finish, path=path, seed=task["seed"],
+                          generator=task["generator"], extra_paths=task["extra"])
+        else:
+            with open(name, "w") as f:
+                f.write(grid.to_text())
+    stats = solver.stats
+    return {
+        "index": task["index"],
+        "source": task.get("path", task.get("seed")),
+        "rows": grid.rows,
+        "cols": grid.cols,
+        "algorithm": task["algorithm"],
+        "found": path is not None,
+        "path_length": stats["path_length"],
+        "expanded": stats["expanded"],
+        "pushed": stats["pushed"],
+        "stale": stats["stale"],
+        "time_ms": round(stats["time"] * 1000, 4),
+        "error": None,
+    }
+
+def solve_chunk(tasks):
+    """Bitta worker jarayoniga beriladigan bo'lak."""
+    return [solve_task(task) for task in tasks]
+
+def chunks(tasks, size):
+    chunk = []
+    for task in tasks:
+        chunk.append(task)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def run(tasks, workers, chunk_size, emit):
+    """Vazifalarni bajarib, har bir natijani ``emit`` ga beradi (tartib kafolatlanmaydi)."""
+    if workers <= 1:
+        for chunk in chunks(tasks, chunk_size):
+            for result in solve_chunk(chunk):
+                emit(result)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Xotira chegaralangan bo'lishi uchun bir vaqtda faqat bir nechta bo'lak navbatda
+        pending = set()
+        for chunk in chunks(tasks, chunk_size):
+            pending.add(pool.submit(solve_chunk, chunk))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for result in future.result():
+                        emit(result)
+        for future in pending:
+            for result in future.result():
+                emit(result)
+
+def make_tasks(args):
+    if args.load:
+        for i, path in enumerate(args.load):
+            yield {"index": i, "path": path, "algorithm": args.algorithm, "queue": args.queue}
+        return
+
+    if args.level:
+        cfg = core.LEVELS[args.level]
+        rows, cols, extra = cfg["ROWS"], cfg["COLS"], cfg["EXTRA_PATHS"]
+    else:
+        rows, cols = args.rows, args.cols
+        extra = args.extra if args.extra is not None else rows * cols // 20
+    for i in range(args.count):
+        yield {"index": i, "seed": args.seed + i, "rows": rows, "cols": cols, "extra": extra,
+               "generator": args.generator, "finish": args.finish, "algorithm": args.algorithm,
+               "queue": args.queue, "save_dir": args.save_dir, "save_format": args.save_format}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--count", type=int, default=100, help="nechta labirint yaratish")
+    parser.add_argument("--level", choices=list(core.LEVELS), help="o'lchamlarni LEVELS dan olish")
+    parser.add_argument("--rows", type=int, default=41)
+    parser.add_argument("--cols", type=int, default=41)
+    parser.add_argument("--extra", type=int, help="EXTRA_PATHS (standart: kataklarning 5%%)")
+    parser.add_argument("--generator", choices=list(mazegen.GENERATORS), default="backtracker")
+    parser.add_argument("--finish", choices=["random", "corner"], default="random")
+    parser.add_argument("--load", nargs="*", help="yaratish o'rniga fayllardan o'qish")
+    parser.add_argument("--save-dir", help="yaratilgan labirintlarni shu papkaga saqlash")
+    parser.add_argument("--save-format", choices=["bin", "txt"], default="bin",
+                        help="bin - mazefile (yechilgan yo'l bilan), txt - CompactGrid.to_text()")
+    parser.add_argument("--algorithm", choices=list(solvers.SOLVERS), default="dijkstra")
+    parser.add_argument("--queue", choices=["auto"] + list(pqueue.QUEUES),
+                        help="ustuvorlik navbati (standart: solver tanlaydi)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk", type=int, default=16, help="bitta vazifadagi labirintlar soni")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument("--out", help="natijalar fayli (standart: stdout)")
+    args = parser.parse_args(argv)
+    if args.queue in pqueue.MONOTONE_ONLY and not solvers.SOLVERS[args.algorithm].monotone:
+        parser.error("--queue %s %s bilan ishlamaydi (heap, lazy yoki auto)" % (args.queue, args.algorithm))
+    if args.save_dir:
+        os.makedirs(args.save_dir, exist_ok=True)
+
+    out = open(args.out, "w", newline="") if args.out else sys.stdout
+    if args.format == "csv":
+        writer = csv.DictWriter(out, fieldnames=FIELDS)
+        writer.writeheader()
+        emit_row = writer.writerow
+    else:
+        emit_row = lambda result: out.write(json.dumps(result) + "\n")
+
+    count = failed = 0
+    def emit(result):
+        nonlocal count, failed
+        count += 1
+        failed += result["error"] is not None
+        emit_row(result)
+
+    t0 = time.perf_counter()
+    try:
+        run(make_tasks(args), args.workers, args.chunk, emit)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - t0
+    print("%d ta labirint (%d xato), %.2f s, %.1f labirint/s (%d worker)"
+          % (count, failed, elapsed, count / elapsed if elapsed else 0, args.workers), file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
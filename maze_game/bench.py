@@ -0,0 +1,259 @@
+"""Generatsiya, qidiruv va chizish uchun benchmark.
+
+    python bench.py                          # LEVELS + sintetik o'lchamlar
+    python bench.py --sizes 201 401 --repeat 10 --out bench.json
+    python bench.py --compare old.json       # regressiyalarni tekshirish
+
+Har bir holat uchun ops/sec, p50/p99 kechikish va eng yuqori xotira
+(tracemalloc) hisoblanadi. Natijalar JSON ga yoziladi; ``--compare``
+berilsa p50 ``--threshold`` dan ko'proq sekinlashgan holatlar chiqariladi
+va dastur 1 kodi bilan tugaydi. Chizish pygame'ning ``dummy`` SDL video
+drayveri bilan, oyna ochmasdan o'lchanadi.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import core
+import crowd
+import mazegen
+import pqueue
+import solvecache
+import solvers
+import world
+
+def measure(fn, setup=None, repeat=20, warmup=1):
+    """``fn(state)`` ni ``repeat`` marta o'lchaydi; ``setup()`` vaqtga kirmaydi."""
+    for _ in range(warmup):
+        fn(setup() if setup else None)
+
+    samples = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        t0 = time.perf_counter()
+        fn(state)
+        samples.append(time.perf_counter() - t0)
+
+    state = setup() if setup else None
+    tracemalloc.start()
+    fn(state)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    samples.sort()
+    mean = sum(samples) / len(samples)
+    return {
+        "ops_per_sec": 1 / mean if mean else float("inf"),
+        "mean_ms": mean * 1000,
+        "p50_ms": samples[len(samples) // 2] * 1000,
+        "p99_ms": samples[min(int(len(samples) * 0.99), len(samples) - 1)] * 1000,
+        "peak_kib": peak / 1024,
+        "repeat": repeat,
+    }
+
+# ---------------- HOLATLAR ----------------
+def make_maze(rows, cols, extra, seed):
+    rng = random.Random(seed)
+    grid = core.CompactGrid(rows, cols)
+    mazegen.generate(grid, "backtracker", rng)
+    mazegen.add_extra_paths(grid, extra, rng)
+    start = grid[1][1]
+    finish = core.random_finish(grid, start, rng)
+    return grid, start, finish
+
+def bench_config(name, rows, cols, extra, repeat, seed, render=None):
+    results = {}
+    grid, start, finish = make_maze(rows, cols, extra, seed)
+
+    def node_grid():
+        return core.create_grid(rows, cols)
+
+    def core_generate(g):
+        core.generate_maze(g, g[1][1], g[1][1], random.Random(seed))
+    results["core.generate_maze"] = measure(core_generate, node_grid, repeat)
+
+    def core_extra(g):
+        core.add_extra_paths(g, extra, random.Random(seed))
+    results["core.add_extra_paths"] = measure(core_extra, lambda: grid.to_nodes(), repeat)
+
+    for alg in mazegen.GENERATORS:
+        results["mazegen." + alg] = measure(
+            lambda g, alg=alg: mazegen.generate(g, alg, random.Random(seed)),
+            lambda: core.CompactGrid(rows, cols), repeat)
+    results["mazegen.add_extra_paths"] = measure(
+        lambda g: mazegen.add_extra_paths(g, extra, random.Random(seed)),
+        lambda: core.CompactGrid.from_nodes(grid.to_nodes()), repeat)
+
+    results["core.random_finish"] = measure(lambda _: core.random_finish(grid, start, random.Random(seed)), None, repeat)
+
+    nodes = grid.to_nodes()
+    cells = [node for row in nodes for node in row]
+    results["core.get_neighbors(all cells)"] = measure(
+        lambda _: [core.get_neighbors(node, nodes) for node in cells], None, repeat)
+    results["solvers.open_neighbors(all cells)"] = measure(
+        lambda _: [solvers.open_neighbors(grid.walls, rows, cols, i) for i in range(rows * cols)], None, repeat)
+
+    n_start, n_finish = nodes[start.row][start.col], nodes[finish.row][finish.col]
+    results["core.dijkstra"] = measure(lambda _: core.dijkstra(n_start, n_finish, nodes), None, repeat)
+    for alg in solvers.SOLVERS:
+        results["solvers." + alg] = measure(
+            lambda _, alg=alg: solvers.make_solver(grid, start.idx, finish.idx, alg).run(), None, repeat)
+    for alg in ("dijkstra", "astar"):
+        for kind in pqueue.QUEUES:
+            if kind in ("fifo", "bucket") and not solvers.SOLVERS[alg].monotone:
+                continue
+            results["solvers.%s[%s]" % (alg, kind)] = measure(
+                lambda _, alg=alg, kind=kind: solvers.make_solver(grid, start.idx, finish.idx, alg, kind).run(),
+                None, repeat)
+
+    # Relyefli xarita: kataklarning yarmiga tasodifiy yo'l/loy/suv
+    weighted = core.CompactGrid.from_text(grid.to_text())
+    rng = random.Random(seed)
+    for idx in range(rows * cols):
+        if rng.random() < 0.5:
+            weighted.set_terrain(idx, rng.randrange(len(core.TERRAIN_COSTS)))
+    for kind in ("auto", "heap", "lazy"):
+        results["solvers.dijkstra(terrain)[%s]" % kind] = measure(
+            lambda _, kind=kind: solvers.make_solver(weighted, start.idx, finish.idx, "dijkstra", kind).run(),
+            None, repeat)
+
+    results["world.generate(chunk)"] = measure(lambda _: world.World(seed).generate(0, 0), None, repeat)
+    far = (rows | 1, -(cols | 1))
+    results["world.find_path(across chunks)"] = measure(
+        lambda w: world.find_path(w, (1, 1), far), lambda: world.World(seed), repeat)
+
+    # Yechimlar keshi: to'liq xesh va keshdan yo'l olish (qidiruvning o'rniga)
+    results["solvecache.LayoutHash(full)"] = measure(lambda _: solvecache.LayoutHash(weighted), None, repeat)
+    cache = solvecache.SolveCache()
+    key = cache.key(grid, start.idx, finish.idx, "astar")
+    solver = solvers.make_solver(grid, start.idx, finish.idx, "astar")
+    solver.run()
+    cache.put(key, solver)
+    results["solvecache.get(hit)"] = measure(
+        lambda _: cache.get(cache.key(grid, start.idx, finish.idx, "astar")), None, repeat)
+
+    results["crowd.Crowd(1000 agents)"] = measure(lambda _: crowd.Crowd(grid, 1000, random.Random(seed)), None, repeat)
+    agents = crowd.Crowd(grid, 1000, random.Random(seed))
+    results["crowd.update(1000 agents)"] = measure(lambda _: agents.update(1.0), None, repeat)
+
+    if render:
+        results.update(render(grid, rows, cols, repeat))
+    return results
+
+def make_render_bench():
+    """Headless ``draw_all`` o'lchovi (pygame dummy drayver bilan)."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import main
+
+    def render(grid, rows, cols, repeat):
+        cell_size = max(main.WIDTH // max(rows, cols), 1)
+        main.LEVELS["bench"] = {"ROWS": rows, "COLS": cols, "CELL_SIZE": cell_size, "EXTRA_PATHS": 0}
+        main.update_global_level("bench")
+        del main.LEVELS["bench"]
+        view = core.CompactGrid(rows, cols, cell_size, view_cls=main.CellView)
+        view.walls[:] = grid.walls
+        camera = main.Camera(main.WIDTH, main.HEIGHT, cols * cell_size, rows * cell_size)
+        player = main.Player(view[1][1])
+
+        def full_frame(_):
+            main.RENDERER.invalidate()
+            main.draw_all(main.WIN, view, player, camera, [])
+
+        def idle_frame(_):
+            main.draw_all(main.WIN, view, player, camera, [])
+
+        main.draw_all(main.WIN, view, player, camera, [])
+        nodes = view.to_nodes(main.Node)
+        results = {
+            "main.draw_all(full)": measure(full_frame, None, repeat),
+            "main.draw_all(idle)": measure(idle_frame, None, repeat),
+            "main.draw_all(Node grid)": measure(
+                lambda _: main.draw_all(main.WIN, nodes, player, camera, []), None, repeat),
+        }
+
+        # Brauzer profilidagi arzon chizish (main.CHEAP_RENDER)
+        cheap = main.CHEAP_RENDER
+        try:
+            main.CHEAP_RENDER = True
+            main.load_all_assets()
+            main.RENDERER = None
+            main.draw_all(main.WIN, view, player, camera, [])
+            results["main.draw_all(full, cheap)"] = measure(full_frame, None, repeat)
+        finally:
+            main.CHEAP_RENDER = cheap
+            main.load_all_assets()
+            main.RENDERER = None
+        return results
+    return render
+
+# ---------------- TAQQOSLASH ----------------
+def compare(old, new, threshold):
+    """p50 bo'yicha sekinlashgan holatlar ro'yxati: (kalit, eski, yangi)."""
+    slower = []
+    for config, cases in new["results"].items():
+        for case, stats in cases.items():
+            prev = old.get("results", {}).get(config, {}).get(case)
+            if prev and prev["p50_ms"] > 0 and stats["p50_ms"] > prev["p50_ms"] * (1 + threshold):
+                slower.append((config + "/" + case, prev["p50_ms"], stats["p50_ms"]))
+    return slower
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="*", default=[101, 201],
+                        help="qo'shimcha sintetik NxN o'lchamlar")
+    parser.add_argument("--levels", nargs="*", default=list(core.LEVELS),
+                        help="core.LEVELS dan o'lchanadigan darajalar")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--no-render", action="store_true", help="draw_all ni o'lchamaslik")
+    parser.add_argument("--out", default="bench_output.json")
+    parser.add_argument("--compare", help="avvalgi natijalar JSON fayli")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="regressiya chegarasi (0.10 = 10%% sekinroq)")
+    args = parser.parse_args(argv)
+
+    configs = [(name, cfg["ROWS"], cfg["COLS"], cfg["EXTRA_PATHS"]) for name, cfg in core.LEVELS.items()
+               if name in args.levels]
+    configs += [("synthetic-%dx%d" % (n, n), n, n, n * n // 20) for n in args.sizes]
+    render = None if args.no_render else make_render_bench()
+
+    report = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": {},
+    }
+    for name, rows, cols, extra in configs:
+        print("== %s (%dx%d)" % (name, rows, cols))
+        results = bench_config(name, rows, cols, extra, args.repeat, args.seed, render)
+        report["results"][name] = results
+        for case, stats in results.items():
+            print("  %-36s %10.1f ops/s  p50 %9.3f ms  p99 %9.3f ms  peak %9.1f KiB"
+                  % (case, stats["ops_per_sec"], stats["p50_ms"], stats["p99_ms"], stats["peak_kib"]))
+
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print("Natijalar: " + args.out)
+
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        slower = compare(old, report, args.threshold)
+        for key, before, after in slower:
+            print("REGRESSIYA: %s  %.3f ms -> %.3f ms" % (key, before, after))
+        if slower:
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,523 @@
+"""Labirint yadrosi: pygame'siz grid, generatsiya va Dijkstra.
+
+Bu modul oyna ochmaydi va pygame'ni import qilmaydi, shuning uchun uni
+batch ishlar va testlarda bemalol ishlatish mumkin.
+"""
+import heapq
+import random
+import time
+from array import array
+
+# ---------------- QIYINCHILIK DARALARI CONFIG ----------------
+LEVELS = {
+    "Easy": {"ROWS": 15, "COLS": 15, "CELL_SIZE": 800 // 15, "EXTRA_PATHS": 100},
+    "Medium": {"ROWS": 25, "COLS": 25, "CELL_SIZE": 800 // 25, "EXTRA_PATHS": 70},
+    "Hard": {"ROWS": 40, "COLS": 40, "CELL_SIZE": 800 // 40, "EXTRA_PATHS": 30},
+    # Katak o'lchami qat'iy: xarita oynadan katta, kamera aylanadi
+    "Huge": {"ROWS": 121, "COLS": 121, "CELL_SIZE": 24, "EXTRA_PATHS": 600},
+}
+
+DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+# ---------------- NODE ----------------
+class Node:
+    def __init__(self, row, col, cell_size=0):
+        self.row = row
+        self.col = col
+        self.x = col * cell_size
+        self.y = row * cell_size
+        self.wall = False
+        self.start = False
+        self.finish = False
+        self.distance = float('inf')
+        self.prev = None
+        self.in_queue = False
+        self.processed = False
+        self.is_path = False
+        self.is_current = False
+
+    def __lt__(self, other):
+        return self.distance < other.distance
+
+    def reset_search(self):
+        self.distance = float('inf')
+        self.prev = None
+        self.in_queue = False
+        self.processed = False
+        self.is_path = False
+        self.is_current = False
+
+# ---------------- COMPACT GRID ----------------
+INF = 2**31 - 1
+
+# marks bitlari
+START = 1
+FINISH = 2
+
+# ---------------- RELYEF ----------------
+# Har katakning relyef turi (grid.terrain) va unga kirish narxi. Oddiy yer 2
+# turadi, shunda yo'l undan arzon bo'la oladi va narxlar butun sonligicha qoladi.
+GROUND, ROAD, MUD, WATER = 0, 1, 2, 3
+TERRAIN_NAMES = ("ground", "road", "mud", "water")
+TERRAIN_COSTS = bytes((2, 1, 4, 8))
+# terrain baytlaridan narx baytlariga (bytes.translate uchun)
+COST_TABLE = TERRAIN_COSTS + bytes([TERRAIN_COSTS[GROUND]]) * (256 - len(TERRAIN_COSTS))
+
+# qidiruv holati bitlari
+IN_QUEUE = 1
+PROCESSED = 2
+PATH = 4
+CURRENT = 8
+
+class CompactGrid:
+    """Tekis buferlarga asoslangan grid.
+
+    Har bir katak uchun ``Node`` obyekti o'rniga bir nechta bayt saqlanadi:
+    ``walls`` va ``marks`` (start/finish), ``state`` (qidiruv holati) -
+    ``bytearray``; ``distance`` va ``prev`` - ``array('i')``. ``grid[r][c]``
+    kerak bo'lganda ``NodeView`` qaytaradi, shuning uchun ``Node`` bilan
+    ishlaydigan funksiyalar o'zgarishsiz ishlayveradi.
+
+    ``wall_version`` devorlar o'zgarganda oshadi (``NodeView.wall`` orqali);
+    ``walls`` ga to'g'ridan-to'g'ri yozadigan kod uni o'zi oshiradi. Devorlarga
+    bog'liq keshlar (masalan ``distfield``) shu raqam bilan tekshiriladi.
+
+    ``terrain`` - har katakning relyef turi (``GROUND``, ``ROAD``, ...),
+    ``set_terrain`` orqali o'zgartiriladi va ``terrain_version`` ni oshiradi.
+    """
+
+    def __init__(self, rows, cols, cell_size=0, view_cls=None):
+        self.rows = rows
+        self.cols = cols
+        self.cell_size = cell_size
+        self.view_cls = view_cls or NodeView
+        self.walls = bytearray(rows * cols)
+        self.marks = bytearray(rows * cols)
+        self.terrain = bytearray(rows * cols)
+        self.wall_version = 0
+        self.terrain_version = 0
+        self.reset_search()
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, row):
+        if not 0 <= row < self.rows:
+            raise IndexError(row)
+        return _GridRow(self, row)
+
+    def __iter__(self):
+        for r in range(self.rows):
+            yield _GridRow(self, r)
+
+    def index(self, row, col):
+        return row * self.cols + col
+
+    def node(self, idx):
+        return self.view_cls(self, idx // self.cols, idx % self.cols)
+
+    def reset_search(self):
+        n = self.rows * self.cols
+        self.state = bytearray(n)
+        self.distance = array('i', [INF]) * n
+        self.prev = array('i', [-1]) * n
+
+    def reset(self):
+        """Devorlar, start/finish va qidiruvni tozalaydi (qayta yaratmasdan)."""
+        n = self.rows * self.cols
+        self.walls = bytearray(n)
+        self.marks = bytearray(n)
+        self.terrain = bytearray(n)
+        self.wall_version += 1
+        self.terrain_version += 1
+        self.reset_search()
+
+    def set_terrain(self, idx, kind):
+        """Katak relyefini o'zgartiradi; o'zgargan bo'lsa True."""
+        if self.terrain[idx] == kind:
+            return False
+        self.terrain[idx] = kind
+        self.terrain_version += 1
+        return True
+
+    def costs(self):
+        """Har katakka kirish narxi (``bytes``, ``TERRAIN_COSTS`` bo'yicha)."""
+        return self.terrain.translate(COST_TABLE)
+
+    def cost_range(self):
+        """Gridda uchraydigan eng kichik va eng katta narx."""
+        present = [TERRAIN_COSTS[kind] for kind in range(len(TERRAIN_COSTS)) if kind in self.terrain]
+        return min(present), max(present)
+
+    @classmethod
+    def from_nodes(cls, grid, cell_size=0, view_cls=None):
+        rows, cols = len(grid), len(grid[0])
+        compact = cls(rows, cols, cell_size, view_cls)
+        for r, row in enumerate(grid):
+            base = r * cols
+            for c, node in enumerate(row):
+                compact.walls[base + c] = node.wall
+                compact.marks[base + c] = (START if node.start else 0) | (FINISH if node.finish else 0)
+        return compact
+
+    def to_nodes(self, node_cls=Node):
+        grid = create_grid(self.rows, self.cols, self.cell_size, node_cls)
+        for idx in range(self.rows * self.cols):
+            node = grid[idx // self.cols][idx % self.cols]
+            node.wall = bool(self.walls[idx])
+            node.start = bool(self.marks[idx] & START)
+            node.finish = bool(self.marks[idx] & FINISH)
+        return grid
+
+    # Matn ko'rinishi: '#' devor, '.' yo'lak, 'S' start, 'F' finish,
+    # relyef: '=' yo'l, '%' loy, '~' suv
+    def to_text(self):
+        chars = bytearray(self.walls.translate(TEXT_CHARS))
+        if self.terrain.count(GROUND) != len(self.terrain):
+            for idx, kind in enumerate(self.terrain):
+                if kind and not self.walls[idx]:
+                    chars[idx] = TERRAIN_CHARS[kind]
+        for idx, mark in enumerate(self.marks):
+            if mark:
+                chars[idx] = ord("S") if mark & START else ord("F")
+        cols = self.cols
+        return "\n".join(chars[r * cols:(r + 1) * cols].decode() for r in range(self.rows)) + "\n"
+
+    @classmethod
+    def from_text(cls, text, cell_size=0, view_cls=None):
+        lines = [line for line in text.splitlines() if line]
+        compact = cls(len(lines), len(lines[0]), cell_size, view_cls)
+        for r, line in enumerate(lines):
+            if len(line) != compact.cols:
+                raise ValueError("%d-qator uzunligi %d, kutilgan %d" % (r, len(line), compact.cols))
+            base = r * compact.cols
+            for c, ch in enumerate(line):
+                if ch == "#":
+                    compact.walls[base + c] = 1
+                elif ch == "S":
+                    compact.marks[base + c] = START
+                elif ch == "F":
+                    compact.marks[base + c] = FINISH
+                elif ch in TERRAIN_FROM_CHARS:
+                    compact.terrain[base + c] = TERRAIN_FROM_CHARS[ch]
+                elif ch != ".":
+                    raise ValueError("Noma'lum belgi %r (%d, %d)" % (ch, r, c))
+        return compact
+
+# walls baytlaridan matn belgilariga
+TEXT_CHARS = bytes.maketrans(b"\x00\x01", b".#")
+# terrain turi -> belgi (GROUND, ROAD, MUD, WATER tartibida)
+TERRAIN_CHARS = b".=%~"
+TERRAIN_FROM_CHARS = {"=": ROAD, "%": MUD, "~": WATER}
+
+class _GridRow:
+    __slots__ = ("grid", "row")
+
+    def __init__(self, grid, row):
+        self.grid = grid
+        self.row = row
+
+    def __len__(self):
+        return self.grid.cols
+
+    def __getitem__(self, col):
+        if not 0 <= col < self.grid.cols:
+            raise IndexError(col)
+        return self.grid.view_cls(self.grid, self.row, col)
+
+    def __iter__(self):
+        grid = self.grid
+        for c in range(grid.cols):
+            yield grid.view_cls(grid, self.row, c)
+
+def _state_flag(bit):
+    def getter(self):
+        return bool(self.grid.state[self.idx] & bit)
+
+    def setter(self, value):
+        if value:
+            self.grid.state[self.idx] |= bit
+        else:
+            self.grid.state[self.idx] &= ~bit
+    return property(getter, setter)
+
+def _mark_flag(bit):
+    def getter(self):
+        return bool(self.grid.marks[self.idx] & bit)
+
+    def setter(self, value):
+        if value:
+            self.grid.marks[self.idx] |= bit
+        else:
+            self.grid.marks[self.idx] &= ~bit
+    return property(getter, setter)
+
+class NodeView:
+    """``CompactGrid`` katagiga ``Node`` API'si orqali kirish."""
+    __slots__ = ("grid", "row", "col", "idx")
+
+    def __init__(self, grid, row, col):
+        self.grid = grid
+        self.row = row
+        self.col = col
+        self.idx = row * grid.cols + col
+
+    @property
+    def x(self):
+        return self.col * self.grid.cell_size
+
+    @property
+    def y(self):
+        return self.row * self.grid.cell_size
+
+    @property
+    def wall(self):
+        return bool(self.grid.walls[self.idx])
+
+    @wall.setter
+    def wall(self, value):
+        grid = self.grid
+        value = 1 if value else 0
+        if grid.walls[self.idx] != value:
+            grid.walls[self.idx] = value
+            grid.wall_version += 1
+
+    start = _mark_flag(START)
+    finish = _mark_flag(FINISH)
+    in_queue = _state_flag(IN_QUEUE)
+    processed = _state_flag(PROCESSED)
+    is_path = _state_flag(PATH)
+    is_current = _state_flag(CURRENT)
+
+    @property
+    def distance(self):
+        d = self.grid.distance[self.idx]
+        return float('inf') if d == INF else d
+
+    @distance.setter
+    def distance(self, value):
+        self.grid.distance[self.idx] = INF if value == float('inf') else int(value)
+
+    @property
+    def prev(self):
+        p = self.grid.prev[self.idx]
+        return None if p < 0 else self.grid.node(p)
+
+    @prev.setter
+    def prev(self, node):
+        self.grid.prev[self.idx] = -1 if node is None else node.idx
+
+    def __eq__(self, other):
+        return isinstance(other, NodeView) and other.grid is self.grid and other.idx == self.idx
+
+    def __hash__(self):
+        return self.idx
+
+    def __lt__(self, other):
+        return self.distance < other.distance
+
+    def __repr__(self):
+        return "NodeView(%d, %d)" % (self.row, self.col)
+
+    def reset_search(self):
+        self.grid.state[self.idx] = 0
+        self.grid.distance[self.idx] = INF
+        self.grid.prev[self.idx] = -1
+
+# ---------------- GRID & HELPERS ----------------
+def create_grid(rows, cols, cell_size=0, node_cls=Node):
+    return [[node_cls(r, c, cell_size) for c in range(cols)] for r in range(rows)]
+
+def reset_grid_search(grid):
+    if isinstance(grid, CompactGrid):
+        grid.reset_search()
+        return
+    for row in grid:
+        for node in row:
+            node.reset_search()
+
+def get_neighbors(node, grid):
+    rows, cols = len(grid), len(grid[0])
+    res = []
+    for dr, dc in DIRECTIONS:
+        r, c = node.row + dr, node.col + dc
+        if 0 <= r < rows and 0 <= c < cols and not grid[r][c].wall:
+            res.append(grid[r][c])
+    return res
+
+def reconstruct_path(end):
+    path = []
+    cur = end
+    while cur:
+        path.append(cur)
+        cur = cur.prev
+    return path[::-1]
+
+def random_finish(grid, start, rng=random, dist=None):
+    """Startdan uzoqroq tasodifiy finish (eng uzoq 10 tadan biri).
+
+    ``dist`` berilsa (``distfield.DistanceField.dist`` kabi, indeks bo'yicha
+    yurish masofalari) uzoqlik haqiqiy yo'l bo'yicha o'lchanadi va yetib
+    bo'lmaydigan kataklar tashlab yuboriladi; aks holda to'g'ri chiziq bo'yicha.
+    """
+    rows, cols = len(grid), len(grid[0])
+    if dist is not None:
+        start_idx = start.row * cols + start.col
+        candidates = [(dist[r * cols + c], r * cols + c) for r in range(2, rows - 2) for c in range(2, cols - 2)
+                      if dist[r * cols + c] < INF and r * cols + c != start_idx]
+        if candidates:
+            idx = rng.choice(heapq.nlargest(10, candidates))[1]
+            return grid[idx // cols][idx % cols]
+        return grid[rows-2][cols-2]
+
+    valid_nodes = []
+    for r in range(rows):
+        for c in range(cols):
+            node = grid[r][c]
+            if not node.wall and node != start and r > 1 and r < rows - 2 and c > 1 and c < cols - 2:
+                dist = (node.row - start.row)**2 + (node.col - start.col)**2
+                valid_nodes.append((dist, node))
+
+    valid_nodes.sort(key=lambda x: x[0], reverse=True)
+    if valid_nodes:
+        return rng.choice(valid_nodes[:min(10, len(valid_nodes))])[1]
+
+    return grid[rows-2][cols-2]
+
+def clear_old_finish(grid):
+    for row in grid:
+        for node in row:
+            if node.finish:
+                node.finish = False
+                node.reset_search()
+                return node
+    return None
+
+# ---------------- MAZE GENERATION ----------------
+def generate_maze(grid, start, finish, rng=random):
+    rows, cols = len(grid), len(grid[0])
+    for r in range(rows):
+        for c in range(cols):
+            grid[r][c].wall = True
+
+    stack = [start]
+    start.wall = False
+    visited = {start}
+
+    while stack:
+        cur = stack[-1]
+        neighbors = []
+        for dr, dc in [(2,0), (-2,0), (0,2), (0,-2)]:
+            r, c = cur.row + dr, cur.col + dc
+            if 0 <= r < rows and 0 <= c < cols and grid[r][c] not in visited:
+                neighbors.append(grid[r][c])
+        if neighbors:
+            nxt = rng.choice(neighbors)
+            wall_r = cur.row + (nxt.row - cur.row)//2
+            wall_c = cur.col + (nxt.col - cur.col)//2
+            grid[wall_r][wall_c].wall = False
+            nxt.wall = False
+            visited.add(nxt)
+            stack.append(nxt)
+        else:
+            stack.pop()
+
+    start.wall = False
+    finish.wall = False
+
+def add_extra_paths(grid, count, rng=random):
+    rows, cols = len(grid), len(grid[0])
+    added = 0
+    tries = 0
+    while added < count and tries < count * 5:
+        r = rng.randint(1, rows-2)
+        c = rng.randint(1, cols-2)
+        node = grid[r][c]
+
+        if node.wall:
+            open_n = 0
+            for dr, dc in DIRECTIONS:
+                if 0 <= r+dr < rows and 0 <= c+dc < cols and not grid[r+dr][c+dc].wall:
+                    open_n += 1
+
+            if open_n == 1:
+                node.wall = False
+                added += 1
+            elif open_n == 0:
+                node.wall = False
+                added += 1
+            elif open_n >= 2 and rng.random() < 0.2:
+                node.wall = False
+                added += 1
+
+        tries += 1
+
+# ---------------- DIJKSTRA ----------------
+def new_stats():
+    return {"expanded": 0, "pushed": 0, "stale": 0, "path_length": 0, "time": 0.0}
+
+def dijkstra_steps(start, finish, grid, stats=None):
+    """Dijkstra'ni qadamma-qadam bajaradi.
+
+    Har bir pop'da ikki marta ``yield`` qiladi (joriy tugun belgilangan
+    holatda va qo'shnilar yangilangandan keyin), UI shu paytda chizishi
+    mumkin. Yakuniy yo'l ``StopIteration.value`` orqali qaytadi.
+    """
+    if stats is None:
+        stats = new_stats()
+
+    reset_grid_search(grid)
+
+    pq = []
+    start.distance = 0
+    heapq.heappush(pq, (0, start))
+    stats["pushed"] += 1
+
+    while pq:
+        _, cur = heapq.heappop(pq)
+
+        cur.is_current = True
+        yield cur
+        cur.is_current = False
+
+        if cur.processed:
+            stats["stale"] += 1
+            continue
+
+        cur.processed = True
+        stats["expanded"] += 1
+
+        if cur == finish:
+            return reconstruct_path(finish)
+
+        for nb in get_neighbors(cur, grid):
+            if nb.processed:
+                continue
+
+            nd = cur.distance + 1
+            if nd < nb.distance:
+                nb.distance = nd
+                nb.prev = cur
+                heapq.heappush(pq, (nb.distance, nb))
+                nb.in_queue = True
+                stats["pushed"] += 1
+
+        yield cur
+
+    return None
+
+def dijkstra(start, finish, grid):
+    """Sinxron Dijkstra: ``(path, stats)`` qaytaradi, hech narsa chizmaydi."""
+    stats = new_stats()
+    t0 = time.perf_counter()
+    steps = dijkstra_steps(start, finish, grid, stats)
+    path = None
+    try:
+        while True:
+            next(steps)
+    except StopIteration as stop:
+        path = stop.value
+    stats["time"] = time.perf_counter() - t0
+    if path:
+        stats["path_length"] = len(path)
+    return path, stats
@@ -0,0 +1,92 @@
+"""Ko'p agentli rejim (olomon): yuzlab-minglab agentlar bir vaqtda yuradi.
+
+Har bir agentning o'z starti va finishi bor, lekin finishlar ``goals`` ta
+umumiy nishondan olinadi. Har bir nishon uchun bitta masofa maydoni
+(``distfield.DistanceField``, nishondan BFS) hisoblanadi va uning
+``parent`` massivi har bir katakdan nishon tomon keyingi qadamni beradi.
+Shuning uchun agentlar yo'l saqlamaydi: ``N`` agent uchun ``goals`` ta
+qidiruv yetarli.
+
+Hamma agent bir xil tezlikda yuradi, shuning uchun katak ichidagi siljish
+(``t``) hammaga umumiy. Har tikda faqat ``t`` oshadi; ``t`` 1 dan
+o'tganda barcha agentlarning katagi bitta ro'yxat ifodasi bilan yangilanadi.
+
+    crowd = Crowd(grid, 1000, random.Random(seed), goals=8)
+    crowd.update(0.25)              # har tikda, kataklar/tik
+    for x, y, goal in crowd.positions(): ...
+"""
+import random
+from array import array
+
+import distfield
+from core import INF
+
+class Crowd:
+    def __init__(self, grid, count, rng=None, goals=8):
+        self.grid = grid
+        self.rng = rng or random.Random()
+        self.t = 0.0
+        self.steps = 0
+        free = [i for i in range(grid.rows * grid.cols) if not grid.walls[i]]
+        if not free:
+            raise ValueError("Gridda bo'sh katak yo'q")
+        self.targets = [self.rng.choice(free) for _ in range(max(1, min(goals, count)))]
+        self.fields = [distfield.DistanceField(grid, target) for target in self.targets]
+
+        # Har bir agent: nishon raqami va shu nishonga yetib boriladigan start
+        self.goal = array('i')
+        self.cur = array('i')
+        for i in range(count):
+            g = i % len(self.targets)
+            dist = self.fields[g].dist
+            start = self.rng.choice(free)
+            for _ in range(32):
+                if dist[start] < INF:
+                    break
+                start = self.rng.choice(free)
+            self.goal.append(g)
+            self.cur.append(start)
+        self.nxt = self.next_cells(self.cur)
+
+    def __len__(self):
+        return len(self.cur)
+
+    def next_cells(self, cells):
+        """Har bir agent uchun nishon tomon keyingi katak (yetgan bo'lsa o'zi)."""
+        parents = [field.parent for field in self.fields]
+        return array('i', [c if parents[g][c] < 0 else parents[g][c] for c, g in zip(cells, self.goal)])
+
+    def refresh(self):
+        """Devorlar o'zgargan bo'lsa maydonlarni qayta hisoblaydi."""
+        changed = False
+        for field in self.fields:
+            if not field.valid():
+                field.compute()
+                changed = True
+        if changed:
+            self.nxt = self.next_cells(self.cur)
+        return changed
+
+    def update(self, speed):
+        """Barcha agentlarni ``speed`` katak/tik tezlikda siljitadi (har tikda bir marta chaqiriladi)."""
+        self.t += speed
+        while self.t >= 1.0:
+            self.t -= 1.0
+            self.cur = self.nxt
+            self.nxt = self.next_cells(self.cur)
+            self.steps += 1
+
+    def arrived(self):
+        """Nishoniga yetgan agentlar soni."""
+        targets = self.targets
+        return sum(1 for c, g in zip(self.cur, self.goal) if c == targets[g])
+
+    def positions(self, cell_size=1):
+        """Har bir agent uchun ``(x, y, nishon)``; x/y katak markazi, piksellarda."""
+        cols = self.grid.cols
+        t = self.t
+        half = cell_size / 2
+        for a, b, g in zip(self.cur, self.nxt, self.goal):
+            ar, ac = divmod(a, cols)
+            br, bc = divmod(b, cols)
+            yield ((ac + (bc - ac) * t) * cell_size + half, (ar + (br - ar) * t) * cell_size + half, g)
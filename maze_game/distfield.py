@@ -0,0 +1,148 @@
+"""Bitta manbadan masofa maydoni (BFS) va uning keshi.
+
+``DistanceField`` manbadan (odatda start) barcha kataklargacha bo'lgan
+yurish masofasini va orqaga ko'rsatkichlarni bir marta BFS bilan
+hisoblaydi. Shundan keyin istalgan finishga yo'l ``O(yo'l uzunligi)`` da,
+masofa esa ``O(1)`` da olinadi; bir nechta nishon uchun ham shunday.
+
+    fields = FieldCache()
+    field = fields.get(grid, start.idx)   # devorlar o'zgarmagan bo'lsa keshdan
+    field.path_to(finish.idx), field.nearest(targets)
+
+Maydon ``grid.walls`` bufer identifikatori va ``grid.wall_version`` bilan
+bog'langan: devor chizilganda kesh o'zi eskiradi va keyingi so'rovda
+qayta hisoblanadi.
+"""
+import time
+from array import array
+from collections import OrderedDict
+
+import core
+from core import INF
+
+class DistanceField:
+    def __init__(self, grid, source):
+        self.grid = grid
+        self.source = source
+        self.stats = core.new_stats()
+        self.compute()
+
+    def compute(self):
+        """BFS to'lqini; ``dist`` va ``parent`` buferlarini qaytadan to'ldiradi."""
+        t0 = time.perf_counter()
+        grid = self.grid
+        walls, rows, cols = grid.walls, grid.rows, grid.cols
+        n = rows * cols
+        dist = array('i', [INF]) * n
+        parent = array('i', [-1]) * n
+        self.walls_id = id(walls)
+        self.version = grid.wall_version
+        self.dist = dist
+        self.parent = parent
+
+        source = self.source
+        if walls[source]:
+            return
+        dist[source] = 0
+        frontier = [source]
+        last_row = n - cols
+        d = 0
+        reached = 1
+        while frontier:
+            d += 1
+            nxt = []
+            push = nxt.append
+            # Qo'shnilar tartibi solvers.open_neighbors bilan bir xil
+            for u in frontier:
+                c = u % cols
+                if u < last_row:
+                    v = u + cols
+                    if not walls[v] and dist[v] == INF:
+                        dist[v] = d; parent[v] = u; push(v)
+                if u >= cols:
+                    v = u - cols
+                    if not walls[v] and dist[v] == INF:
+                        dist[v] = d; parent[v] = u; push(v)
+                if c < cols - 1:
+                    v = u + 1
+                    if not walls[v] and dist[v] == INF:
+                        dist[v] = d; parent[v] = u; push(v)
+                if c > 0:
+                    v = u - 1
+                    if not walls[v] and dist[v] == INF:
+                        dist[v] = d; parent[v] = u; push(v)
+            reached += len(nxt)
+            frontier = nxt
+
+        self.stats["expanded"] = reached
+        self.stats["pushed"] = reached
+        self.stats["time"] = time.perf_counter() - t0
+
+    def valid(self):
+        """Devorlar hisoblangandan beri o'zgarmaganmi."""
+        grid = self.grid
+        return id(grid.walls) == self.walls_id and grid.wall_version == self.version
+
+    def distance(self, target):
+        """Yurish masofasi yoki yetib bo'lmasa ``INF``."""
+        return self.dist[target]
+
+    def path_to(self, target):
+        """Manbadan ``target`` gacha yo'l (indekslar) yoki None; ``O(yo'l uzunligi)``."""
+        if self.dist[target] == INF:
+            return None
+        parent = self.parent
+        path = []
+        cur = target
+        while cur != -1:
+            path.append(cur)
+            cur = parent[cur]
+        path.reverse()
+        return path
+
+    def nearest(self, targets):
+        """Eng yaqin yetib boriladigan nishon: ``(indeks, masofa)`` yoki None."""
+        dist = self.dist
+        best = min(targets, key=dist.__getitem__, default=None)
+        if best is None or dist[best] == INF:
+            return None
+        return best, dist[best]
+
+    def paths_to(self, targets):
+        """Har bir nishonga yo'l: ``{indeks: yo'l yoki None}``."""
+        return {target: self.path_to(target) for target in targets}
+
+class FieldCache:
+    """Manba bo'yicha ``DistanceField`` lar (LRU); eskirganlari qayta hisoblanadi."""
+
+    def __init__(self, maxsize=4):
+        self.maxsize = maxsize
+        self.fields = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, grid, source):
+        key = (id(grid), source)
+        field = self.fields.get(key)
+        if field is not None and field.grid is grid and field.valid():
+            self.fields.move_to_end(key)
+            self.hits += 1
+            return field
+
+        self.misses += 1
+        if field is not None and field.grid is grid:
+            field.compute()
+        else:
+            field = DistanceField(grid, source)
+        self.fields[key] = field
+        self.fields.move_to_end(key)
+        while len(self.fields) > self.maxsize:
+            self.fields.popitem(last=False)
+        return field
+
+    def distance(self, grid, a, b):
+        """``a`` va ``b`` orasidagi yurish masofasi (``a`` maydoni keshlanadi)."""
+        return self.get(grid, a).distance(b)
+
+    def clear(self):
+        self.fields.clear()
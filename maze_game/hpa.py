@@ -0,0 +1,285 @@
+"""Ierarxik yo'l qidirish (HPA*) katta xaritalar uchun.
+
+Grid ``cluster_size`` x ``cluster_size`` bloklarga (klasterlarga) bo'linadi.
+Qo'shni klasterlar chegarasidagi ochiq juftliklardan "kirish" tugunlari
+olinadi va har bir klaster ichida ular orasidagi masofalar oldindan BFS
+bilan hisoblanadi. So'rov shu kichik abstrakt graf ustida A* bilan
+bajariladi, keyin har bir bo'lak klaster ichida katakma-katakka ochiladi.
+
+    graph = hpa.graph_for(grid)           # grid bo'yicha keshlanadi
+    path = graph.path(start_idx, goal_idx)
+    ...
+    grid.walls[idx] = 1
+    hpa.update_walls(grid, [idx])         # faqat ta'sirlangan klasterlar
+
+Solver sifatida ``solvers.HPAStar`` ("hpa") shu grafdan foydalanadi.
+
+Yo'l optimalga yaqin, lekin har doim ham eng qisqa emas: klasterdan
+chiqish faqat kirish tugunlari orqali bo'ladi.
+"""
+import heapq
+import time
+from collections import OrderedDict, defaultdict, deque
+
+import core
+from core import INF
+from solvers import manhattan
+
+CLUSTER_SIZE = 16
+# Shundan uzun ochiq chegara bo'lagida ikkita kirish (ikki uchida), aks holda bitta (o'rtada)
+MAX_SINGLE_ENTRANCE = 6
+
+class HPAGraph:
+    def __init__(self, grid, cluster_size=CLUSTER_SIZE):
+        self.grid = grid
+        self.size = cluster_size
+        self.build()
+
+    def build(self):
+        t0 = time.perf_counter()
+        grid, size = self.grid, self.size
+        self.crows = (grid.rows + size - 1) // size
+        self.ccols = (grid.cols + size - 1) // size
+        self.borders = {}                # (klaster, "right"/"down") -> [(a, b), ...]
+        self.inter = defaultdict(set)    # klasterlar orasidagi qirralar (narxi 1)
+        self.intra = {}                  # tugun -> {shu klasterdagi tugun: masofa}
+        self.members = {}                # klaster -> tugunlar
+        for cid in range(self.crows * self.ccols):
+            self.set_borders(cid)
+        for cid in range(self.crows * self.ccols):
+            self.connect_cluster(cid)
+        self.version = (id(grid.walls), grid.wall_version)
+        self.build_time = time.perf_counter() - t0
+
+    # ---------------- KLASTERLAR ----------------
+    def cluster_of(self, idx):
+        cols = self.grid.cols
+        return (idx // cols // self.size) * self.ccols + idx % cols // self.size
+
+    def bounds(self, cid):
+        """Klaster to'rtburchagi: (r0, r1, c0, c1), oxirgilari kirmaydi."""
+        grid, size = self.grid, self.size
+        ci, cj = divmod(cid, self.ccols)
+        return ci * size, min((ci + 1) * size, grid.rows), cj * size, min((cj + 1) * size, grid.cols)
+
+    def _entrances(self, pairs):
+        """Chegara bo'ylab ochiq juftliklar qatoridan kirishlarni tanlaydi."""
+        walls = self.grid.walls
+        result = []
+        run = []
+        for a, b in pairs + [(None, None)]:
+            if a is not None and not walls[a] and not walls[b]:
+                run.append((a, b))
+                continue
+            if len(run) >= MAX_SINGLE_ENTRANCE:
+                result += [run[0], run[-1]]
+            elif run:
+                result.append(run[len(run) // 2])
+            run = []
+        return result
+
+    def set_borders(self, cid):
+        """``cid`` ning o'ng va pastki chegaralaridagi kirishlarni qayta hisoblaydi."""
+        cols = self.grid.cols
+        r0, r1, c0, c1 = self.bounds(cid)
+        ci, cj = divmod(cid, self.ccols)
+        for side in ("right", "down"):
+            for a, b in self.borders.pop((cid, side), ()):
+                self.inter[a].discard(b)
+                self.inter[b].discard(a)
+            if side == "right" and cj + 1 < self.ccols:
+                pairs = [(r * cols + c1 - 1, r * cols + c1) for r in range(r0, r1)]
+            elif side == "down" and ci + 1 < self.crows:
+                pairs = [((r1 - 1) * cols + c, r1 * cols + c) for c in range(c0, c1)]
+            else:
+                continue
+            entrances = self._entrances(pairs)
+            self.borders[(cid, side)] = entrances
+            for a, b in entrances:
+                self.inter[a].add(b)
+                self.inter[b].add(a)
+
+    def cluster_nodes(self, cid):
+        ci, cj = divmod(cid, self.ccols)
+        nodes = set()
+        for a, _ in self.borders.get((cid, "right"), ()):
+            nodes.add(a)
+        for a, _ in self.borders.get((cid, "down"), ()):
+            nodes.add(a)
+        if cj > 0:
+            nodes.update(b for _, b in self.borders.get((cid - 1, "right"), ()))
+        if ci > 0:
+            nodes.update(b for _, b in self.borders.get((cid - self.ccols, "down"), ()))
+        return nodes
+
+    def local_bfs(self, src, cid, targets=None):
+        """Klaster ichida ``src`` dan BFS: ``(dist, parent)`` lug'atlari."""
+        grid = self.grid
+        walls, cols = grid.walls, grid.cols
+        r0, r1, c0, c1 = self.bounds(cid)
+        dist = {src: 0}
+        parent = {src: -1}
+        remaining = len(targets) if targets else -1
+        queue = deque([src])
+        while queue and remaining:
+            cur = queue.popleft()
+            if targets and cur in targets:
+                remaining -= 1
+            r, c = divmod(cur, cols)
+            nd = dist[cur] + 1
+            for nb, ok in ((cur + cols, r + 1 < r1), (cur - cols, r > r0),
+                           (cur + 1, c + 1 < c1), (cur - 1, c > c0)):
+                if ok and nb not in dist and not walls[nb]:
+                    dist[nb] = nd
+                    parent[nb] = cur
+                    queue.append(nb)
+        return dist, parent
+
+    def connect_cluster(self, cid):
+        """Klaster ichidagi kirishlar orasidagi masofalarni hisoblaydi."""
+        for node in self.members.get(cid, ()):
+            self.intra.pop(node, None)
+        nodes = self.cluster_nodes(cid)
+        self.members[cid] = nodes
+        for node in nodes:
+            dist, _ = self.local_bfs(node, cid, nodes)
+            self.intra[node] = {other: dist[other] for other in nodes if other != node and other in dist}
+
+    def update_cells(self, cells):
+        """Devori o'zgargan kataklar: faqat ular tegib turgan klasterlar qayta hisoblanadi."""
+        ccols = self.ccols
+        touched = set()
+        for idx in cells:
+            cid = self.cluster_of(idx)
+            touched.add(cid)
+            # Chap/yuqori qo'shnining o'ng/pastki chegarasi ham shu katakka tegadi
+            ci, cj = divmod(cid, ccols)
+            if cj > 0: touched.add(cid - 1)
+            if ci > 0: touched.add(cid - ccols)
+        for cid in touched:
+            self.set_borders(cid)
+        dirty = set()
+        for cid in touched:
+            ci, cj = divmod(cid, ccols)
+            dirty.add(cid)
+            if cj + 1 < ccols: dirty.add(cid + 1)
+            if ci + 1 < self.crows: dirty.add(cid + ccols)
+        for cid in dirty:
+            self.connect_cluster(cid)
+        self.version = (id(self.grid.walls), self.grid.wall_version)
+        return dirty
+
+    def valid(self):
+        return self.version == (id(self.grid.walls), self.grid.wall_version)
+
+    # ---------------- SO'ROV ----------------
+    def abstract_steps(self, start, goal, stats):
+        """Abstrakt graf ustida A*; kengaytirilgan tugunlarni ``yield`` qiladi.
+
+        Abstrakt yo'l (yoki None) generatorning qaytish qiymati (``StopIteration.value``).
+        """
+        grid = self.grid
+        walls, state, cols = grid.walls, grid.state, grid.cols
+        if walls[start] or walls[goal]:
+            return None
+        # Start va goal vaqtincha o'z klasterlaridagi kirishlarga ulanadi
+        s_cid, g_cid = self.cluster_of(start), self.cluster_of(goal)
+        dist, _ = self.local_bfs(start, s_cid)
+        start_edges = {n: dist[n] for n in self.members[s_cid] if n in dist}
+        if s_cid == g_cid and goal in dist:
+            start_edges[goal] = dist[goal]
+        dist, _ = self.local_bfs(goal, g_cid)
+        goal_edges = {n: dist[n] for n in self.members[g_cid] if n in dist}
+
+        intra, inter = self.intra, self.inter
+        g = {start: 0}
+        parent = {start: -1}
+        closed = set()
+        h0 = manhattan(start, goal, cols)
+        pq = [(h0, h0, start)]
+        stats["pushed"] += 1
+        while pq:
+            _, _, cur = heapq.heappop(pq)
+            if cur in closed:
+                stats["stale"] += 1
+                continue
+            closed.add(cur)
+            state[cur] |= core.PROCESSED
+            stats["expanded"] += 1
+            yield cur
+            if cur == goal:
+                path = []
+                while cur != -1:
+                    path.append(cur)
+                    cur = parent[cur]
+                return path[::-1]
+
+            edges = list(intra.get(cur, {}).items())
+            edges += [(nb, 1) for nb in inter.get(cur, ())]
+            if cur == start:
+                edges += start_edges.items()
+            if cur in goal_edges:
+                edges.append((goal, goal_edges[cur]))
+            for nb, cost in edges:
+                if nb in closed:
+                    continue
+                nd = g[cur] + cost
+                if nd < g.get(nb, INF):
+                    g[nb] = nd
+                    parent[nb] = cur
+                    h = manhattan(nb, goal, cols)
+                    heapq.heappush(pq, (nd + h, h, nb))
+                    stats["pushed"] += 1
+        return None
+
+    def refine(self, abstract):
+        """Abstrakt yo'lni katakma-katak yo'lga ochadi."""
+        path = [abstract[0]]
+        for a, b in zip(abstract, abstract[1:]):
+            if b in self.inter.get(a, ()):
+                path.append(b)
+                continue
+            # a va b bitta klasterda (intra qirra yoki start/goal ulanishi)
+            _, parent = self.local_bfs(a, self.cluster_of(a), {b})
+            segment = []
+            cur = b
+            while cur != a:
+                segment.append(cur)
+                cur = parent[cur]
+            path += segment[::-1]
+        return path
+
+    def path(self, start, goal, stats=None):
+        """``start`` dan ``goal`` gacha kataklar yo'li (indekslar) yoki None."""
+        steps = self.abstract_steps(start, goal, stats if stats is not None else core.new_stats())
+        abstract = None
+        try:
+            while True:
+                next(steps)
+        except StopIteration as stop:
+            abstract = stop.value
+        return self.refine(abstract) if abstract else None
+
+# ---------------- KESH ----------------
+GRAPHS = OrderedDict()
+GRAPHS_SIZE = 2
+
+def graph_for(grid, cluster_size=CLUSTER_SIZE):
+    """Grid uchun keshlangan graf; devorlar xabarsiz o'zgargan bo'lsa qayta quriladi."""
+    key = id(grid)
+    graph = GRAPHS.get(key)
+    if graph is None or graph.grid is not grid or graph.size != cluster_size:
+        graph = HPAGraph(grid, cluster_size)
+        GRAPHS[key] = graph
+    elif not graph.valid():
+        graph.build()
+    GRAPHS.move_to_end(key)
+    while len(GRAPHS) > GRAPHS_SIZE:
+        GRAPHS.popitem(last=False)
+    return graph
+
+def update_walls(grid, cells):
+    """Devor chizilganda chaqiriladi; graf hali qurilmagan bo'lsa hech narsa qilmaydi."""
+    graph = GRAPHS.get(id(grid))
+    if graph is not None and graph.grid is grid:
+        graph.update_cells(cells)
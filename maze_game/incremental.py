@@ -0,0 +1,146 @@
+"""Inkremental yo'l tuzatish (D* Lite).
+
+Devorlar o'zgarganda qidiruvni noldan boshlamasdan, faqat ta'sirlangan
+kataklar qayta hisoblanadi. Qidiruv finishdan start tomonga olib boriladi,
+shuning uchun start (player joylashuvi) harakatlanishi ham arzon.
+
+    planner = DStarLite(grid, start_idx, finish_idx)
+    planner.compute()
+    path = planner.path()
+    ...
+    grid.walls[idx] = 1
+    planner.update_cells([idx])
+    planner.move_start(player_idx)
+    planner.compute()
+    path = planner.path()
+"""
+import heapq
+from array import array
+
+import core
+from core import INF
+from solvers import open_neighbors
+
+class DStarLite:
+    def __init__(self, grid, start, goal):
+        self.grid = grid
+        self.start = start
+        self.goal = goal
+        self.last = start
+        self.km = 0
+        n = grid.rows * grid.cols
+        self.g = array('i', [INF]) * n
+        self.rhs = array('i', [INF]) * n
+        self.open = {}
+        self.heap = []
+        self.stats = core.new_stats()
+
+        self.rhs[goal] = 0
+        self._push(goal, (self.h(start, goal), 0))
+
+    def h(self, a, b):
+        cols = self.grid.cols
+        return abs(a // cols - b // cols) + abs(a % cols - b % cols)
+
+    def key(self, s):
+        m = min(self.g[s], self.rhs[s])
+        return (m + self.h(self.start, s) + self.km, m)
+
+    def _push(self, s, key):
+        self.open[s] = key
+        heapq.heappush(self.heap, (key[0], key[1], s))
+        self.stats["pushed"] += 1
+
+    def _top(self):
+        heap, open_ = self.heap, self.open
+        while heap:
+            k1, k2, s = heap[0]
+            if open_.get(s) == (k1, k2):
+                return (k1, k2), s
+            heapq.heappop(heap)
+            self.stats["stale"] += 1
+        return None
+
+    def update_vertex(self, s):
+        grid = self.grid
+        if s != self.goal:
+            best = INF
+            if not grid.walls[s]:
+                g = self.g
+                for nb in open_neighbors(grid.walls, grid.rows, grid.cols, s):
+                    if g[nb] + 1 < best:
+                        best = g[nb] + 1
+            self.rhs[s] = best
+        self.open.pop(s, None)
+        if self.g[s] != self.rhs[s]:
+            self._push(s, self.key(s))
+
+    def update_cells(self, cells):
+        """``walls`` dagi qiymati o'zgargan kataklar haqida xabar beradi."""
+        grid = self.grid
+        rows, cols = grid.rows, grid.cols
+        # Start siljigan bo'lsa, navbatdagi kalitlar km orqali to'g'rilanadi
+        self.km += self.h(self.last, self.start)
+        self.last = self.start
+        for idx in cells:
+            self.update_vertex(idx)
+            c = idx % cols
+            if idx >= cols: self.update_vertex(idx - cols)
+            if idx + cols < rows * cols: self.update_vertex(idx + cols)
+            if c > 0: self.update_vertex(idx - 1)
+            if c < cols - 1: self.update_vertex(idx + 1)
+
+    def move_start(self, start):
+        self.start = start
+
+    def compute(self):
+        """Start uchun eng qisqa masofani tiklaydi; kengaytirilgan tugunlar sonini qaytaradi."""
+        grid = self.grid
+        walls, rows, cols = grid.walls, grid.rows, grid.cols
+        g, rhs, open_ = self.g, self.rhs, self.open
+        expanded = 0
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            k_old, u = top
+            start = self.start
+            if not (k_old < self.key(start) or rhs[start] != g[start]):
+                break
+            k_new = self.key(u)
+            if k_old < k_new:
+                self._push(u, k_new)
+            elif g[u] > rhs[u]:
+                g[u] = rhs[u]
+                del open_[u]
+                expanded += 1
+                for nb in open_neighbors(walls, rows, cols, u):
+                    self.update_vertex(nb)
+            else:
+                g[u] = INF
+                expanded += 1
+                for nb in open_neighbors(walls, rows, cols, u):
+                    self.update_vertex(nb)
+                self.update_vertex(u)
+        self.stats["expanded"] += expanded
+        return expanded
+
+    def path(self):
+        """Startdan finishgacha yo'l (indekslar) yoki yo'l bo'lmasa None."""
+        grid = self.grid
+        walls, rows, cols = grid.walls, grid.rows, grid.cols
+        g, cur = self.g, self.start
+        if g[cur] >= INF:
+            return None
+        path = [cur]
+        while cur != self.goal:
+            best, nxt = INF, -1
+            for nb in open_neighbors(walls, rows, cols, cur):
+                if g[nb] < best:
+                    best, nxt = g[nb], nb
+            if nxt == -1 or best >= g[cur]:
+                return None
+            cur = nxt
+            path.append(cur)
+        self.stats["path_length"] = len(path)
+        return path
@@ -1,17 +1,23 @@
 import pygame
-import heapq
 import math
 import random
 import asyncio
 import os
 import sys 
+import time
+from collections import OrderedDict
 
-# ---------------- QIYINCHILIK DARALARI CONFIG ----------------
-LEVELS = {
-    "Easy": {"ROWS": 15, "COLS": 15, "CELL_SIZE": 800 // 15, "EXTRA_PATHS": 100},
-    "Medium": {"ROWS": 25, "COLS": 25, "CELL_SIZE": 800 // 25, "EXTRA_PATHS": 70},
-    "Hard": {"ROWS": 40, "COLS": 40, "CELL_SIZE": 800 // 40, "EXTRA_PATHS": 30},
-}
+import core
+import crowd
+import mazefile
+import mazegen
+import profiler
+import sim
+import solvecache
+import solvers
+from core import LEVELS
+
+STARTUP_TIME = time.perf_counter() # birinchi kadrgacha vaqt shundan o'lchanadi
 
 # --- GLOBAL O'ZGARUVCHILAR ---
 WIDTH, HEIGHT = 800, 800 # Oyna o'lchami
@@ -20,7 +26,41 @@ CURRENT_LEVEL = "Medium"
 ROWS = LEVELS[CURRENT_LEVEL]["ROWS"]
 COLS = LEVELS[CURRENT_LEVEL]["COLS"]
 CELL_SIZE = LEVELS[CURRENT_LEVEL]["CELL_SIZE"]
-VISUALIZATION_DELAY_SEC = 0.005
+# Qidiruv animatsiyasi: har tikda nechta tugun kengaytiriladi (vaqt byudjetisiz,
+# shuning uchun yozuvni qayta ijro etish aynan bir xil). INSTANT_SEARCH da animatsiya yo'q.
+SEARCH_STEPS_PER_FRAME = sim.SEARCH_STEPS_PER_TICK
+INSTANT_SEARCH = False
+# Brauzerda (pygbag, WASM Python) yengil profil: kadr tezligi pastroq, har await
+# oralig'ida ko'proq tik (qidiruv qadamlari) bajariladi va arzon chizish ishlatiladi
+WEB = sys.platform == "emscripten"
+FPS = 30 if WEB else 60
+# Arzon chizish: devorlar rasm o'rniga rang, gradient fon, katak chegaralari va
+# finish pulsatsiyasi yo'q (wall.png yuklanmaydi, webbuild.py uni bundle'ga qo'shmaydi)
+CHEAP_RENDER = WEB
+# Shuncha soniyada bir marta konsolga FPS chiqariladi (0 - chiqarilmaydi)
+FPS_REPORT_SEC = 5 if WEB else 0
+# O'yin sim.TICK_RATE tik/s bilan yuradi; sekin kadrda ko'pi bilan shuncha tik quviladi
+MAX_TICKS_PER_FRAME = 8 if WEB else 4
+# Labirint generatori (mazegen.GENERATORS dan biri, G tugmasi) va seed.
+# MAZE_SEED None bo'lsa har safar yangi seed tanlanadi va konsolga chiqariladi.
+MAZE_ALGORITHM = "backtracker"
+MAZE_SEED = None
+# Yo'l topilgandan keyin devor chizilsa, yo'l D* Lite bilan joyida tuzatiladi
+INCREMENTAL_REPAIR = True
+ALGORITHM = "dijkstra" # solvers.SOLVERS dan biri, A tugmasi bilan almashtiriladi
+MAZE_FILE = "maze.bin" # S - saqlash, O - ochish (mazefile formati)
+# Olomon rejimi (C tugmasi): agentlar soni, umumiy nishonlar soni va tezlik (katak/tik)
+CROWD_SIZE = 500
+CROWD_GOALS = 8
+CROWD_SPEED = 0.25 # sim.TICK_RATE=60 da soniyasiga 15 katak
+# P tugmasi: profil paneli va har kadr vaqtlarini shu faylga yozish (aylanuvchi log)
+PROFILE_LOG = "profile.log"
+# Sessiya kiritishlari (seed, devor chizish, SPACE, ...) chiqishda shu faylga yoziladi:
+# python sim.py session.rec - qayta ijro
+RECORD_FILE = "session.rec"
+# Sichqoncha bilan nima chiziladi: devor yoki relyef (T tugmasi bilan almashtiriladi)
+BRUSHES = ("wall", "road", "mud", "water")
+BRUSH = "wall"
 
 # Colors
 WHITE = (255, 255, 255)
@@ -29,7 +69,13 @@ BLACK = (30, 30, 30)
 PURPLE = (128, 0, 128)
 ORANGE = (255, 165, 0)
 GREEN = (0, 200, 0)
+YELLOW = (255, 220, 0)
 PATH_COLOR = (0, 120, 255)
+# Relyef ranglari (core.ROAD, core.MUD, core.WATER); oddiy yer - WHITE
+TERRAIN_COLORS = {core.ROAD: (215, 200, 160), core.MUD: (140, 100, 60), core.WATER: (110, 170, 235)}
+# Olomon agentlari nishoni bo'yicha bo'yaladi
+CROWD_COLORS = [(230, 60, 60), (60, 160, 230), (250, 160, 30), (150, 80, 220),
+                (40, 180, 120), (240, 90, 200), (120, 120, 120), (200, 200, 40)]
 
 # Gradient uchun ranglar
 BG_COLOR_TOP = (150, 200, 255) # Osmonsimon ko'k
@@ -38,51 +84,130 @@ BG_COLOR_BOTTOM = (200, 255, 200) # Yashilsimon
 # --- GLOBAL PYGAME OBYEKTLARINI E'LON QILISH ---
 pygame.init() 
 WIN = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Dijkstra – Maze Game (SPACE/R/L keys)")
+pygame.display.set_caption("Dijkstra – Maze Game (SPACE/R/L/A/G/I/D/S/O/C/P/T keys)")
 CLOCK = pygame.time.Clock()
 
 # ---------------- LOAD ASSETS ----------------
+ASSETS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+SPRITE_CACHE_SIZE = 128
+
+class SpriteCache:
+    """(asset, o'lcham) bo'yicha masshtablangan rasmlar uchun LRU kesh.
+
+    Asl rasmlar diskdan bir marta o'qiladi, masshtablangan nusxalar esa
+    chegaralangan keshda saqlanadi va level almashganda tozalanadi.
+    """
+
+    def __init__(self, max_size=SPRITE_CACHE_SIZE):
+        self.max_size = max_size
+        self.sources = {}
+        self.items = OrderedDict()
+
+    def source(self, filename):
+        img = self.sources.get(filename)
+        if img is None:
+            try:
+                img = pygame.image.load(os.path.join(ASSETS_PATH, filename))
+            except Exception:
+                img = pygame.Surface((1, 1))
+                if 'wall' in filename:
+                    img.fill(BLACK)
+                elif 'player' in filename:
+                    img.fill(YELLOW)
+                elif 'finish' in filename:
+                    img.fill((255, 0, 0))
+            self.sources[filename] = img
+        return img
+
+    def get(self, filename, size):
+        key = (filename, size)
+        img = self.items.get(key)
+        if img is not None:
+            self.items.move_to_end(key)
+            return img
+        img = pygame.transform.scale(self.source(filename), (size, size))
+        self.items[key] = img
+        if len(self.items) > self.max_size:
+            self.items.popitem(last=False)
+        return img
+
+    def clear(self):
+        self.items.clear()
+
+SPRITES = SpriteCache()
+
 def load_image(filename, is_wall=False):
-    try:
-        current_dir = os.path.dirname(os.path.abspath(__file__)) 
-        ASSETS_PATH = os.path.join(current_dir, "assets")
-        
-        target_size = int(CELL_SIZE * 1.1) if is_wall else CELL_SIZE
-        
-        img = pygame.image.load(os.path.join(ASSETS_PATH, filename))
-        return pygame.transform.scale(img, (target_size, target_size))
-        
-    except Exception:
-        surf = pygame.Surface((CELL_SIZE, CELL_SIZE))
-        if is_wall:
-            surf.fill(BLACK)
-            return pygame.transform.scale(surf, (int(CELL_SIZE * 1.1), int(CELL_SIZE * 1.1)))
-        elif 'player' in filename:
-            surf.fill(YELLOW)
-        elif 'finish' in filename:
-            surf.fill((255, 0, 0))
-        return surf
+    target_size = int(CELL_SIZE * 1.1) if is_wall else CELL_SIZE
+    return SPRITES.get(filename, target_size)
 
 # Rasmlarni yuklashda doimo yangi CELL_SIZE ga moslash
 def load_all_assets():
-    global WALL_IMG, PLAYER_BASE_IMG, FINISH_BASE_IMG
-    WALL_IMG = load_image("wall.png", is_wall=True)
+    global WALL_IMG, PLAYER_BASE_IMG, FINISH_BASE_IMG, FINISH_PULSE_FRAMES
+    SPRITES.clear()
     PLAYER_BASE_IMG = load_image("player.png")
     FINISH_BASE_IMG = load_image("finish.png")
+    if CHEAP_RENDER:
+        # Arzon chizishda devor rasmi va pulsatsiya kadrlari kerak emas
+        WALL_IMG = None
+        FINISH_PULSE_FRAMES = [FINISH_BASE_IMG]
+        return
+    WALL_IMG = load_image("wall.png", is_wall=True)
+    # Finish pulsatsiyasi CELL_SIZE..1.5*CELL_SIZE oralig'ida: har bir butun
+    # o'lcham uchun bitta kadr oldindan tayyorlanadi
+    FINISH_PULSE_FRAMES = [SPRITES.get("finish.png", size)
+                           for size in range(CELL_SIZE, int(CELL_SIZE * 1.5) + 1)]
+
+def finish_pulse_frame():
+    """Joriy vaqt uchun finish rasmi va uning katakdan chiqib turishi."""
+    if CHEAP_RENDER:
+        return FINISH_BASE_IMG, 0
+    t = pygame.time.get_ticks()
+    pulse_factor = 1 + 0.5 * abs(math.sin(t * 0.005))
+    pulse_size = int(CELL_SIZE * pulse_factor)
+    return FINISH_PULSE_FRAMES[pulse_size - CELL_SIZE], (pulse_size - CELL_SIZE) // 2
+
+def wall_overhang():
+    """Devor rasmi katakdan har tomonga necha piksel chiqib turadi."""
+    return 0 if WALL_IMG is None else (WALL_IMG.get_width() - CELL_SIZE) // 2
 
-load_all_assets() # Boshlang'ich yuklash
+if not WEB:
+    load_all_assets() # Boshlang'ich yuklash (brauzerda main() dagi birinchi update_global_level da)
 
 
 # ---------------- UTILS ----------------
 
+FONTS = {}
+
+def get_font(size):
+    """Standart shrift (har o'lcham bir marta yaratiladi)."""
+    font = FONTS.get(size)
+    if font is None:
+        font = FONTS[size] = pygame.font.Font(None, size)
+    return font
+
+GRADIENT_CACHE = {}
+
+def gradient_surface(size, color1, color2):
+    """Vertikal gradient sirtini o'lcham va ranglar bo'yicha bir marta yaratadi."""
+    key = (size, color1, color2)
+    surf = GRADIENT_CACHE.get(key)
+    if surf is None:
+        width, height = size
+        # Har bir qator bitta rangda: 1 piksel enli ustunni chizib,
+        # keyin uni kenglik bo'yicha cho'zamiz
+        column = pygame.Surface((1, height))
+        for y in range(height):
+            r = color1[0] + (color2[0] - color1[0]) * y // height
+            g = color1[1] + (color2[1] - color1[1]) * y // height
+            b = color1[2] + (color2[2] - color1[2]) * y // height
+            column.set_at((0, y), (r, g, b))
+        surf = pygame.transform.scale(column, (width, height))
+        GRADIENT_CACHE[key] = surf
+    return surf
+
 def draw_gradient(win, color1, color2):
-    """Vertikal gradient fonni chizadi."""
-    height = win.get_height()
-    for y in range(height):
-        r = color1[0] + (color2[0] - color1[0]) * y // height
-        g = color1[1] + (color2[1] - color1[1]) * y // height
-        b = color1[2] + (color2[2] - color1[2]) * y // height
-        pygame.draw.line(win, (r, g, b), (0, y), (WIDTH, y))
+    """Vertikal gradient fonni chizadi (keshdagi sirtni blit qiladi)."""
+    win.blit(gradient_surface(win.get_size(), color1, color2), (0, 0))
 
 # ---------------- UI CLASS ----------------
 class Button:
@@ -91,7 +216,7 @@ class Button:
         self.text = text
         self.color = color
         self.action = action
-        self.font = pygame.font.Font(None, 30)
+        self.font = get_font(30)
 
     def draw(self, win):
         pygame.draw.rect(win, self.color, self.rect, border_radius=5)
@@ -102,6 +227,53 @@ class Button:
     def is_clicked(self, pos):
         return self.rect.collidepoint(pos)
 
+class ProfileOverlay:
+    """Profiler o'rtachalarini yuqori chap burchakda ko'rsatadi.
+
+    ``Button`` kabi ``rect`` va ``draw(win)`` ga ega, shuning uchun renderer
+    uni tugmalar bilan birga sprite sifatida chizadi. Matn har kadrda emas,
+    ``REFRESH_MS`` da bir marta qayta chiziladi.
+    """
+    REFRESH_MS = 250
+
+    def __init__(self, prof):
+        self.prof = prof
+        self.font = get_font(20)
+        self.rect = pygame.Rect(5, 5, 0, 0)
+        self.surface = None
+        self.updated = 0
+
+    def render(self):
+        s = self.prof.summary()
+        sections = profiler.SECTIONS
+        lines = [
+            f"FPS {s['fps']:.1f}   kadr {s['total_ms']:.2f} ms",
+            "  ".join(f"{name} {s[name]:.2f}" for name in sections[:4]),
+            "  ".join(f"{name} {s[name]:.2f}" for name in sections[4:]),
+            f"pushed {s['pushed']}  pops {s['expanded'] + s['stale']}  stale {s['stale']}",
+        ]
+        cache = s.get("cache")
+        if cache:
+            lines.append(f"kesh hit {cache['hit_rate']:.0%} ({cache['hits']}/{cache['hits'] + cache['misses']})  "
+                         f"{cache['entries']} ta  {cache['bytes'] / 1024:.1f} KiB")
+        texts = [self.font.render(line, True, WHITE) for line in lines]
+        width = max(t.get_width() for t in texts) + 10
+        height = sum(t.get_height() for t in texts) + 10
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.surface.fill((0, 0, 0, 170))
+        y = 5
+        for text in texts:
+            self.surface.blit(text, (5, y))
+            y += text.get_height()
+        self.rect.size = (width, height)
+
+    def draw(self, win):
+        now = pygame.time.get_ticks()
+        if self.surface is None or now - self.updated >= self.REFRESH_MS:
+            self.render()
+            self.updated = now
+        win.blit(self.surface, self.rect)
+
 # ---------------- CAMERA CLASS ----------------
 class Camera:
     def __init__(self, width, height, map_width, map_height):
@@ -133,24 +305,9 @@ class Camera:
         return rect.move(-int(self.offset_x), -int(self.offset_y))
 
 # ---------------- NODE ----------------
-class Node:
-    def __init__(self, row, col):
-        self.row = row
-        self.col = col
-        self.x = col * CELL_SIZE
-        self.y = row * CELL_SIZE
-        self.wall = False
-        self.start = False
-        self.finish = False
-        self.distance = float('inf')
-        self.prev = None
-        self.in_queue = False
-        self.processed = False
-        self.is_path = False
-        self.is_current = False 
-
-    def __lt__(self, other):
-        return self.distance < other.distance
+class Node(core.Node):
+    def __init__(self, row, col, cell_size=None):
+        super().__init__(row, col, CELL_SIZE if cell_size is None else cell_size)
 
     def draw(self, win, offset_x, offset_y):
         screen_x = self.x - offset_x
@@ -164,66 +321,27 @@ class Node:
         
         pygame.draw.rect(win, color, (screen_x, screen_y, CELL_SIZE, CELL_SIZE))
 
-        if self.wall:
+        if self.wall and WALL_IMG is None:
+            pygame.draw.rect(win, BLACK, (screen_x, screen_y, CELL_SIZE, CELL_SIZE))
+        elif self.wall:
             wall_size = int(CELL_SIZE * 1.1)
             offset = (wall_size - CELL_SIZE) // 2
             win.blit(WALL_IMG, (screen_x - offset, screen_y - offset)) 
         elif self.finish:
-            t = pygame.time.get_ticks()
-            pulse_factor = 1 + 0.5 * abs(math.sin(t * 0.005))
-            pulse_size = int(CELL_SIZE * pulse_factor)
-            pulse_offset = (pulse_size - CELL_SIZE) // 2
-            
-            finish_img = pygame.transform.scale(FINISH_BASE_IMG, (pulse_size, pulse_size)) 
+            finish_img, pulse_offset = finish_pulse_frame()
             win.blit(finish_img, (screen_x - pulse_offset, screen_y - pulse_offset))
 
         pygame.draw.rect(win, GRAY, (screen_x, screen_y, CELL_SIZE, CELL_SIZE), 1)
 
-    def reset_search(self):
-        self.distance = float('inf')
-        self.prev = None
-        self.in_queue = False
-        self.processed = False
-        self.is_path = False
-        self.is_current = False
+class CellView(core.NodeView):
+    """CompactGrid katagi, Node bilan bir xil chiziladi."""
+    __slots__ = ()
+    draw = Node.draw
 
 # ---------------- PLAYER ----------------
-class Player:
-    def __init__(self, start_node):
-        self.current_node = start_node
-        self.x = start_node.x + CELL_SIZE // 2
-        self.y = start_node.y + CELL_SIZE // 2
-        self.path = []
-        self.index = 0
-        self.speed = 15
-        self.moving = False
-
-    def start(self, path):
-        self.path = path
-        self.index = 1
-        self.moving = True
+class Player(sim.Walker):
+    """``sim.Walker`` harakati + chizish (pygame)."""
 
-    def update(self):
-        if not self.moving or self.index >= len(self.path):
-            self.moving = False
-            return
-        
-        target = self.path[self.index]
-        tx = target.x + CELL_SIZE // 2
-        ty = target.y + CELL_SIZE // 2
-        
-        dx = tx - self.x
-        dy = ty - self.y
-        dist = math.hypot(dx, dy)
-        
-        if dist < self.speed:
-            self.x, self.y = tx, ty
-            self.current_node = target
-            self.index += 1
-        else:
-            self.x += dx / dist * self.speed
-            self.y += dy / dist * self.speed
-            
     def get_rect(self):
         return pygame.Rect(self.x - CELL_SIZE // 2, self.y - CELL_SIZE // 2, CELL_SIZE, CELL_SIZE)
 
@@ -231,32 +349,15 @@ class Player:
         screen_x = int(self.x - offset_x)
         screen_y = int(self.y - offset_y)
         
-        player_scaled_img = pygame.transform.scale(PLAYER_BASE_IMG, (CELL_SIZE, CELL_SIZE))
-        player_rect = player_scaled_img.get_rect(center=(screen_x, screen_y))
-        win.blit(player_scaled_img, player_rect)
+        # PLAYER_BASE_IMG allaqachon CELL_SIZE o'lchamida (SpriteCache)
+        player_rect = PLAYER_BASE_IMG.get_rect(center=(screen_x, screen_y))
+        win.blit(PLAYER_BASE_IMG, player_rect)
 
 
 # ---------------- GRID & HELPERS ----------------
 def create_grid():
     global ROWS, COLS
-    return [[Node(r, c) for c in range(COLS)] for r in range(ROWS)]
-
-def get_neighbors(node, grid):
-    global ROWS, COLS
-    res = []
-    for dr, dc in [(1,0), (-1,0), (0,1), (0,-1)]:
-        r, c = node.row + dr, node.col + dc
-        if 0 <= r < ROWS and 0 <= c < COLS and not grid[r][c].wall:
-            res.append(grid[r][c])
-    return res
-
-def reconstruct_path(end):
-    path = []
-    cur = end
-    while cur:
-        path.append(cur)
-        cur = cur.prev
-    return path[::-1]
+    return core.CompactGrid(ROWS, COLS, CELL_SIZE, view_cls=CellView)
 
 def get_node_from_pos(pos, grid):
     """Sichqoncha pozitsiyasi bo'yicha tugunni qaytaradi."""
@@ -267,140 +368,288 @@ def get_node_from_pos(pos, grid):
         return grid[row][col]
     return None
 
-def random_finish(grid, start):
-    global ROWS, COLS
-    valid_nodes = []
-    for r in range(ROWS):
-        for c in range(COLS):
-            node = grid[r][c]
-            if not node.wall and node != start and r > 1 and r < ROWS - 2 and c > 1 and c < COLS - 2:
-                 dist = (node.row - start.row)**2 + (node.col - start.col)**2
-                 valid_nodes.append((dist, node))
-                 
-    valid_nodes.sort(key=lambda x: x[0], reverse=True)
-    if valid_nodes:
-        return random.choice(valid_nodes[:min(10, len(valid_nodes))])[1]
-    
-    return grid[ROWS-2][COLS-2]
-
-def clear_old_finish(grid):
-    for row in grid:
-        for node in row:
-            if node.finish:
-                node.finish = False
-                node.reset_search()
-                return node
-    return None
-    
-# ---------------- MAZE GENERATION ----------------
-def generate_maze(grid, start, finish):
-    global ROWS, COLS
-    for r in range(ROWS):
-        for c in range(COLS):
-            grid[r][c].wall = True
-
-    stack = [start]
-    start.wall = False
-    visited = {start}
-
-    while stack:
-        cur = stack[-1]
-        neighbors = []
-        for dr, dc in [(2,0), (-2,0), (0,2), (0,-2)]:
-            r, c = cur.row + dr, cur.col + dc
-            if 0 <= r < ROWS and 0 <= c < COLS and grid[r][c] not in visited:
-                neighbors.append(grid[r][c])
-        if neighbors:
-            nxt = random.choice(neighbors)
-            wall_r = cur.row + (nxt.row - cur.row)//2
-            wall_c = cur.col + (nxt.col - cur.col)//2
-            grid[wall_r][wall_c].wall = False
-            nxt.wall = False
-            visited.add(nxt)
-            stack.append(nxt)
+# ---------------- QIDIRUV (VIZUAL) ----------------
+def search_result(solver):
+    stats = solver.stats
+    print(f"{solver.name}: {stats['expanded']} ta tugun kengaytirildi, yo'l uzunligi {stats['path_length']}, "
+          f"{stats['time'] * 1000:.2f} ms.")
+
+# ---------------- RENDERER ----------------
+class Renderer:
+    """Dirty-rect renderer.
+
+    Fon va kataklar ``scene`` sirtida saqlanadi. Har kadrda faqat holati
+    o'zgargan kataklar (devor, navbat/processed/path, start/finish) qayta
+    chiziladi, player, pulsatsiyalanuvchi finish va tugmalar esa sprite
+    sifatida ustidan chiziladi. ``display.update`` ga faqat o'zgargan
+    to'rtburchaklar beriladi. Faqat kamera ko'rib turgan kataklar bilan
+    ishlanadi, shuning uchun kadr narxi grid o'lchamiga bog'liq emas.
+    """
+    MAX_DIRTY_RECTS = 64
+
+    def __init__(self, win):
+        self.win = win
+        self.scene = pygame.Surface(win.get_size())
+        if CHEAP_RENDER:
+            self.background = pygame.Surface(win.get_size())
+            self.background.fill(BG_COLOR_TOP)
         else:
-            stack.pop()
-    
-    start.wall = False
-    finish.wall = False
-
-def add_extra_paths(grid, count):
-    global ROWS, COLS
-    added = 0
-    tries = 0
-    while added < count and tries < count * 5:
-        r = random.randint(1, ROWS-2)
-        c = random.randint(1, COLS-2)
-        node = grid[r][c]
-        
-        if node.wall:
-            open_n = 0
-            for dr, dc in [(1,0), (-1,0), (0,1), (0,-1)]:
-                if 0 <= r+dr < ROWS and 0 <= c+dc < COLS and not grid[r+dr][c+dc].wall:
-                    open_n += 1
-            
-            if open_n == 1:
-                 node.wall = False
-                 added += 1
-            elif open_n == 0:
-                 node.wall = False 
-                 added += 1
-            elif open_n >= 2 and random.random() < 0.2:
-                 node.wall = False
-                 added += 1
-                 
-        tries += 1
-        
-# ---------------- DIJKSTRA ----------------
-async def dijkstra(start, finish, grid, draw):
-    for row in grid:
-        for node in row:
-            node.reset_search()
-
-    pq = []
-    start.distance = 0
-    heapq.heappush(pq, (0, start))
-    visited = {start}
-
-    while pq:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-        _, cur = heapq.heappop(pq)
-        
-        cur.is_current = True 
-        draw()
-        await asyncio.sleep(VISUALIZATION_DELAY_SEC)
-        cur.is_current = False
-
-        if cur.processed:
-            continue
-            
-        cur.processed = True
-
-        if cur == finish:
-            return reconstruct_path(finish)
-
-        for nb in get_neighbors(cur, grid):
-            if nb.processed:
-                continue
-                
-            nd = cur.distance + 1
-            if nd < nb.distance:
-                nb.distance = nd
-                nb.prev = cur
-                heapq.heappush(pq, (nb.distance, nb))
-                nb.in_queue = True
-
-        draw()
-        await asyncio.sleep(VISUALIZATION_DELAY_SEC)
+            self.background = gradient_surface(win.get_size(), BG_COLOR_TOP, BG_COLOR_BOTTOM)
+        self.grid = None
+        self.offset = None
+        self.cell_size = None
+        self.full = True
+        self.path = None
+        self.sprite_rects = []
+        self.view = (0, 0, 0, 0)
+        self._rows = []
+        self._state_buf = None
+        self.crowd_images = {}
+
+    def invalidate(self):
+        self.full = True
+
+    def set_path(self, grid, path):
+        """Yo'l kataklariga PATH bitini qo'yadi (faqat yo'l o'zgarganda)."""
+        if path is self.path:
+            return
+        state = grid.state
+        if self.path:
+            for node in self.path:
+                state[node.idx] &= ~core.PATH
+        if path:
+            for node in path:
+                if not node.start and not node.finish:
+                    state[node.idx] |= core.PATH
+        self.path = path
 
-    return None
+    def draw_cell(self, surf, grid, idx, ox, oy):
+        row, col = divmod(idx, grid.cols)
+        sx = col * CELL_SIZE - ox
+        sy = row * CELL_SIZE - oy
+        st = grid.state[idx]
+
+        color = TERRAIN_COLORS.get(grid.terrain[idx], WHITE)
+        if st & core.PATH: color = PATH_COLOR
+        elif st & core.PROCESSED: color = PURPLE
+        elif st & core.IN_QUEUE: color = ORANGE
+        elif st & core.CURRENT: color = GREEN
+
+        if CHEAP_RENDER:
+            # Bitta fill: WASM'da har pygame chaqiruvi qimmat
+            surf.fill(BLACK if grid.walls[idx] else color, (sx, sy, CELL_SIZE, CELL_SIZE))
+            return
+        surf.fill(color, (sx, sy, CELL_SIZE, CELL_SIZE))
+        if grid.walls[idx]:
+            offset = wall_overhang()
+            surf.blit(WALL_IMG, (sx - offset, sy - offset))
+        # Chegara: pygame.draw.rect(..., 1) clip bilan noto'g'ri chizadi,
+        # shuning uchun to'rtta ingichka fill ishlatamiz
+        surf.fill(GRAY, (sx, sy, CELL_SIZE, 1))
+        surf.fill(GRAY, (sx, sy + CELL_SIZE - 1, CELL_SIZE, 1))
+        surf.fill(GRAY, (sx, sy, 1, CELL_SIZE))
+        surf.fill(GRAY, (sx + CELL_SIZE - 1, sy, 1, CELL_SIZE))
+
+    def redraw_region(self, grid, rect, ox, oy):
+        """Ekrandagi ``rect`` ni fon va kataklardan qaytadan yig'adi.
+
+        Devor rasmi katakdan biroz kattaroq, shuning uchun qo'shni
+        kataklarning chiqib turgan qismi ham to'liq chizishdagi tartibda
+        (qator bo'yicha) tiklanadi.
+        """
+        overhang = wall_overhang() + 1
+        cols = grid.cols
+        r0 = max((rect.top + oy - overhang) // CELL_SIZE, 0)
+        r1 = min((rect.bottom + oy + overhang) // CELL_SIZE + 1, grid.rows)
+        c0 = max((rect.left + ox - overhang) // CELL_SIZE, 0)
+        c1 = min((rect.right + ox + overhang) // CELL_SIZE + 1, cols)
+
+        self.scene.set_clip(rect)
+        self.scene.blit(self.background, rect, rect)
+        for r in range(r0, r1):
+            for idx in range(r * cols + c0, r * cols + c1):
+                self.draw_cell(self.scene, grid, idx, ox, oy)
+        self.scene.set_clip(None)
+
+    def redraw_cell(self, grid, idx, ox, oy):
+        row, col = divmod(idx, grid.cols)
+        overhang = wall_overhang() + 1
+        rect = pygame.Rect(col * CELL_SIZE - ox, row * CELL_SIZE - oy, CELL_SIZE, CELL_SIZE).inflate(overhang * 2, overhang * 2)
+        self.redraw_region(grid, rect, ox, oy)
+        return rect
+
+    def scroll(self, grid, dx, dy, ox, oy):
+        """Sahnani kamera siljishiga qarab suradi, faqat ochilgan chetlarni chizadi."""
+        self.scene.scroll(-dx, -dy)
+        width, height = self.scene.get_size()
+        exposed = []
+        if dx > 0: exposed.append(pygame.Rect(width - dx, 0, dx, height))
+        elif dx < 0: exposed.append(pygame.Rect(0, 0, -dx, height))
+        if dy > 0: exposed.append(pygame.Rect(0, height - dy, width, dy))
+        elif dy < 0: exposed.append(pygame.Rect(0, 0, width, -dy))
+        # Xarita oynadan kichik bo'lsa, fon surilmasligi kerak
+        map_rect = pygame.Rect(-ox, -oy, grid.cols * CELL_SIZE, grid.rows * CELL_SIZE)
+        if map_rect.right < width: exposed.append(pygame.Rect(map_rect.right, 0, width - map_rect.right, height))
+        if map_rect.bottom < height: exposed.append(pygame.Rect(0, map_rect.bottom, width, height - map_rect.bottom))
+        for rect in exposed:
+            self.redraw_region(grid, rect.clip(self.scene.get_rect()), ox, oy)
+
+    def visible_range(self, grid, ox, oy):
+        """Kamera orqali ko'rinadigan qator/ustunlar (+1 katak zaxira)."""
+        width, height = self.win.get_size()
+        r0 = max(oy // CELL_SIZE - 1, 0)
+        r1 = min((oy + height) // CELL_SIZE + 2, grid.rows)
+        c0 = max(ox // CELL_SIZE - 1, 0)
+        c1 = min((ox + width) // CELL_SIZE + 2, grid.cols)
+        return r0, r1, c0, c1
+
+    def snapshot(self, grid):
+        """Ko'rinadigan qatorlarning holatini keyingi kadr uchun saqlaydi."""
+        r0, r1, c0, c1 = self.view
+        cols = grid.cols
+        walls, marks, state, terrain = grid.walls, grid.marks, grid.state, grid.terrain
+        self._rows = [(walls[a:a + c1 - c0], marks[a:a + c1 - c0], state[a:a + c1 - c0], terrain[a:a + c1 - c0])
+                      for a in range(r0 * cols + c0, r1 * cols + c0, cols)]
+
+    def changed_cells(self, grid):
+        r0, r1, c0, c1 = self.view
+        cols, width = grid.cols, c1 - c0
+        walls, marks, state, terrain = grid.walls, grid.marks, grid.state, grid.terrain
+        changed = []
+        # Faqat ko'rinadigan qatorlarni C tezligida solishtiramiz
+        for (old_w, old_m, old_s, old_t), a in zip(self._rows, range(r0 * cols + c0, r1 * cols + c0, cols)):
+            b = a + width
+            if walls[a:b] != old_w or marks[a:b] != old_m or state[a:b] != old_s or terrain[a:b] != old_t:
+                for i in range(width):
+                    if (walls[a + i] != old_w[i] or marks[a + i] != old_m[i] or state[a + i] != old_s[i]
+                            or terrain[a + i] != old_t[i]):
+                        changed.append(a + i)
+        return changed
+
+    def draw_finish(self, grid, ox, oy):
+        idx = grid.marks.find(core.FINISH)
+        if idx < 0 or grid.walls[idx]:
+            return None
+        row, col = divmod(idx, grid.cols)
+        finish_img, pulse_offset = finish_pulse_frame()
+        return self.win.blit(finish_img, (col * CELL_SIZE - ox - pulse_offset, row * CELL_SIZE - oy - pulse_offset))
+
+    def draw_crowd(self, agents, ox, oy):
+        """Ko'rinib turgan agentlarni bitta ``blits`` chaqiruvida chizadi; umumiy rect qaytaradi."""
+        size = max(CELL_SIZE // 2, 2)
+        images = self.crowd_images.get(size)
+        if images is None:
+            images = []
+            for color in CROWD_COLORS:
+                img = pygame.Surface((size, size), pygame.SRCALPHA)
+                pygame.draw.circle(img, color, (size // 2, size // 2), size // 2)
+                images.append(img)
+            self.crowd_images = {size: images}
+
+        width, height = self.win.get_size()
+        half = size // 2
+        n = len(images)
+        blits = []
+        for x, y, goal in agents.positions(CELL_SIZE):
+            px, py = int(x) - ox - half, int(y) - oy - half
+            if -size < px < width and -size < py < height:
+                blits.append((images[goal % n], (px, py)))
+        rects = self.win.blits(blits)
+        return rects[0].unionall(rects[1:]) if rects else None
+
+    def draw(self, grid, player, camera, buttons, path=None, agents=None):
+        ox, oy = int(camera.offset_x), int(camera.offset_y)
+        if grid is not self.grid or CELL_SIZE != self.cell_size:
+            self.grid, self.offset, self.cell_size = grid, (ox, oy), CELL_SIZE
+            self.path = None
+            self.full = True
+        if grid.state is not self._state_buf:
+            # reset_search yangi bufer yaratadi, eski PATH bitlari yo'q
+            self._state_buf = grid.state
+            self.path = None
+        self.set_path(grid, path)
+
+        dirty = []
+        width, height = self.scene.get_size()
+        # O'zgarishlar eski ko'rinish bo'yicha topiladi, chizish esa yangisida
+        changed = [] if self.full else self.changed_cells(grid)
+        dx, dy = ox - self.offset[0], oy - self.offset[1]
+        self.offset = (ox, oy)
+        self.view = self.visible_range(grid, ox, oy)
+        r0, r1, c0, c1 = self.view
+        if len(changed) > (r1 - r0) * (c1 - c0) // 4 or abs(dx) >= width or abs(dy) >= height:
+            self.full = True
+
+        if self.full:
+            self.scene.blit(self.background, (0, 0))
+            cols = grid.cols
+            for r in range(r0, r1):
+                for idx in range(r * cols + c0, r * cols + c1):
+                    self.draw_cell(self.scene, grid, idx, ox, oy)
+            self.win.blit(self.scene, (0, 0))
+            dirty.append(self.win.get_rect())
+            self.full = False
+        else:
+            if dx or dy:
+                self.scroll(grid, dx, dy, ox, oy)
+            for idx in changed:
+                dirty.append(self.redraw_cell(grid, idx, ox, oy))
+            if dx or dy:
+                self.win.blit(self.scene, (0, 0))
+                dirty = [self.win.get_rect()]
+            else:
+                # O'tgan kadrdagi sprite'lar ostini ham tiklaymiz
+                dirty.extend(self.sprite_rects)
+                for rect in dirty:
+                    self.win.blit(self.scene, rect, rect)
+
+        self.snapshot(grid)
+
+        sprites = []
+        finish_rect = self.draw_finish(grid, ox, oy)
+        if finish_rect:
+            sprites.append(finish_rect)
+        if agents is not None:
+            crowd_rect = self.draw_crowd(agents, ox, oy)
+            if crowd_rect:
+                sprites.append(crowd_rect)
+        if player:
+            player.draw(self.win, ox, oy)
+            sprites.append(camera.apply_rect(player.get_rect()))
+        # Faqat level tugmalarini chizamiz (agar ko'rsatilgan bo'lsa)
+        for button in buttons:
+            button.draw(self.win)
+            sprites.append(button.rect)
+        self.sprite_rects = sprites
+
+        dirty.extend(sprites)
+        if len(dirty) > self.MAX_DIRTY_RECTS:
+            dirty = [dirty[0].unionall(dirty[1:])]
+        return dirty
 
 # ---------------- DRAW ----------------
-def draw_all(win, grid, player, camera, buttons, path=None):
+RENDERER = None
+
+def present(dirty=None):
+    """Chizilganni ekranga chiqaradi; ``dirty`` None bo'lsa butun oyna."""
+    if dirty is None:
+        pygame.display.update()
+    else:
+        pygame.display.update(dirty)
+
+def draw_all(win, grid, player, camera, buttons, path=None, agents=None, show=True):
+    """Kadrni chizadi. ``show`` False bo'lsa ekranga chiqarmasdan o'zgargan
+    to'rtburchaklarni qaytaradi (keyin ``present`` bilan chiqariladi)."""
+    global RENDERER
+    if isinstance(grid, core.CompactGrid):
+        if RENDERER is None or RENDERER.win is not win:
+            RENDERER = Renderer(win)
+        dirty = RENDERER.draw(grid, player, camera, buttons, path, agents)
+        if show:
+            present(dirty)
+        return dirty
+
+    # Node matritsasi uchun eski to'liq chizish
     draw_gradient(win, BG_COLOR_TOP, BG_COLOR_BOTTOM)
     
     for row in grid:
@@ -423,7 +672,9 @@ def draw_all(win, grid, player, camera, buttons, path=None):
     for button in buttons:
         button.draw(win)
         
-    pygame.display.update()
+    if show:
+        present()
+    return None
 
 # ---------------- MAIN ----------------
 def update_global_level(level_name):
@@ -441,19 +692,19 @@ def update_global_level(level_name):
 
 
 async def main():
-    global ROWS, COLS, CELL_SIZE, CURRENT_LEVEL
+    global ROWS, COLS, CELL_SIZE, CURRENT_LEVEL, ALGORITHM, INSTANT_SEARCH, SEARCH_STEPS_PER_FRAME, INCREMENTAL_REPAIR, MAZE_ALGORITHM, BRUSH
 
     # START, RESET, CHANGE MAP tugmalari butunlay olib tashlandi.
-    
+
     # --- Level o'zgartirish UI elementlari ---
     level_buttons = []
     level_y = HEIGHT - 50
     level_x = 10
-    
+
     # Level tanlash tugmasini bosish uchun ishlatiladigan ichki funksiya
     def set_level_action(level_name):
         return ('set_level', level_name)
-    
+
     for i, (name, config) in enumerate(LEVELS.items()):
         # Level tugmalarini yaratish
         level_buttons.append(Button(level_x, level_y, 100, 30, name, GRAY, lambda n=name: set_level_action(n)))
@@ -461,95 +712,148 @@ async def main():
 
     # Boshqaruv holati
     show_level_buttons = True
-    
+
     # --- Boshlang'ich Level Sozlamalari ---
     update_global_level(CURRENT_LEVEL)
-    
-    grid = create_grid()
-    start = grid[1][1]
-    
-    MAP_WIDTH = COLS * CELL_SIZE
-    MAP_HEIGHT = ROWS * CELL_SIZE
-    camera = Camera(WIDTH, HEIGHT, MAP_WIDTH, MAP_HEIGHT)
 
-    def reset_level(random_finish_flag=True):
-        nonlocal finish, player, started, grid, MAP_WIDTH, MAP_HEIGHT, camera
-        
-        grid = create_grid() 
-        start = grid[1][1] 
-        
-        for r in range(ROWS):
-            for c in range(COLS):
-                grid[r][c].start = False
-                grid[r][c].finish = False
-                grid[r][c].reset_search()
-                grid[r][c].is_path = False
-        
-        generate_maze(grid, start, start)
-        add_extra_paths(grid, LEVELS[CURRENT_LEVEL]["EXTRA_PATHS"]) 
-        
-        start.start = True
-        
-        if random_finish_flag:
-            new_finish = random_finish(grid, start)
-            new_finish.finish = True
-            finish = new_finish
-        
-        MAP_WIDTH = COLS * CELL_SIZE
-        MAP_HEIGHT = ROWS * CELL_SIZE
-        camera = Camera(WIDTH, HEIGHT, MAP_WIDTH, MAP_HEIGHT)
-        player = Player(start)
-        started = False
-        return finish
-        
-    finish = reset_level(random_finish_flag=True)
-    player = Player(start)
-    started = False
+    # O'yin holati (labirint, start/finish, qidiruv, D* Lite, player) sim.Simulation da,
+    # u faqat tiklar va kiritishlar bilan o'zgaradi. Kiritishlar recorder'ga yoziladi.
+    def new_seed():
+        return MAZE_SEED if MAZE_SEED is not None else random.randrange(2**32)
+
+    settings = dict(level=CURRENT_LEVEL, generator=MAZE_ALGORITHM, seed=new_seed(), algorithm=ALGORITHM,
+                    steps_per_tick=SEARCH_STEPS_PER_FRAME, instant=INSTANT_SEARCH, repair=INCREMENTAL_REPAIR)
+    game = sim.simulation_for(settings, view_cls=CellView, player_cls=Player)
+    recorder = sim.Recorder(**settings)
+
+    def act(kind, a=0, b=0):
+        """Kiritishni bajaradi va (rad etilmagan bo'lsa) joriy tik bilan yozadi."""
+        result = game.apply(kind, a, b)
+        if recorder is not None and result is not False:
+            recorder.record(game.tick, kind, a, b)
+        return result
+
+    def new_camera():
+        return Camera(WIDTH, HEIGHT, COLS * CELL_SIZE, ROWS * CELL_SIZE)
+
+    camera = new_camera()
+
+    def reset_level():
+        nonlocal agents, camera
+        act(sim.RESET, 0, new_seed())
+        camera = new_camera()
+        agents = None
+
+    def load_level(filename):
+        nonlocal agents, camera, recorder
+
+        with mazefile.MazeFile(filename) as mf:
+            path = mf.path() # noto'g'ri fayl global holatni o'zgartirishdan oldin rad etiladi
+            level = mf.level
+            config = LEVELS.get(level)
+            if not config or (config["ROWS"], config["COLS"]) != (mf.rows, mf.cols):
+                # Fayl o'z o'lchamlari bilan alohida daraja sifatida ochiladi
+                level = "Fayl"
+                LEVELS[level] = mf.level_config()
+                LEVELS[level]["CELL_SIZE"] = mf.cell_size or max(WIDTH // max(mf.rows, mf.cols), 8)
+            update_global_level(level)
+            grid = mf.to_grid(CELL_SIZE, CellView)
+            start = grid.node(mf.start) if mf.start >= 0 else grid[1][1]
+            start.start = True
+            finish = grid.node(mf.finish) if mf.finish >= 0 else None
+            game.level = level
+            game.use_grid(grid, start, finish, mf.seed)
+
+        # Fayldagi labirintni seed'dan qayta qurib bo'lmaydi: shu paytgacha yozilgani saqlanadi
+        if recorder is not None:
+            recorder.save(RECORD_FILE)
+            recorder = None
+            print(f"YOZUV: {RECORD_FILE} ga saqlandi va to'xtatildi.")
+        camera = new_camera()
+        agents = None
+        if path:
+            # Saqlangan yechim qayta ijro etiladi
+            game.player.start([grid.node(idx) for idx in path])
+            game.started = True
+
+    agents = None # Olomon rejimi (crowd.Crowd), C tugmasi
+    prof = profiler.FrameProfiler() # kadr vaqtlari har doim o'lchanadi, panel va log P bilan
+    prof.cache = game.solves.stats
+    overlay = None
+    tick_time = 0.0 # hali bajarilmagan tiklar vaqti (ms)
+    tick_ms = 1000 / sim.TICK_RATE
+    report_time = time.perf_counter() # oxirgi FPS hisoboti (FPS_REPORT_SEC)
     running = True
-    
-    # draw_callback faqat level_buttons ko'rsatish/yashirishni boshqaradi
-    draw_callback = lambda p=None, path=None: draw_all(WIN, grid, player, camera, level_buttons if show_level_buttons else [], path)
+
+    # draw_callback faqat level_buttons (va profil paneli) ko'rsatish/yashirishni boshqaradi
+    draw_callback = lambda p=None, path=None: draw_all(
+        WIN, game.grid, game.player, camera,
+        (level_buttons if show_level_buttons else []) + ([overlay] if overlay else []),
+        path, agents, show=False)
 
     # --- Asosiy O'yin Tsikli ---
     while running:
-        
-        camera.update(player.get_rect())
-        
-        if player.moving:
-            player.update()
-            
+        prof.begin_frame()
+
+        camera.update(game.player.get_rect())
+        prof.lap("camera")
+
+        # Qat'iy qadam: player va qidiruv kadr tezligiga emas, tiklarga bog'liq
+        tick_time = min(tick_time + CLOCK.get_time(), MAX_TICKS_PER_FRAME * tick_ms)
+        if agents is not None:
+            agents.refresh()
+        prof.lap("crowd")
+        while tick_time >= tick_ms:
+            tick_time -= tick_ms
+            finished = game.step(prof.lap)
+            if finished is not None:
+                search_result(finished)
+            if agents is not None:
+                agents.update(CROWD_SPEED)
+                prof.lap("crowd")
+
+        player = game.player
         current_path = player.path if not player.moving and player.index > 0 else None
-        
-        draw_callback(path=current_path)
+
+        dirty = draw_callback(path=current_path)
+        prof.lap("draw_all")
+        present(dirty)
+        prof.lap("display")
+        if prof.frame_no == 0:
+            # STARTUP_TIME main.py importlaridan keyin olinadi: WASM Python va pygame yuklanishi kirmaydi
+            print(f"BIRINCHI KADR: {(time.perf_counter() - STARTUP_TIME) * 1000:.0f} ms.")
 
         # Sichqoncha orqali devor chizish/o'chirish
         mouse_buttons = pygame.mouse.get_pressed()
         if mouse_buttons[0] or mouse_buttons[2]:
             pos = pygame.mouse.get_pos()
-            
+
             # Agar sichqoncha Level tugmalari ustida bo'lmasa, devor chizishga ruxsat berish
             is_over_ui = any(btn.rect.collidepoint(pos) for btn in level_buttons)
-            
+
             if not is_over_ui:
                 map_pos = (pos[0] + int(camera.offset_x), pos[1] + int(camera.offset_y))
-                node = get_node_from_pos(map_pos, grid)
-
-                if node and not node.start and not node.finish:
-                    if mouse_buttons[0]: 
-                        node.wall = True
-                        node.is_path = False
-                    elif mouse_buttons[2]:
-                        node.wall = False
+                node = get_node_from_pos(map_pos, game.grid)
+
+                if node and BRUSH != "wall":
+                    # Relyef faqat yo'laklarga chiziladi; o'ng tugma oddiy yerga qaytaradi
+                    kind = core.TERRAIN_NAMES.index(BRUSH) if mouse_buttons[0] else core.GROUND
+                    act(sim.TERRAIN, node.idx, kind)
+                elif node:
+                    # HPA* grafi va D* Lite yo'li Simulation.paint ichida yangilanadi
+                    repairing = game.planner is not None
+                    if act(sim.PAINT, node.idx, 1 if mouse_buttons[0] else 0) and repairing and game.planner is None:
+                        print("Yo'l yopildi: finishga yetib bo'lmaydi.")
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
-            
+
             # --- Sichqoncha bosilishi (Faqat Level tanlash va Finish belgilash uchun) ---
             if event.type == pygame.MOUSEBUTTONDOWN:
                 pos = event.pos
                 action = None
-                
+
                 # 1. Level tugmalarini tekshirish (faqat ko'ringan bo'lsa)
                 if show_level_buttons:
                     for btn in level_buttons:
@@ -561,59 +865,148 @@ async def main():
                 if isinstance(action, tuple) and action[0] == 'set_level':
                     level_name = action[1]
                     update_global_level(level_name)
-                    finish = reset_level(random_finish_flag=True)
-                
+                    act(sim.LEVEL, list(LEVELS).index(CURRENT_LEVEL))
+                    reset_level()
+
                 # 3. Finishni qo'lda belgilash mantiqi (Faqat UI tugmasi bosilmagan bo'lsa)
                 elif not action:
-                    
+
                     map_pos = (pos[0] + int(camera.offset_x), pos[1] + int(camera.offset_y))
-                    clicked_node = get_node_from_pos(map_pos, grid)
-                    
-                    if clicked_node and not clicked_node.start and not clicked_node.wall:
-                        clear_old_finish(grid)
-                        clicked_node.finish = True
-                        finish = clicked_node 
-                        started = False
-                        player = Player(start) 
-                        
+                    clicked_node = get_node_from_pos(map_pos, game.grid)
+
+                    if clicked_node and act(sim.FINISH, clicked_node.idx):
+                        steps = game.fields.get(game.grid, game.start.idx).distance(clicked_node.idx)
+                        print(f"FINISH: {steps} qadam." if steps < core.INF else "FINISH: startdan yetib bo'lmaydi.")
+
             # --- Klaviatura hodisalari (Yangi boshqaruv) ---
             if event.type == pygame.KEYDOWN:
-                
+
                 # START: SPACE (Probel)
-                if event.key == pygame.K_SPACE and not started:
-                    if not finish or finish.wall:
+                if event.key == pygame.K_SPACE and not game.player.moving and game.solver is None:
+                    if not game.finish or game.finish.wall:
                         print("Iltimos, avval Finish nuqtasini belgilang (sichqoncha chap tugmasi).")
                         continue
-                        
-                    print("START: Dijkstra algoritmi ishga tushirildi.")
-                    
-                    for row in grid:
-                        for node in row:
-                            node.reset_search()
-                            node.is_path = False
-                            
-                    path = await dijkstra(start, finish, grid, draw_callback)
-                    if path:
-                        player.start(path)
-                        started = True
-                
+
+                    # INSTANT va bir xil narxlarda yo'l keshdagi masofa maydonidan olinadi
+                    search = act(sim.SPACE)
+                    prof.counters = search.stats
+                    if isinstance(search, solvecache.Solved):
+                        hit_rate = game.solves.stats["hit_rate"]
+                        print(f"START: {search.name} keshdan (hit {hit_rate:.0%}), yo'l uzunligi "
+                              f"{search.stats['path_length']}.")
+                        continue
+                    if search is not game.solver:
+                        print(f"START: masofa maydoni, yo'l uzunligi {len(game.player.path)}.")
+                        continue
+
+                    print(f"START: {ALGORITHM} algoritmi ishga tushirildi.")
+                    lo, hi = game.grid.cost_range()
+                    if lo != hi and not search.weighted:
+                        print(f"Diqqat: {ALGORITHM} relyef narxlarini hisobga olmaydi (dijkstra/astar oladi).")
+
                 # RESET: R
                 elif event.key == pygame.K_r:
-                    print("RESET: Yangi labirint yaratildi.")
-                    finish = reset_level(random_finish_flag=True)
-                    started = False 
-                    
+                    reset_level()
+                    print(f"RESET: Yangi labirint yaratildi ({MAZE_ALGORITHM}, seed={game.seed}).")
+
+                # SAQLASH: S (labirint, daraja va topilgan yo'l MAZE_FILE ga)
+                elif event.key == pygame.K_s:
+                    mazefile.save(MAZE_FILE, game.grid, game.start, game.finish, level=CURRENT_LEVEL,
+                                  path=game.player.path if game.started else None, seed=game.seed,
+                                  generator=MAZE_ALGORITHM, extra_paths=LEVELS[CURRENT_LEVEL]["EXTRA_PATHS"])
+                    print(f"SAQLANDI: {MAZE_FILE} ({CURRENT_LEVEL}, seed={game.seed}).")
+
+                # OCHISH: O (MAZE_FILE dan labirintni yuklash)
+                elif event.key == pygame.K_o:
+                    try:
+                        load_level(MAZE_FILE)
+                        print(f"OCHILDI: {MAZE_FILE} ({CURRENT_LEVEL}, {ROWS}x{COLS}, seed={game.seed}).")
+                    except (OSError, ValueError) as e:
+                        print(f"Faylni ochib bo'lmadi: {e}")
+
+                # OLOMON: C (ko'p agentli rejimni yoqish/o'chirish)
+                elif event.key == pygame.K_c:
+                    if agents is None:
+                        agents = crowd.Crowd(game.grid, CROWD_SIZE, random.Random(game.seed), CROWD_GOALS)
+                        print(f"OLOMON: {len(agents)} ta agent, {len(agents.targets)} ta nishon.")
+                    else:
+                        agents = None
+                        print("OLOMON: o'chirildi.")
+
+                # PROFIL: P (kadr vaqtlari paneli va PROFILE_LOG ga yozish)
+                elif event.key == pygame.K_p:
+                    if overlay is None:
+                        overlay = ProfileOverlay(prof)
+                        prof.open_log(PROFILE_LOG)
+                        print(f"PROFIL: yoqildi, log: {PROFILE_LOG}.")
+                    else:
+                        overlay = None
+                        prof.close()
+                        print("PROFIL: o'chirildi.")
+
                 # CHANGE MAP/LEVEL: L (Level tugmalarini ko'rsatish/yashirish)
                 elif event.key == pygame.K_l:
                     show_level_buttons = not show_level_buttons
-                    print(f"LEVEL TANLASH: {'Ko\'rsatildi' if show_level_buttons else 'Yashirildi'}.")
-
-
-        CLOCK.tick(60) 
+                    print("LEVEL TANLASH: " + ("Ko'rsatildi" if show_level_buttons else "Yashirildi") + ".")
+
+                # CHO'TKA: T (devor -> yo'l -> loy -> suv)
+                elif event.key == pygame.K_t:
+                    BRUSH = BRUSHES[(BRUSHES.index(BRUSH) + 1) % len(BRUSHES)]
+                    print(f"CHO'TKA: {BRUSH}")
+
+                # ALGORITM: A (solverlarni navbatma-navbat almashtirish)
+                elif event.key == pygame.K_a:
+                    names = list(solvers.SOLVERS)
+                    ALGORITHM = names[(names.index(ALGORITHM) + 1) % len(names)]
+                    act(sim.ALGORITHM, names.index(ALGORITHM))
+                    print(f"ALGORITM: {ALGORITHM}")
+
+                # GENERATOR: G (labirint algoritmini almashtirib, yangisini yaratish)
+                elif event.key == pygame.K_g:
+                    names = list(mazegen.GENERATORS)
+                    MAZE_ALGORITHM = names[(names.index(MAZE_ALGORITHM) + 1) % len(names)]
+                    act(sim.GENERATOR, names.index(MAZE_ALGORITHM))
+                    reset_level()
+                    print(f"GENERATOR: {MAZE_ALGORITHM} (seed={game.seed}).")
+
+                # INKREMENTAL: D (devor chizilganda yo'lni tuzatishni yoqish/o'chirish)
+                elif event.key == pygame.K_d:
+                    INCREMENTAL_REPAIR = not INCREMENTAL_REPAIR
+                    act(sim.REPAIR, int(INCREMENTAL_REPAIR))
+                    print("INKREMENTAL: " + ("yoqildi" if INCREMENTAL_REPAIR else "o'chirildi") + ".")
+
+                # INSTANT: I (animatsiyasiz qidiruvni yoqish/o'chirish)
+                elif event.key == pygame.K_i:
+                    INSTANT_SEARCH = not INSTANT_SEARCH
+                    act(sim.INSTANT, int(INSTANT_SEARCH))
+                    print("INSTANT: " + ("yoqildi" if INSTANT_SEARCH else "o'chirildi") + ".")
+
+                # TEZLIK: +/- (animatsiyada tikka nechta qadam)
+                elif event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+                    SEARCH_STEPS_PER_FRAME = min(SEARCH_STEPS_PER_FRAME * 2, 4096)
+                    act(sim.SPEED, SEARCH_STEPS_PER_FRAME)
+                    print(f"TEZLIK: tikka {SEARCH_STEPS_PER_FRAME} qadam.")
+                elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                    SEARCH_STEPS_PER_FRAME = max(SEARCH_STEPS_PER_FRAME // 2, 1)
+                    act(sim.SPEED, SEARCH_STEPS_PER_FRAME)
+                    print(f"TEZLIK: tikka {SEARCH_STEPS_PER_FRAME} qadam.")
+
+
+        prof.lap("input")
+        prof.end_frame()
+        if FPS_REPORT_SEC and time.perf_counter() - report_time >= FPS_REPORT_SEC:
+            report_time = time.perf_counter()
+            summary = prof.summary()
+            print(f"FPS {summary['fps']:.1f}, kadr {summary['total_ms']:.2f} ms (chizish {summary['draw_all']:.2f} ms).")
+
+        CLOCK.tick(FPS)
         await asyncio.sleep(0)
 
+    if recorder is not None:
+        recorder.save(RECORD_FILE)
+        print(f"YOZUV: {len(recorder.events)} ta kiritish {RECORD_FILE} ga saqlandi (python sim.py {RECORD_FILE}).")
     pygame.quit()
-    sys.exit() 
+    sys.exit()
 
 # ---------------- RUN ----------------
 if __name__ == '__main__':
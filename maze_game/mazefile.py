@@ -0,0 +1,225 @@
+"""Labirintni ixcham binar faylga saqlash va ``mmap`` orqali ochish.
+
+Fayl tuzilishi (little-endian):
+
+    sarlavha   HEADER (74 bayt): magic, versiya, bayroqlar, o'lchamlar,
+               CELL_SIZE, EXTRA_PATHS, start, finish, seed, level va
+               generator nomlari, yo'l uzunligi
+    devorlar   har bir qator ``(cols + 7) // 8`` bayt, 1 bit = 1 katak
+               (MSB birinchi, ``numpy.packbits`` bilan bir xil)
+    yo'l       ixtiyoriy: ``path_len`` ta uint32 indeks (startdan finishgacha)
+    relyef     ixtiyoriy (``HAS_TERRAIN``): ``rows * cols`` bayt, har katakka
+               ``core.GROUND``/``ROAD``/``MUD``/``WATER``
+
+Qatorlar baytga tekislangani uchun istalgan qatorni butun faylni o'qimasdan
+olish mumkin: ``MazeFile`` faylni ``mmap`` qiladi va devorlarni faqat
+so'ralganda ochadi, shuning uchun 10k x 10k labirint ham bir zumda ochiladi.
+
+    mazefile.save("maze.bin", grid, level="Hard", path=path, seed=seed)
+    grid, meta = mazefile.load("maze.bin")
+
+    with mazefile.MazeFile("huge.bin") as mf:
+        mf.is_wall(r, c), mf.row(r), mf.path(), mf.terrain()
+"""
+import mmap
+import struct
+import sys
+from array import array
+
+import core
+
+MAGIC = b"MAZE"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIHIiiq16s16sI")
+
+# bayroqlar
+HAS_PATH = 1
+HAS_SEED = 2
+HAS_TERRAIN = 4
+
+# "0"/"1" belgilari <-> devor baytlari
+_TO_BITS = bytes.maketrans(b"\x00\x01", b"01")
+_FROM_BITS = bytes.maketrans(b"01", b"\x00\x01")
+
+def row_bytes(cols):
+    return (cols + 7) // 8
+
+def pack_row(walls):
+    """0/1 baytlar qatorini bitlarga joylaydi."""
+    n = len(walls)
+    size = row_bytes(n)
+    if not n:
+        return b""
+    bits = walls.translate(_TO_BITS) + b"0" * (size * 8 - n)
+    return int(bits, 2).to_bytes(size, "big")
+
+def unpack_row(data, cols):
+    """``pack_row`` ning teskarisi: ``cols`` ta 0/1 baytli ``bytearray``."""
+    if not cols:
+        return bytearray()
+    bits = bin(int.from_bytes(data, "big"))[2:].zfill(len(data) * 8)
+    return bytearray(bits[:cols].encode().translate(_FROM_BITS))
+
+def _name(value):
+    return (value or "").encode()[:16]
+
+def _index(node):
+    if node is None:
+        return -1
+    return getattr(node, "idx", node)
+
+# ---------------- SAQLASH ----------------
+def save(filename, grid, start=None, finish=None, level=None, path=None, seed=None,
+         generator=None, extra_paths=0):
+    """``CompactGrid`` ni faylga yozadi.
+
+    ``start``/``finish`` berilmasa ``grid.marks`` dan olinadi; ular va
+    ``path`` elementlari indeks yoki ``NodeView`` bo'lishi mumkin.
+    """
+    if start is None:
+        start = grid.marks.find(core.START)
+    if finish is None:
+        finish = grid.marks.find(core.FINISH)
+    flags = (HAS_PATH if path else 0) | (HAS_SEED if seed is not None else 0)
+    # Hamma katak oddiy yer bo'lsa relyef bo'limi yozilmaydi
+    if grid.terrain.count(core.GROUND) != len(grid.terrain):
+        flags |= HAS_TERRAIN
+    path = array('I', (_index(node) for node in path or ()))
+    if sys.byteorder == "big":
+        path.byteswap()
+
+    rows, cols = grid.rows, grid.cols
+    with open(filename, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, flags, rows, cols, grid.cell_size, extra_paths,
+                            _index(start), _index(finish), seed if seed is not None else 0,
+                            _name(level), _name(generator), len(path)))
+        walls = grid.walls
+        for r in range(rows):
+            f.write(pack_row(walls[r * cols:(r + 1) * cols]))
+        path.tofile(f)
+        if flags & HAS_TERRAIN:
+            f.write(grid.terrain)
+
+# ---------------- O'QISH ----------------
+class MazeFile:
+    """Faylni ``mmap`` qilib ochadi; devorlar faqat so'ralganda ochiladi."""
+
+    def __init__(self, filename):
+        with open(filename, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.mm) < HEADER.size:
+            self.close()
+            raise ValueError("%s: fayl juda qisqa" % filename)
+        (magic, version, self.flags, self.rows, self.cols, self.cell_size, self.extra_paths,
+         self.start, self.finish, seed, level, generator, self.path_len) = HEADER.unpack_from(self.mm)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError("%s: labirint fayli emas (magic=%r, versiya=%d)" % (filename, magic, version))
+        self.seed = seed if self.flags & HAS_SEED else None
+        self.level = level.rstrip(b"\0").decode() or None
+        self.generator = generator.rstrip(b"\0").decode() or None
+        self.row_size = row_bytes(self.cols)
+        self.path_offset = HEADER.size + self.rows * self.row_size
+        self.terrain_offset = self.path_offset + 4 * self.path_len
+        size = self.terrain_offset + (self.rows * self.cols if self.flags & HAS_TERRAIN else 0)
+        if len(self.mm) < size:
+            self.close()
+            raise ValueError("%s: fayl kesilgan" % filename)
+        # start/finish keyinchalik to'g'ridan-to'g'ri indeks sifatida ishlatiladi
+        for name, idx in (("start", self.start), ("finish", self.finish)):
+            if idx == -1:
+                continue
+            if not 0 <= idx < self.rows * self.cols:
+                self.close()
+                raise ValueError("%s: %s=%d grid chegarasidan tashqarida (%dx%d)"
+                                 % (filename, name, idx, self.rows, self.cols))
+            if self.is_wall(*divmod(idx, self.cols)):
+                self.close()
+                raise ValueError("%s: %s=%d devor katagida" % (filename, name, idx))
+        # Noma'lum relyef turi keyinroq costs()/to_text() da IndexError beradi
+        terrain = self.terrain()
+        if terrain and max(terrain) >= len(core.TERRAIN_COSTS):
+            self.close()
+            raise ValueError("%s: noma'lum relyef turi %d" % (filename, max(terrain)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.mm.close()
+
+    def is_wall(self, row, col):
+        byte = self.mm[HEADER.size + row * self.row_size + (col >> 3)]
+        return bool(byte >> (7 - (col & 7)) & 1)
+
+    def row(self, r):
+        """``r``-qator devorlari (0/1 ``bytearray``)."""
+        off = HEADER.size + r * self.row_size
+        return unpack_row(self.mm[off:off + self.row_size], self.cols)
+
+    def path(self):
+        """Saqlangan yo'l indekslari (``array('I')``) yoki None."""
+        if not self.flags & HAS_PATH:
+            return None
+        path = array('I')
+        path.frombytes(self.mm[self.path_offset:self.path_offset + 4 * self.path_len])
+        if sys.byteorder == "big":
+            path.byteswap()
+        cols = self.cols
+        if path and max(path) >= self.rows * cols:
+            raise ValueError("yo'l indeksi %d grid chegarasidan tashqarida (%dx%d)"
+                             % (max(path), self.rows, cols))
+        # main yo'lni qayta ijro etadi: har qadam devorsiz qo'shni katakka bo'lishi kerak
+        for i, idx in enumerate(path):
+            if self.is_wall(*divmod(idx, cols)):
+                raise ValueError("yo'lning %d-katagi (%d) devor" % (i, idx))
+            if i:
+                prev = path[i - 1]
+                step = abs(idx - prev)
+                if not (step == cols or step == 1 and idx // cols == prev // cols):
+                    raise ValueError("yo'lning %d-qadami qo'shni katakka emas (%d -> %d)" % (i, prev, idx))
+        return path
+
+    def terrain(self):
+        """Relyef turlari (``bytearray``, ``rows * cols``) yoki None."""
+        if not self.flags & HAS_TERRAIN:
+            return None
+        return bytearray(self.mm[self.terrain_offset:self.terrain_offset + self.rows * self.cols])
+
+    def level_config(self):
+        return {"ROWS": self.rows, "COLS": self.cols, "CELL_SIZE": self.cell_size,
+                "EXTRA_PATHS": self.extra_paths}
+
+    def to_grid(self, cell_size=None, view_cls=None):
+        """Butun labirintni ``CompactGrid`` ga ochadi (start/finish ``marks`` da)."""
+        rows, cols = self.rows, self.cols
+        grid = core.CompactGrid(rows, cols, self.cell_size if cell_size is None else cell_size, view_cls)
+        walls = grid.walls
+        for r in range(rows):
+            walls[r * cols:(r + 1) * cols] = self.row(r)
+        terrain = self.terrain()
+        if terrain is not None:
+            grid.terrain = terrain
+        if self.start >= 0:
+            grid.marks[self.start] = core.START
+        if self.finish >= 0:
+            grid.marks[self.finish] = core.FINISH
+        return grid
+
+def load(filename, cell_size=None, view_cls=None):
+    """Faylni ochib ``(grid, meta)`` qaytaradi; ``meta`` - qolgan sarlavha maydonlari."""
+    with MazeFile(filename) as mf:
+        grid = mf.to_grid(cell_size, view_cls)
+        meta = {
+            "level": mf.level,
+            "config": mf.level_config(),
+            "start": mf.start,
+            "finish": mf.finish,
+            "seed": mf.seed,
+            "generator": mf.generator,
+            "path": mf.path(),
+        }
+    return grid, meta
@@ -0,0 +1,238 @@
+"""Almashtiriladigan ustuvorlik navbatlari (solverlar uchun).
+
+Barcha navbatlar grid indekslari (``0..n-1``) bilan ishlaydi va bir xil
+interfeysga ega: ``push(item, key)`` (element navbatda bo'lsa va yangi
+kalit kichikroq bo'lsa - decrease-key), ``pop()`` (eng kichik kalitli
+element), ``len()``. ``stale`` - tashlab yuborilgan eskirgan yozuvlar
+soni; ``IndexedHeap`` va ``FIFOQueue`` da u doim 0.
+
+    IndexedHeap   binar heap + pozitsiyalar jadvali, decrease-key joyida
+    BucketQueue   Dial navbati: kichik butun narxlar uchun aylana chelaklar
+    FIFOQueue     hamma qirra narxi bir xil bo'lsa (BFS tartibi)
+    LazyHeap      oddiy heapq, eskirgan yozuvlar pop'da tashlanadi
+
+``make_queue("auto", n, min_cost, max_cost)`` qirra narxlariga qarab
+tanlaydi. Umumiy holatda ``LazyHeap`` olinadi: CPython'da ``heapq`` C'da
+yozilgan va sof Python'dagi ``IndexedHeap`` dan ~2 marta tez, eskirgan
+yozuvlar esa odatda bir necha foiz. ``IndexedHeap`` xotira/yozuvlar soni
+muhim bo'lganda qo'lda tanlanadi.
+"""
+import heapq
+from array import array
+from collections import deque
+
+# Shundan katta butun narxlarda chelaklar o'rniga heap
+BUCKET_MAX_COST = 64
+
+class FIFOQueue:
+    """Bir xil narxlar: kalitlar kamaymaydigan tartibda keladi, decrease-key kerak emas."""
+    kind = "fifo"
+
+    def __init__(self, n):
+        self.items = deque()
+        self.stale = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def push(self, item, key):
+        self.items.append(item)
+
+    def pop(self):
+        return self.items.popleft()
+
+class IndexedHeap:
+    kind = "heap"
+
+    def __init__(self, n):
+        self.heap = []
+        # list: sift tsikllarida array'dan ~20% tez (int qayta yaratilmaydi)
+        self.keys = [0] * n
+        self.pos = [-1] * n
+        self.stale = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, item, key):
+        pos = self.pos[item]
+        if pos < 0:
+            pos = len(self.heap)
+            self.heap.append(item)
+        elif key >= self.keys[item]:
+            return
+        self.keys[item] = key
+        self._sift_up(pos, item, key)
+
+    def _sift_up(self, pos, item, key):
+        heap, keys, positions = self.heap, self.keys, self.pos
+        while pos:
+            parent = (pos - 1) >> 1
+            other = heap[parent]
+            if keys[other] <= key:
+                break
+            heap[pos] = other
+            positions[other] = pos
+            pos = parent
+        heap[pos] = item
+        positions[item] = pos
+
+    def pop(self):
+        heap, keys, positions = self.heap, self.keys, self.pos
+        top = heap[0]
+        positions[top] = -1
+        item = heap.pop()
+        n = len(heap)
+        if not n:
+            return top
+        key = keys[item]
+        pos = 0
+        while True:
+            child = 2 * pos + 1
+            if child >= n:
+                break
+            right = child + 1
+            if right < n and keys[heap[right]] < keys[heap[child]]:
+                child = right
+            other = heap[child]
+            if keys[other] >= key:
+                break
+            heap[pos] = other
+            positions[other] = pos
+            pos = child
+        heap[pos] = item
+        positions[item] = pos
+        return top
+
+class BucketQueue:
+    """Dial navbati: kalitlar ``[joriy, joriy + max_cost]`` oralig'ida bo'ladi.
+
+    ``max_cost + 1`` ta aylana chelak, har biri oddiy ``list`` (append/pop
+    C'da). Decrease-key elementni yangi chelakka qo'shadi, eski yozuv pop'da
+    kalit mos kelmagani uchun tashlanadi; butun narxlarda bu kam bo'ladi.
+    Ikki tomonlama bog'langan ro'yxatli (to'liq decrease-key) varianti
+    o'lchovlarda ~15% sekinroq chiqdi.
+    """
+    kind = "bucket"
+
+    def __init__(self, n, max_cost=1):
+        self.size = max_cost + 1
+        self.buckets = [[] for _ in range(self.size)]
+        self.keys = array('q', [-1]) * n
+        self.cur = 1 << 62          # oxirgi chiqarilgan kalit (boshida cheksiz)
+        self.count = 0
+        self.stale = 0
+
+    def __len__(self):
+        return self.count
+
+    def push(self, item, key):
+        old = self.keys[item]
+        if old >= 0:
+            if key >= old:
+                return
+        else:
+            self.count += 1
+        if key < self.cur:
+            self.cur = key
+        self.keys[item] = key
+        self.buckets[key % self.size].append(item)
+
+    def pop(self):
+        buckets, size, keys = self.buckets, self.size, self.keys
+        cur = self.cur
+        while True:
+            bucket = buckets[cur % size]
+            while bucket:
+                item = bucket.pop()
+                if keys[item] == cur:
+                    keys[item] = -1
+                    self.count -= 1
+                    self.cur = cur
+                    return item
+                self.stale += 1
+            cur += 1
+
+class LazyHeap:
+    """``heapq`` bilan: decrease-key o'rniga yangi yozuv, eskisi pop'da tashlanadi."""
+    kind = "lazy"
+
+    def __init__(self, n):
+        self.heap = []
+        self.keys = array('q', [-1]) * n
+        self.count = 0
+        self.stale = 0
+
+    def __len__(self):
+        return self.count
+
+    def push(self, item, key):
+        old = self.keys[item]
+        if old >= 0:
+            if key >= old:
+                return
+        else:
+            self.count += 1
+        self.keys[item] = key
+        heapq.heappush(self.heap, (key, item))
+
+    def pop(self):
+        heap, keys = self.heap, self.keys
+        while True:
+            key, item = heapq.heappop(heap)
+            if keys[item] == key:
+                keys[item] = -1
+                self.count -= 1
+                return item
+            self.stale += 1
+
+QUEUES = {
+    FIFOQueue.kind: FIFOQueue,
+    IndexedHeap.kind: IndexedHeap,
+    BucketQueue.kind: BucketQueue,
+    LazyHeap.kind: LazyHeap,
+}
+
+# Kalitlar kamaymaydigan tartibda chiqishini talab qiladigan navbatlar
+MONOTONE_ONLY = (FIFOQueue.kind, BucketQueue.kind)
+
+def pick_queue(min_cost=1, max_cost=1, integer=True, monotone=True):
+    """Qirra narxlari bo'yicha navbat turi.
+
+    ``monotone`` - kalit chiqarilgan oxirgi kalitdan kichik bo'lib push
+    qilinmaydi (Dijkstra). A* da (f, h) kaliti bunday emas, unga heap kerak.
+    """
+    if not monotone:
+        return LazyHeap.kind
+    if min_cost == max_cost:
+        return FIFOQueue.kind
+    if integer and min_cost >= 0 and max_cost <= BUCKET_MAX_COST:
+        return BucketQueue.kind
+    return LazyHeap.kind
+
+def check_queue(kind, min_cost=1, max_cost=1, integer=True, monotone=True):
+    """Navbat turi shu qirra narxlari/solver uchun to'g'ri ishlashini tekshiradi.
+
+    ``fifo`` faqat hamma narx bir xil bo'lganda, ``bucket`` esa butun narxlarda
+    eng qisqa yo'lni beradi; kalitlari kamayishi mumkin bo'lgan solver (A*)
+    bilan ikkalasi ham ishlamaydi (chelak navbati hatto tugamaydi).
+    ``ValueError`` chiqaradi.
+    """
+    if kind == "auto":
+        return
+    if kind not in QUEUES:
+        raise ValueError("Noma'lum navbat: %r (mavjud: auto, %s)" % (kind, ", ".join(QUEUES)))
+    if kind in MONOTONE_ONLY and not monotone:
+        raise ValueError("%r navbati kalitlari kamayadigan solver (A*) bilan ishlamaydi" % kind)
+    if kind == FIFOQueue.kind and min_cost != max_cost:
+        raise ValueError("fifo navbati faqat bir xil qirra narxlarida to'g'ri (narxlar %s..%s)" % (min_cost, max_cost))
+    if kind == BucketQueue.kind and not (integer and min_cost >= 0):
+        raise ValueError("bucket navbati faqat manfiy bo'lmagan butun narxlar bilan ishlaydi")
+
+def make_queue(kind, n, min_cost=1, max_cost=1, integer=True, monotone=True):
+    check_queue(kind, min_cost, max_cost, integer, monotone)
+    if kind == "auto":
+        kind = pick_queue(min_cost, max_cost, integer, monotone)
+    if kind == BucketQueue.kind:
+        return BucketQueue(n, max(int(max_cost), 1))
+    return QUEUES[kind](n)
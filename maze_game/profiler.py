@@ -0,0 +1,102 @@
+"""Kadr profilerlash: bo'limlar bo'yicha vaqt, solver hisoblagichlari va log.
+
+Asosiy tsikl har bo'lim oxirida ``lap(nom)`` chaqiradi; oldingi
+``lap``/``begin_frame`` dan beri o'tgan vaqt shu bo'limga yoziladi (bitta
+bo'limga bir kadrda bir necha marta yozish mumkin). ``end_frame()``
+kadrni oxirgi ``window`` kadrlik oynaga qo'shadi va log fayliga bitta CSV
+qator yozadi. Log ``RotatingFileHandler`` bilan aylanadi, shuning uchun
+hajmi chegaralangan.
+
+    prof = FrameProfiler()
+    prof.open_log("profile.log")          # ixtiyoriy
+    prof.begin_frame()
+    camera.update(...); prof.lap("camera")
+    ...
+    prof.end_frame()
+    prof.summary()["fps"]
+
+``cache`` ga ``solvecache.SolveCache.stats`` berilsa ``summary()["cache"]``
+da hit rate va xotira ham bo'ladi.
+"""
+import logging
+import logging.handlers
+import time
+from collections import deque
+
+SECTIONS = ("input", "camera", "player", "search", "crowd", "draw_all", "display")
+COUNTERS = ("pushed", "expanded", "stale")
+
+class FrameProfiler:
+    def __init__(self, window=120):
+        self.frames = deque(maxlen=window)
+        self.starts = deque(maxlen=window)
+        self.counters = None        # solver.stats kabi lug'at (jonli)
+        self.cache = None           # solvecache.SolveCache.stats (jonli)
+        self.current = dict.fromkeys(SECTIONS, 0.0)
+        self.last = 0.0
+        self.frame_no = 0
+        self.log = None
+        self.handler = None
+
+    def open_log(self, path, max_bytes=1 << 20, backups=3):
+        """Har kadrni ``path`` ga CSV qator sifatida yozishni boshlaydi."""
+        self.close()
+        self.log = logging.getLogger("maze_game.profile")
+        self.log.setLevel(logging.INFO)
+        self.log.propagate = False
+        self.handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups)
+        self.log.addHandler(self.handler)
+        self.log.info("frame,time," + ",".join(SECTIONS) + ",total_ms," + ",".join(COUNTERS))
+
+    def close(self):
+        if self.log is not None:
+            self.log.removeHandler(self.handler)
+            self.handler.close()
+            self.log = self.handler = None
+
+    def begin_frame(self):
+        now = time.perf_counter()
+        self.starts.append(now)
+        self.current = dict.fromkeys(SECTIONS, 0.0)
+        self.last = now
+
+    def lap(self, section):
+        now = time.perf_counter()
+        self.current[section] = self.current.get(section, 0.0) + now - self.last
+        self.last = now
+
+    def end_frame(self):
+        frame = self.current
+        frame["total"] = self.last - self.starts[-1] if self.starts else 0.0
+        self.frames.append(frame)
+        self.frame_no += 1
+        if self.log is not None:
+            counters = self.counters or {}
+            self.log.info("%d,%.3f,%s,%.3f,%s" % (
+                self.frame_no, time.time(),
+                ",".join("%.3f" % (frame[name] * 1000) for name in SECTIONS),
+                frame["total"] * 1000,
+                ",".join(str(counters.get(name, 0)) for name in COUNTERS)))
+
+    def summary(self):
+        """Oyna bo'yicha o'rtacha qiymatlar: ``fps``, ``total_ms`` va har bo'lim (ms).
+
+        Kadr hali bo'lmasa ham barcha bo'lim va hisoblagich kalitlari bor (nol).
+        """
+        frames = self.frames
+        result = {"fps": 0.0, "total_ms": 0.0}
+        result.update(dict.fromkeys(SECTIONS, 0.0))
+        counters = self.counters or {}
+        for name in COUNTERS:
+            result[name] = counters.get(name, 0)
+        if self.cache is not None:
+            result["cache"] = dict(self.cache)
+        if not frames:
+            return result
+        if len(self.starts) > 1:
+            period = (self.starts[-1] - self.starts[0]) / (len(self.starts) - 1)
+            result["fps"] = 1 / period if period > 0 else 0.0
+        n = len(frames)
+        for name in SECTIONS + ("total",):
+            result[name + "_ms" if name == "total" else name] = sum(f.get(name, 0.0) for f in frames) * 1000 / n
+        return result
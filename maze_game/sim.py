@@ -0,0 +1,498 @@
+"""Qat'iy qadamli (fixed-timestep) simulyatsiya, kiritishlarni yozish va qayta ijro.
+
+O'yin holati (labirint, start/finish, qidiruv, D* Lite, player) tik (tick)
+bo'yicha o'zgaradi: har tikda player bir qadam suriladi va qidiruv
+``steps_per_tick`` ta tugunga davom etadi. Vaqt byudjeti ishlatilmaydi,
+shuning uchun natija faqat kiritishlarga bog'liq. ``main`` shu tiklarni
+real vaqtga (``TICK_RATE``) bog'lab bajaradi, ``Simulation`` esa pygame'siz
+istalgan tezlikda.
+
+``Recorder`` seed, daraja va har bir kiritishni (devor chizish, relyef,
+finish, SPACE, R/G/A/I/D/+-) tik raqami bilan yozadi; ``replay()`` logni
+o'qib aynan shu holatga keladi (``--render`` bilan oynada ko'rsatadi).
+
+    python sim.py session.rec              # headless, tik/s va digest
+    python sim.py session.rec --render     # pygame oynasida
+    python sim.py --soak 1000              # tasodifiy sessiyalar, replay mosligi
+"""
+import argparse
+import hashlib
+import json
+import math
+import random
+import struct
+import sys
+import time
+
+import core
+import distfield
+import hpa
+import incremental
+import mazegen
+import solvecache
+import solvers
+
+TICK_RATE = 60                  # main'da soniyasiga tiklar
+SEARCH_STEPS_PER_TICK = 2
+PLAYER_SPEED = 15               # piksel/tik (katak o'lchami CELL_SIZE piksel)
+
+# ---------------- PLAYER ----------------
+class Walker:
+    """Player harakati (pygame'siz): yo'l bo'ylab har tikda ``speed`` piksel."""
+
+    def __init__(self, start_node, cell_size=None):
+        self.cell_size = start_node.grid.cell_size if cell_size is None else cell_size
+        half = self.cell_size // 2
+        self.current_node = start_node
+        self.x = start_node.x + half
+        self.y = start_node.y + half
+        self.path = []
+        self.index = 0
+        self.speed = PLAYER_SPEED
+        self.moving = False
+
+    def start(self, path):
+        self.path = path
+        self.index = 1
+        self.moving = True
+
+    def update(self):
+        if not self.moving or self.index >= len(self.path):
+            self.moving = False
+            return
+
+        half = self.cell_size // 2
+        target = self.path[self.index]
+        tx = target.x + half
+        ty = target.y + half
+
+        dx = tx - self.x
+        dy = ty - self.y
+        dist = math.hypot(dx, dy)
+
+        if dist < self.speed:
+            self.x, self.y = tx, ty
+            self.current_node = target
+            self.index += 1
+        else:
+            self.x += dx / dist * self.speed
+            self.y += dy / dist * self.speed
+
+# ---------------- UMUMIY QADAMLAR ----------------
+def build_level(grid, generator, extra_paths, seed, fields=None):
+    """Labirint, start (1, 1) va tasodifiy finish; ``(start, finish)`` qaytaradi."""
+    rng = random.Random(seed)
+    mazegen.generate(grid, generator, rng)
+    mazegen.add_extra_paths(grid, extra_paths, rng)
+    start = grid[1][1]
+    start.start = True
+    field = fields.get(grid, start.idx) if fields is not None else distfield.DistanceField(grid, start.idx)
+    finish = core.random_finish(grid, start, rng, field.dist)
+    finish.finish = True
+    return start, finish
+
+def step_search(solver, grid, max_steps=None):
+    """Qidiruvni ``max_steps`` tugunga davom ettiradi (None - oxirigacha).
+
+    Joriy tugunni ``is_current`` bilan belgilaydi; tugagan bo'lsa True.
+    """
+    last = solver.current
+    done = solver.advance(max_steps)
+    if last != -1:
+        grid.node(last).is_current = False
+    if not done and solver.current != -1:
+        grid.node(solver.current).is_current = True
+    return done
+
+def repair_path(planner, player, grid, start, cells):
+    """Devorlari o'zgargan kataklar uchun player yo'lini qayta quradi.
+
+    Player yurayotgan bo'lsa yo'l uning joriy tugunidan, yetib borgan
+    bo'lsa esa ``start`` dan tuziladi. Yo'l qolmagan bo'lsa False qaytaradi.
+    """
+    origin = player.current_node if player.moving else start
+    planner.move_start(origin.idx)
+    planner.update_cells(cells)
+    planner.compute()
+    idxs = planner.path()
+    if idxs is None:
+        player.path = []
+        player.moving = False
+        return False
+
+    path = [grid.node(i) for i in idxs]
+    if player.moving:
+        player.start(path)
+    else:
+        player.path = path
+        player.index = len(path)
+    return True
+
+# ---------------- SIMULYATSIYA ----------------
+class Simulation:
+    """``main`` o'yin holatining pygame'siz nusxasi, tiklar bilan boshqariladi."""
+
+    def __init__(self, level="Medium", generator="backtracker", seed=0, algorithm="dijkstra",
+                 steps_per_tick=SEARCH_STEPS_PER_TICK, instant=False, repair=True,
+                 view_cls=None, player_cls=Walker):
+        self.view_cls = view_cls
+        self.player_cls = player_cls
+        self.algorithm = algorithm
+        self.steps_per_tick = steps_per_tick
+        self.instant = instant
+        self.repair = repair
+        self.level = level
+        self.generator = generator
+        self.fields = distfield.FieldCache()
+        self.solves = solvecache.SolveCache()
+        self.solve_key = None           # davom etayotgan qidiruvning kesh kaliti
+        self.grid = None
+        self.tick = 0
+        self.reset(seed)
+
+    def reset(self, seed):
+        """Joriy daraja va generator bilan yangi labirint (R tugmasi)."""
+        cfg = core.LEVELS[self.level]
+        rows, cols, cell_size = cfg["ROWS"], cfg["COLS"], cfg["CELL_SIZE"]
+        grid = self.grid
+        if grid is not None and (grid.rows, grid.cols, grid.cell_size) == (rows, cols, cell_size):
+            grid.reset()
+        else:
+            grid = self.grid = core.CompactGrid(rows, cols, cell_size, self.view_cls)
+        start, finish = build_level(grid, self.generator, cfg["EXTRA_PATHS"], seed, self.fields)
+        self.use_grid(grid, start, finish, seed)
+
+    def use_grid(self, grid, start, finish, seed=None):
+        """Tayyor grid bilan boshlaydi (masalan fayldan ochilgan labirint)."""
+        self.grid = grid
+        self.start = start
+        self.finish = finish
+        self.seed = seed
+        self.player = self.player_cls(start)
+        self.started = False
+        self.solver = None
+        self.planner = None
+
+    # ---------------- KIRITISHLAR ----------------
+    def paint(self, idx, wall):
+        """Devor qo'yadi/oladi; o'zgargan bo'lsa True."""
+        node = self.grid.node(idx)
+        if node.start or node.finish or node.wall == bool(wall):
+            return False
+        node.wall = bool(wall)
+        if wall:
+            node.is_path = False
+        self.solves.wall_changed(self.grid, idx)
+        hpa.update_walls(self.grid, [idx])
+        if self.planner is not None and not repair_path(self.planner, self.player, self.grid, self.start, [idx]):
+            self.planner = None
+            self.started = False
+        return True
+
+    def set_terrain(self, idx, kind):
+        """Yo'lak relyefini o'zgartiradi; o'zgargan bo'lsa True."""
+        node = self.grid.node(idx)
+        if node.start or node.finish or node.wall:
+            return False
+        old = self.grid.terrain[idx]
+        if not self.grid.set_terrain(idx, kind):
+            return False
+        self.solves.terrain_changed(self.grid, idx, old)
+        # D* Lite har qadamni 1 deb hisoblaydi: relyefli xaritada u yo'lni buzadi
+        self.planner = None
+        return True
+
+    def set_finish(self, idx):
+        """Finishni ko'chiradi; qabul qilinsa True."""
+        node = self.grid.node(idx)
+        if node.start or node.wall:
+            return False
+        core.clear_old_finish(self.grid)
+        node.finish = True
+        self.finish = node
+        self.started = False
+        self.solver = None
+        self.planner = None
+        self.player = self.player_cls(self.start)
+        return True
+
+    def space(self):
+        """SPACE: qidiruvni boshlaydi (INSTANT va bir xil narxlarda masofa maydonidan).
+
+        Yechim keshda bo'lsa yo'l darhol olinadi. Player finishga yetib
+        to'xtagan bo'lsa u startga qaytadi va yo'l qaytadan olinadi (odatda
+        keshdan). Boshlangan solver, ``DistanceField`` yoki
+        ``solvecache.Solved`` ni qaytaradi (hammasida ``stats`` bor),
+        boshlab bo'lmasa None.
+        """
+        if self.player.moving or self.solver is not None or self.finish is None or self.finish.wall:
+            return None
+        if self.started:
+            self.player = self.player_cls(self.start)
+            self.started = False
+            self.planner = None
+        grid = self.grid
+        lo, hi = grid.cost_range()
+        if self.instant and lo == hi:
+            field = self.fields.get(grid, self.start.idx)
+            idxs = field.path_to(self.finish.idx)
+            grid.reset_search()
+            if idxs:
+                self.follow_path([grid.node(i) for i in idxs])
+            return field
+        key = self.solves.key(grid, self.start.idx, self.finish.idx, self.algorithm)
+        hit = self.solves.get(key)
+        if hit is not None:
+            grid.reset_search()
+            if hit.path:
+                self.follow_path([grid.node(i) for i in hit.path])
+            return hit
+        self.solver = solvers.make_solver(grid, self.start.idx, self.finish.idx, self.algorithm)
+        self.solve_key = key
+        return self.solver
+
+    def follow_path(self, path):
+        self.player.start(path)
+        self.started = True
+        # D* Lite har qadamni 1 deb hisoblaydi, relyefli xaritada ishlatilmaydi
+        lo, hi = self.grid.cost_range()
+        if self.repair and lo == hi:
+            self.planner = incremental.DStarLite(self.grid, self.start.idx, self.finish.idx)
+            self.planner.compute()
+        else:
+            self.planner = None
+
+    # ---------------- TIK ----------------
+    def step(self, lap=None):
+        """Bitta tik: player harakati, keyin qidiruv qadamlari.
+
+        Qidiruv shu tikda tugasa solverni qaytaradi. ``lap(bo'lim)`` berilsa
+        har qismdan keyin chaqiriladi (``profiler.FrameProfiler.lap``).
+        """
+        if self.player.moving:
+            self.player.update()
+        if lap: lap("player")
+        solver = self.solver
+        finished = None
+        if solver is not None and step_search(solver, self.grid, None if self.instant else self.steps_per_tick):
+            self.solver = None
+            finished = solver
+            # Qidiruv davomida devor/relyef o'zgarmagan bo'lsagina keshga
+            if self.solves.key(self.grid, solver.start, solver.goal, self.algorithm) == self.solve_key:
+                self.solves.put(self.solve_key, solver)
+            if solver.path:
+                self.follow_path([self.grid.node(i) for i in solver.path])
+        if lap: lap("search")
+        self.tick += 1
+        return finished
+
+    def busy(self):
+        return self.solver is not None or self.player.moving
+
+    def apply(self, kind, a=0, b=0, names=None):
+        """Yozilgan bitta kiritishni bajaradi (``Recorder`` hodisasi).
+
+        PAINT/TERRAIN/FINISH/SPACE uchun tegishli metodning natijasini qaytaradi.
+        """
+        names = names or default_names()
+        if kind == PAINT:
+            return self.paint(a, b)
+        elif kind == TERRAIN:
+            return self.set_terrain(a, b)
+        elif kind == FINISH:
+            return self.set_finish(a)
+        elif kind == SPACE:
+            return self.space()
+        elif kind == RESET:
+            self.reset(b)
+        elif kind == LEVEL:
+            self.level = names["levels"][a]
+        elif kind == GENERATOR:
+            self.generator = names["generators"][a]
+        elif kind == ALGORITHM:
+            self.algorithm = names["algorithms"][a]
+        elif kind == SPEED:
+            self.steps_per_tick = a
+        elif kind == INSTANT:
+            self.instant = bool(a)
+        elif kind == REPAIR:
+            self.repair = bool(a)
+            if not a:
+                self.planner = None
+        else:
+            raise ValueError("Noma'lum hodisa turi: %r" % kind)
+        return None
+
+    def digest(self):
+        """Holatning qisqa xeshi: ikki ijro bir xil bo'lsa, digest ham bir xil."""
+        grid, player = self.grid, self.player
+        h = hashlib.sha1()
+        h.update(bytes(grid.walls))
+        h.update(bytes(grid.terrain))
+        h.update(bytes(grid.marks))
+        h.update(repr((self.tick, self.seed, [n.idx for n in player.path], player.index,
+                       player.x, player.y, self.started)).encode())
+        return h.hexdigest()[:16]
+
+# ---------------- YOZISH VA O'QISH ----------------
+MAGIC = b"MREC"
+VERSION = 1
+EVENT = struct.Struct("<IBiI")     # tik, tur, a, b
+
+# hodisa turlari
+PAINT, TERRAIN, FINISH, SPACE, RESET, LEVEL, GENERATOR, ALGORITHM, SPEED, INSTANT, REPAIR = range(1, 12)
+
+def default_names():
+    """Indekslar bilan yoziladigan nomlar (LEVEL/GENERATOR/ALGORITHM hodisalari)."""
+    return {"levels": list(core.LEVELS), "generators": list(mazegen.GENERATORS),
+            "algorithms": list(solvers.SOLVERS)}
+
+class Recorder:
+    """Kiritishlarni tik raqami bilan yig'adi va ixcham binar faylga yozadi.
+
+    Fayl: ``MAGIC``, versiya, sarlavha JSON uzunligi va o'zi (seed, daraja,
+    sozlamalar, nomlar jadvali), keyin har hodisa ``EVENT`` (13 bayt).
+    """
+
+    def __init__(self, **header):
+        self.header = dict(header, names=default_names())
+        self.events = []
+
+    def record(self, tick, kind, a=0, b=0):
+        self.events.append((tick, kind, a, b))
+
+    def index(self, table, name):
+        return self.header["names"][table].index(name)
+
+    def save(self, filename):
+        data = json.dumps(self.header).encode()
+        with open(filename, "wb") as f:
+            f.write(MAGIC + struct.pack("<HI", VERSION, len(data)) + data)
+            for event in self.events:
+                f.write(EVENT.pack(*event))
+
+def load(filename):
+    """Yozuvni o'qiydi: ``(header, events)``."""
+    with open(filename, "rb") as f:
+        data = f.read()
+    if data[:4] != MAGIC:
+        raise ValueError("%s: yozuv fayli emas" % filename)
+    version, size = struct.unpack_from("<HI", data, 4)
+    if version != VERSION:
+        raise ValueError("%s: noma'lum versiya %d" % (filename, version))
+    offset = 10 + size
+    header = json.loads(data[10:offset])
+    events = [EVENT.unpack_from(data, pos) for pos in range(offset, len(data) - EVENT.size + 1, EVENT.size)]
+    return header, events
+
+def simulation_for(header, **kwargs):
+    return Simulation(header["level"], header["generator"], header["seed"], header["algorithm"],
+                      header["steps_per_tick"], header["instant"], header["repair"], **kwargs)
+
+def replay(header, events, settle=True, on_tick=None, **kwargs):
+    """Hodisalarni o'z tiklarida bajaradi; ``settle`` - oxirida player to'xtaguncha davom etadi.
+
+    ``on_tick(sim)`` har tikdan keyin chaqiriladi (masalan chizish uchun).
+    """
+    sim = simulation_for(header, **kwargs)
+    names = header["names"]
+    for tick, kind, a, b in events:
+        while sim.tick < tick:
+            sim.step()
+            if on_tick: on_tick(sim)
+        sim.apply(kind, a, b, names)
+    while settle and sim.busy():
+        sim.step()
+        if on_tick: on_tick(sim)
+    return sim
+
+# ---------------- SOAK TEST ----------------
+def random_session(seed, level="Medium", events=40):
+    """Tasodifiy kiritishlar bilan ``Recorder`` (soak testlar uchun)."""
+    rng = random.Random(seed)
+    rec = Recorder(level=level, generator="backtracker", seed=seed, algorithm="dijkstra",
+                   steps_per_tick=rng.choice((2, 16, 64)), instant=False, repair=True)
+    cfg = core.LEVELS[level]
+    n = cfg["ROWS"] * cfg["COLS"]
+    tick = 0
+    for _ in range(events):
+        tick += rng.randint(0, 30)
+        roll = rng.random()
+        if roll < 0.5:
+            rec.record(tick, PAINT, rng.randrange(n), rng.random() < 0.7)
+        elif roll < 0.6:
+            rec.record(tick, TERRAIN, rng.randrange(n), rng.randrange(len(core.TERRAIN_COSTS)))
+        elif roll < 0.75:
+            rec.record(tick, FINISH, rng.randrange(n))
+        elif roll < 0.95:
+            rec.record(tick, SPACE)
+        else:
+            rec.record(tick, ALGORITHM, rng.randrange(len(rec.header["names"]["algorithms"])))
+    return rec
+
+def soak(count, seed=0, level="Medium"):
+    """``count`` ta tasodifiy sessiya; har biri ikki marta ijro etilib digestlar solishtiriladi."""
+    t0 = time.perf_counter()
+    ticks = 0
+    for i in range(count):
+        rec = random_session(seed + i, level)
+        a = replay(rec.header, rec.events)
+        b = replay(rec.header, rec.events)
+        if a.digest() != b.digest():
+            raise AssertionError("sessiya %d: replay mos kelmadi (%s != %s)" % (seed + i, a.digest(), b.digest()))
+        ticks += a.tick + b.tick
+    elapsed = time.perf_counter() - t0
+    return {"sessions": count, "ticks": ticks, "seconds": elapsed,
+            "sessions_per_min": count * 60 / elapsed if elapsed else 0.0}
+
+# ---------------- CLI ----------------
+def render_replay(header, events):
+    """Yozuvni pygame oynasida ``main`` renderer'i bilan ko'rsatadi."""
+    import pygame
+    import main
+
+    state = {"level": None, "camera": None}
+
+    def on_tick(sim):
+        if state["level"] != sim.level or state["camera"] is None or sim.grid is not state.get("grid"):
+            main.update_global_level(sim.level)
+            state.update(level=sim.level, grid=sim.grid,
+                         camera=main.Camera(main.WIDTH, main.HEIGHT, main.COLS * main.CELL_SIZE, main.ROWS * main.CELL_SIZE))
+        pygame.event.pump()
+        camera = state["camera"]
+        camera.update(sim.player.get_rect())
+        path = sim.player.path if not sim.player.moving and sim.player.index > 0 else None
+        main.present(main.draw_all(main.WIN, sim.grid, sim.player, camera, [], path, show=False))
+        main.CLOCK.tick(TICK_RATE)
+
+    return replay(header, events, on_tick=on_tick, view_cls=main.CellView, player_cls=main.Player)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("record", nargs="?", help="main.RECORD_FILE kabi yozuv fayli")
+    parser.add_argument("--render", action="store_true", help="pygame oynasida ko'rsatish")
+    parser.add_argument("--soak", type=int, help="shuncha tasodifiy sessiyani ikki martadan ijro etish")
+    parser.add_argument("--level", choices=list(core.LEVELS), default="Medium")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.soak:
+        result = soak(args.soak, args.seed, args.level)
+        print("%(sessions)d sessiya, %(ticks)d tik, %(seconds).2f s, %(sessions_per_min).0f sessiya/min" % result)
+        return 0
+    if not args.record:
+        parser.error("yozuv fayli yoki --soak kerak")
+
+    header, events = load(args.record)
+    t0 = time.perf_counter()
+    sim = render_replay(header, events) if args.render else replay(header, events)
+    elapsed = time.perf_counter() - t0
+    print("%d hodisa, %d tik, %.3f s (%.0f tik/s), digest %s" % (
+        len(events), sim.tick, elapsed, sim.tick / elapsed if elapsed else 0.0, sim.digest()))
+    cache = sim.solves.stats
+    print("yechimlar keshi: hit %.0f%% (%d/%d), %d ta, %.1f KiB" % (
+        cache["hit_rate"] * 100, cache["hits"], cache["hits"] + cache["misses"], cache["entries"], cache["bytes"] / 1024))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
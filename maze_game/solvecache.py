@@ -0,0 +1,170 @@
+"""Labirint mazmuni bo'yicha yechimlar keshi.
+
+Bir labirintda SPACE qayta bosilganda yoki finish bir necha katak orasida
+almashtirilganda qidiruv boshidan qilinmaydi: yechim ``(xesh, start,
+finish, algoritm)`` kaliti bilan LRU keshda saqlanadi va keyingi safar
+yo'l darhol qaytariladi.
+
+``LayoutHash`` - devorlar va relyefning Zobrist xeshi: har katak (va har
+relyef turi) uchun tasodifiy 64 bitli kalit, xesh - to'ldirilgan kataklar
+kalitlarining XOR'i. Bitta katak o'zgarganda xesh ``O(1)`` da yangilanadi
+(``wall_changed``/``terrain_changed``), boshqa har qanday o'zgarish
+(``grid.reset``, generator) ``wall_version``/``terrain_version`` orqali
+seziladi va xesh qaytadan hisoblanadi. Kalit mazmunga bog'liq, shuning
+uchun devorni qo'yib, keyin olib tashlasa ham eski yechim topiladi.
+
+    cache = SolveCache()
+    key = cache.key(grid, start, finish, "astar")
+    hit = cache.get(key)                  # Solved yoki None
+    ...
+    cache.put(key, solver)                # qidiruv tugagach
+    cache.stats["hit_rate"], cache.stats["bytes"]
+"""
+import operator
+import random
+import sys
+from array import array
+from collections import OrderedDict
+from functools import reduce
+from itertools import compress
+
+import core
+
+SOLVE_CACHE_SIZE = 64               # yechimlar soni
+SOLVE_CACHE_BYTES = 4 << 20         # yo'llar uchun taxminiy xotira chegarasi
+ZOBRIST_SEED = 0x5EED
+
+# (katak soni, qatlam) -> kalitlar; qatlam 0 - devorlar, k - relyef turi k
+_KEYS = {}
+# relyef turi k bo'lgan kataklarni 1 ga, qolganlarini 0 ga aylantiradi
+_SELECT = [bytes(int(i == kind) for i in range(256)) for kind in range(len(core.TERRAIN_COSTS))]
+
+def zobrist_keys(n, layer=0):
+    """``n`` ta katak uchun 64 bitli kalitlar (``array('Q')``), o'lcham bo'yicha bir marta."""
+    keys = _KEYS.get((n, layer))
+    if keys is None:
+        rng = random.Random(ZOBRIST_SEED * 31 + n * 8 + layer)
+        keys = _KEYS[(n, layer)] = array('Q', rng.randbytes(8 * n))
+    return keys
+
+def _xor(keys, selectors):
+    # compress va reduce C'da: katak bo'yicha Python tsikli yo'q
+    return reduce(operator.xor, compress(keys, selectors), 0)
+
+class LayoutHash:
+    def __init__(self, grid):
+        self.grid = grid
+        self.rehashes = 0
+        self.rehash()
+
+    def rehash(self):
+        grid = self.grid
+        n = grid.rows * grid.cols
+        value = _xor(zobrist_keys(n), grid.walls)
+        for kind in range(1, len(_SELECT)):
+            if kind in grid.terrain:
+                value ^= _xor(zobrist_keys(n, kind), grid.terrain.translate(_SELECT[kind]))
+        self.value = value
+        self.wall_version = (id(grid.walls), grid.wall_version)
+        self.terrain_version = (id(grid.terrain), grid.terrain_version)
+        self.rehashes += 1
+
+    def current(self):
+        """Joriy xesh (devorlar/relyef kutilmaganda o'zgargan bo'lsa qayta hisoblanadi)."""
+        grid = self.grid
+        if (self.wall_version != (id(grid.walls), grid.wall_version)
+                or self.terrain_version != (id(grid.terrain), grid.terrain_version)):
+            self.rehash()
+        return self.value
+
+    def wall_changed(self, idx):
+        """``idx`` katagining devori hozirgina almashtirildi (``NodeView.wall`` orqali)."""
+        grid = self.grid
+        walls_id, version = self.wall_version
+        if walls_id == id(grid.walls) and grid.wall_version == version + 1:
+            self.value ^= zobrist_keys(grid.rows * grid.cols)[idx]
+            self.wall_version = (walls_id, version + 1)
+
+    def terrain_changed(self, idx, old):
+        """``idx`` katagining relyefi ``old`` dan hozirgisiga ``set_terrain`` bilan o'zgardi."""
+        grid = self.grid
+        terrain_id, version = self.terrain_version
+        if terrain_id == id(grid.terrain) and grid.terrain_version == version + 1:
+            n = grid.rows * grid.cols
+            if old:
+                self.value ^= zobrist_keys(n, old)[idx]
+            if grid.terrain[idx]:
+                self.value ^= zobrist_keys(n, grid.terrain[idx])[idx]
+            self.terrain_version = (terrain_id, version + 1)
+
+class Solved:
+    """Keshdagi yechim; solver kabi ``name``, ``path`` va ``stats`` ga ega."""
+    __slots__ = ("name", "path", "stats", "size")
+
+    def __init__(self, solver):
+        self.name = solver.name
+        self.path = None if solver.path is None else array('i', solver.path)
+        self.stats = dict(solver.stats)
+        self.size = sys.getsizeof(self.path) + sys.getsizeof(self.stats)
+
+class SolveCache:
+    """``(xesh, o'lcham, start, finish, algoritm)`` -> ``Solved`` (LRU)."""
+
+    def __init__(self, maxsize=SOLVE_CACHE_SIZE, max_bytes=SOLVE_CACHE_BYTES):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.layout = None
+        self.stats = {"hits": 0, "misses": 0, "hit_rate": 0.0, "entries": 0, "bytes": 0,
+                      "evicted": 0, "rehashes": 0}
+
+    def layout_for(self, grid):
+        if self.layout is None or self.layout.grid is not grid:
+            self.layout = LayoutHash(grid)
+            self.stats["rehashes"] += 1
+        return self.layout
+
+    def key(self, grid, start, finish, algorithm):
+        layout = self.layout_for(grid)
+        rehashes = layout.rehashes
+        value = layout.current()
+        self.stats["rehashes"] += layout.rehashes - rehashes
+        return (value, grid.rows, grid.cols, start, finish, algorithm)
+
+    def wall_changed(self, grid, idx):
+        if self.layout is not None and self.layout.grid is grid:
+            self.layout.wall_changed(idx)
+
+    def terrain_changed(self, grid, idx, old):
+        if self.layout is not None and self.layout.grid is grid:
+            self.layout.terrain_changed(idx, old)
+
+    def get(self, key):
+        stats = self.stats
+        entry = self.entries.get(key)
+        if entry is None:
+            stats["misses"] += 1
+        else:
+            self.entries.move_to_end(key)
+            stats["hits"] += 1
+        stats["hit_rate"] = stats["hits"] / (stats["hits"] + stats["misses"])
+        return entry
+
+    def put(self, key, solver):
+        """Tugagan solver natijasini saqlaydi; ``Solved`` qaytaradi."""
+        stats = self.stats
+        old = self.entries.pop(key, None)
+        if old is not None:
+            stats["bytes"] -= old.size
+        entry = self.entries[key] = Solved(solver)
+        stats["bytes"] += entry.size
+        while len(self.entries) > self.maxsize or (stats["bytes"] > self.max_bytes and len(self.entries) > 1):
+            _, old = self.entries.popitem(last=False)
+            stats["bytes"] -= old.size
+            stats["evicted"] += 1
+        stats["entries"] = len(self.entries)
+        return entry
+
+    def clear(self):
+        self.entries.clear()
+        self.stats["entries"] = self.stats["bytes"] = 0
@@ -0,0 +1,675 @@
+"""Almashtiriladigan qidiruv algoritmlari (Dijkstra, A*, BFS, ikki tomonlama).
+
+Barcha solverlar ``core.CompactGrid`` buferlari ustida indekslar bilan
+ishlaydi: ``walls``, ``state``, ``distance`` va ``prev``. Shu sababli UI
+qidiruv jarayonini o'sha grid orqali ko'ra oladi, batch ishlar esa pygame'siz
+ishlatadi.
+
+Har bir solver ``steps()`` generatoriga ega: u har bir kengaytirilgan
+(expanded) tugun indeksini ``yield`` qiladi. ``advance()`` qidiruvni
+berilgan qadamlar soni yoki vaqt byudjeti bo'yicha davom ettiradi (UI har
+kadrda shuni chaqiradi), ``run()`` esa oxirigacha bajaradi va ``path``
+(indekslar ro'yxati) qaytaradi. Chizish hech qachon qidiruv ichida emas.
+"""
+import heapq
+import time
+from array import array
+from collections import OrderedDict, deque
+from itertools import islice
+
+import core
+import pqueue
+from core import INF, IN_QUEUE, PROCESSED
+
+def open_neighbors(walls, rows, cols, idx):
+    """Devor bo'lmagan 4 ta qo'shni indekslarini qaytaradi."""
+    res = []
+    c = idx % cols
+    if idx + cols < rows * cols and not walls[idx + cols]:
+        res.append(idx + cols)
+    if idx >= cols and not walls[idx - cols]:
+        res.append(idx - cols)
+    if c < cols - 1 and not walls[idx + 1]:
+        res.append(idx + 1)
+    if c > 0 and not walls[idx - 1]:
+        res.append(idx - 1)
+    return res
+
+def manhattan(a, b, cols):
+    return abs(a // cols - b // cols) + abs(a % cols - b % cols)
+
+def walk_prev(prev, end):
+    path = []
+    cur = end
+    while cur != -1:
+        path.append(cur)
+        cur = prev[cur]
+    return path[::-1]
+
+# ---------------- BASE ----------------
+class Search:
+    """Qidiruv bazasi. Kichik klasslar ``steps()`` ni yozadi.
+
+    ``queue`` - ustuvorlik navbati turi (``pqueue.QUEUES`` yoki "auto");
+    uni ishlatmaydigan solverlar e'tiborsiz qoldiradi. ``monotone`` -
+    kalitlar chiqarilish tartibida kamaymaydimi (FIFO/chelaklar sharti).
+    ``weighted`` solverlar relyef narxlarini (``grid.costs()``) hisobga
+    oladi, qolganlari har qadamni 1 deb, eng kam qadamli yo'lni topadi.
+    """
+    name = "base"
+    queue = "auto"
+    monotone = True
+    weighted = False
+
+    def __init__(self, grid, start, goal, queue=None):
+        self.grid = grid
+        self.start = start
+        self.goal = goal
+        if queue is not None:
+            self.queue = queue
+        self.path = None
+        self.done = False
+        self.current = -1
+        self.stats = core.new_stats()
+        self._steps = None
+        grid.reset_search()
+
+    def steps(self):
+        raise NotImplementedError
+
+    def edge_costs(self):
+        """Qirra narxlari: ``(eng kichik, eng katta, hammasi butunmi)``."""
+        if not self.weighted:
+            return 1, 1, True
+        lo, hi = self.grid.cost_range()
+        return lo, hi, True
+
+    def make_queue(self, kind=None):
+        return pqueue.make_queue(kind or self.queue, self.grid.rows * self.grid.cols,
+                                 *self.edge_costs(), monotone=self.monotone)
+
+    def finish(self, path):
+        self.path = path
+        self.done = True
+        if path:
+            self.stats["path_length"] = len(path)
+
+    def advance(self, max_steps=None, budget=None):
+        """Qidiruvni davom ettiradi va tugagan-tugamaganini qaytaradi.
+
+        ``max_steps`` - eng ko'pi bilan nechta tugun kengaytiriladi,
+        ``budget`` - soniyalardagi vaqt chegarasi. Ikkalasi ham ``None``
+        bo'lsa, qidiruv oxirigacha bajariladi.
+        """
+        if self.done:
+            return True
+        if self._steps is None:
+            self._steps = self.steps()
+        steps = self._steps
+
+        t0 = time.perf_counter()
+        if budget is None:
+            last = deque(islice(steps, max_steps), maxlen=1)
+            if last:
+                self.current = last[0]
+        else:
+            deadline = t0 + budget
+            n = 0
+            for idx in steps:
+                self.current = idx
+                n += 1
+                if n == max_steps:
+                    break
+                # Vaqtni har qadamda emas, har 32 qadamda tekshiramiz
+                if not n & 31 and time.perf_counter() >= deadline:
+                    break
+        self.stats["time"] += time.perf_counter() - t0
+        return self.done
+
+    def run(self):
+        self.advance()
+        return self.path
+
+# ---------------- DIJKSTRA ----------------
+class Dijkstra(Search):
+    name = "dijkstra"
+    weighted = True
+
+    def steps(self):
+        grid, stats = self.grid, self.stats
+        walls, state, dist, prev = grid.walls, grid.state, grid.distance, grid.prev
+        rows, cols, goal = grid.rows, grid.cols, self.goal
+        costs = grid.costs()
+
+        # Navbat narxlarga qarab tanlanadi: bir xil -> FIFO, kichik butun -> chelaklar
+        pq = self.make_queue()
+        push, pop = pq.push, pq.pop
+        dist[self.start] = 0
+        push(self.start, 0)
+        stats["pushed"] += 1
+
+        while pq:
+            cur = pop()
+            state[cur] |= PROCESSED
+            stats["expanded"] += 1
+            yield cur
+
+            if cur == goal:
+                break
+
+            d = dist[cur]
+            for nb in open_neighbors(walls, rows, cols, cur):
+                if state[nb] & PROCESSED:
+                    continue
+                nd = d + costs[nb]
+                if nd < dist[nb]:
+                    dist[nb] = nd
+                    prev[nb] = cur
+                    push(nb, nd)
+                    state[nb] |= IN_QUEUE
+                    stats["pushed"] += 1
+
+        stats["stale"] += pq.stale
+        self.finish(walk_prev(prev, goal) if state[goal] & PROCESSED else None)
+
+# ---------------- A* ----------------
+class AStar(Search):
+    name = "astar"
+    # Teng f da h kichigi oldin: kalit monoton emas, FIFO/chelaklar to'g'ri kelmaydi
+    monotone = False
+    weighted = True
+
+    def steps(self):
+        grid, stats = self.grid, self.stats
+        walls, state, dist, prev = grid.walls, grid.state, grid.distance, grid.prev
+        rows, cols, goal = grid.rows, grid.cols, self.goal
+        gr, gc = divmod(goal, cols)
+        costs = grid.costs()
+        # Heuristika: manhattan * eng arzon katak narxi (baholash oshib ketmaydi)
+        unit = grid.cost_range()[0]
+        # Kalit bitta butun son: f * scale + h (h < scale), ya'ni teng f da
+        # h kichigi (maqsadga yaqinrog'i) oldin chiqadi
+        scale = (rows + cols) * unit + 1
+
+        pq = self.make_queue()
+        push, pop = pq.push, pq.pop
+        dist[self.start] = 0
+        h0 = manhattan(self.start, goal, cols) * unit
+        push(self.start, h0 * scale + h0)
+        stats["pushed"] += 1
+
+        while pq:
+            cur = pop()
+            state[cur] |= PROCESSED
+            stats["expanded"] += 1
+            yield cur
+
+            if cur == goal:
+                break
+
+            d = dist[cur]
+            for nb in open_neighbors(walls, rows, cols, cur):
+                if state[nb] & PROCESSED:
+                    continue
+                nd = d + costs[nb]
+                if nd < dist[nb]:
+                    dist[nb] = nd
+                    prev[nb] = cur
+                    r, c = divmod(nb, cols)
+                    h = (abs(r - gr) + abs(c - gc)) * unit
+                    push(nb, (nd + h) * scale + h)
+                    state[nb] |= IN_QUEUE
+                    stats["pushed"] += 1
+
+        stats["stale"] += pq.stale
+        self.finish(walk_prev(prev, goal) if state[goal] & PROCESSED else None)
+
+# ---------------- BFS ----------------
+class BFS(Search):
+    name = "bfs"
+
+    def steps(self):
+        grid, stats = self.grid, self.stats
+        walls, state, dist, prev = grid.walls, grid.state, grid.distance, grid.prev
+        rows, cols, goal = grid.rows, grid.cols, self.goal
+
+        dist[self.start] = 0
+        state[self.start] |= IN_QUEUE
+        queue = deque([self.start])
+        stats["pushed"] += 1
+
+        while queue:
+            cur = queue.popleft()
+            state[cur] |= PROCESSED
+            stats["expanded"] += 1
+            yield cur
+
+            if cur == goal:
+                self.finish(walk_prev(prev, goal))
+                return
+
+            nd = dist[cur] + 1
+            for nb in open_neighbors(walls, rows, cols, cur):
+                if dist[nb] == INF:
+                    dist[nb] = nd
+                    prev[nb] = cur
+                    state[nb] |= IN_QUEUE
+                    queue.append(nb)
+                    stats["pushed"] += 1
+
+        self.finish(None)
+
+# ---------------- BIDIRECTIONAL ----------------
+class _Bidirectional(Search):
+    """Ikki tomonlama qidiruvlar uchun umumiy qism.
+
+    Oldinga qidiruv ``grid.distance``/``grid.prev`` ni, orqaga qidiruv esa
+    o'zining ``dist_back``/``next_back`` buferlarini ishlatadi.
+    """
+
+    def __init__(self, grid, start, goal, queue=None):
+        super().__init__(grid, start, goal, queue)
+        n = grid.rows * grid.cols
+        self.dist_back = array('i', [INF]) * n
+        self.next_back = array('i', [-1]) * n
+
+    def join(self, meet):
+        prev, nxt = self.grid.prev, self.next_back
+        path = walk_prev(prev, meet)
+        cur = meet
+        while nxt[cur] != -1:
+            # grid.prev zanjiri goal'dan start'gacha to'g'ri bo'lib qolsin
+            prev[nxt[cur]] = cur
+            cur = nxt[cur]
+            path.append(cur)
+        return path
+
+class BidirectionalBFS(_Bidirectional):
+    name = "bidir_bfs"
+
+    def steps(self):
+        grid, stats = self.grid, self.stats
+        walls, state = grid.walls, grid.state
+        rows, cols = grid.rows, grid.cols
+        dist_f, prev_f = grid.distance, grid.prev
+        dist_b, next_b = self.dist_back, self.next_back
+
+        dist_f[self.start] = 0
+        dist_b[self.goal] = 0
+        front_f, front_b = [self.start], [self.goal]
+        stats["pushed"] += 2
+        best, meet = INF, -1
+        if self.start == self.goal:
+            best, meet = 0, self.start
+
+        while front_f and front_b and meet == -1:
+            # Kichikroq frontni bitta qatlamga kengaytiramiz
+            if len(front_f) <= len(front_b):
+                front, dist, link, other = front_f, dist_f, prev_f, dist_b
+            else:
+                front, dist, link, other = front_b, dist_b, next_b, dist_f
+            layer = []
+            for cur in front:
+                state[cur] |= PROCESSED
+                stats["expanded"] += 1
+                yield cur
+                nd = dist[cur] + 1
+                for nb in open_neighbors(walls, rows, cols, cur):
+                    if dist[nb] != INF:
+                        continue
+                    dist[nb] = nd
+                    link[nb] = cur
+                    state[nb] |= IN_QUEUE
+                    layer.append(nb)
+                    stats["pushed"] += 1
+                    if other[nb] != INF and nd + other[nb] < best:
+                        best, meet = nd + other[nb], nb
+            if front is front_f:
+                front_f = layer
+            else:
+                front_b = layer
+
+        self.finish(self.join(meet) if meet != -1 else None)
+
+class BidirectionalAStar(_Bidirectional):
+    name = "bidir_astar"
+
+    def steps(self):
+        grid, stats = self.grid, self.stats
+        walls, state = grid.walls, grid.state
+        rows, cols = grid.rows, grid.cols
+        start, goal = self.start, self.goal
+        n = rows * cols
+        closed_f, closed_b = bytearray(n), bytearray(n)
+        dist_f, prev_f = grid.distance, grid.prev
+        dist_b, next_b = self.dist_back, self.next_back
+
+        dist_f[start] = 0
+        dist_b[goal] = 0
+        h0 = manhattan(start, goal, cols)
+        pq_f, pq_b = [(h0, h0, start)], [(h0, h0, goal)]
+        stats["pushed"] += 2
+        best, meet = INF, -1
+
+        while pq_f and pq_b:
+            # Har ikki heuristika consistent: biror tomonning eng kichik f
+            # qiymati best'dan kichik bo'lmasa, best optimal.
+            if pq_f[0][0] >= best or pq_b[0][0] >= best:
+                break
+            if len(pq_f) <= len(pq_b):
+                pq, dist, link, closed, other, target = pq_f, dist_f, prev_f, closed_f, dist_b, goal
+            else:
+                pq, dist, link, closed, other, target = pq_b, dist_b, next_b, closed_b, dist_f, start
+            tr, tc = divmod(target, cols)
+
+            _, _, cur = heapq.heappop(pq)
+            if closed[cur]:
+                stats["stale"] += 1
+                continue
+            closed[cur] = 1
+            state[cur] |= PROCESSED
+            stats["expanded"] += 1
+            yield cur
+
+            nd = dist[cur] + 1
+            for nb in open_neighbors(walls, rows, cols, cur):
+                if closed[nb]:
+                    continue
+                if nd < dist[nb]:
+                    dist[nb] = nd
+                    link[nb] = cur
+                    r, c = divmod(nb, cols)
+                    h = abs(r - tr) + abs(c - tc)
+                    heapq.heappush(pq, (nd + h, h, nb))
+                    state[nb] |= IN_QUEUE
+                    stats["pushed"] += 1
+                    if other[nb] != INF and nd + other[nb] < best:
+                        best, meet = nd + other[nb], nb
+
+        if start == goal:
+            meet = start
+        self.finish(self.join(meet) if meet != -1 else None)
+
+# ---------------- JUMP POINT SEARCH ----------------
+# Yo'nalishlar open_neighbors tartibida: pastga, yuqoriga, o'ngga, chapga
+DOWN, UP, RIGHT, LEFT = 0, 1, 2, 3
+ANY_DIR = 4
+PERPENDICULAR = ((RIGHT, LEFT), (RIGHT, LEFT), (DOWN, UP), (DOWN, UP))
+
+def _forced(walls, rows, cols, nxt, cur, d):
+    """``cur`` dan ``d`` yo'nalishda ``nxt`` ga o'tilganda majburiy qo'shni bormi."""
+    if d >= RIGHT:
+        r = nxt // cols
+        return ((r > 0 and not walls[nxt - cols] and walls[cur - cols])
+                or (r < rows - 1 and not walls[nxt + cols] and walls[cur + cols]))
+    c = nxt % cols
+    return ((c > 0 and not walls[nxt - 1] and walls[cur - 1])
+            or (c < cols - 1 and not walls[nxt + 1] and walls[cur + 1]))
+
+def scan_jump(walls, rows, cols, idx, d):
+    """``idx`` dan ``d`` yo'nalishda keyingi sakrash nuqtasi.
+
+    Musbat ``k`` - ``k`` qadamdan keyin sakrash nuqtasi, ``-k`` (yoki 0) -
+    sakrash nuqtasi yo'q, devorgacha ``k`` qadam yurish mumkin. Vertikal
+    harakatda gorizontal sakrash nuqtasini ko'radigan katak ham sakrash
+    nuqtasi. Finish bu yerda hisobga olinmaydi (qidiruv o'zi tekshiradi).
+    """
+    n = rows * cols
+    k = 0
+    cur = idx
+    while True:
+        if d == DOWN:
+            nxt = cur + cols
+            if nxt >= n: return -k
+        elif d == UP:
+            nxt = cur - cols
+            if nxt < 0: return -k
+        elif d == RIGHT:
+            if cur % cols == cols - 1: return -k
+            nxt = cur + 1
+        else:
+            if cur % cols == 0: return -k
+            nxt = cur - 1
+        if walls[nxt]:
+            return -k
+        k += 1
+        if _forced(walls, rows, cols, nxt, cur, d):
+            return k
+        if d < RIGHT and (scan_jump(walls, rows, cols, nxt, RIGHT) > 0
+                          or scan_jump(walls, rows, cols, nxt, LEFT) > 0):
+            return k
+        cur = nxt
+
+def build_jump_tables(walls, rows, cols):
+    """JPS+ jadvallari: har bir yo'nalish uchun ``scan_jump`` natijalari.
+
+    Har bir qator/ustun bir marta orqadan oldinga o'tiladi, ya'ni
+    ``O(rows * cols)``; qiymatlar ``scan_jump`` bilan bir xil.
+    """
+    n = rows * cols
+    tables = [array('i', [0]) * n for _ in range(4)]
+    down, up, right, left = tables
+    for r in range(rows):
+        base = r * cols
+        for c in range(cols - 2, -1, -1):
+            i = base + c
+            if walls[i + 1]:
+                continue
+            if _forced(walls, rows, cols, i + 1, i, RIGHT):
+                right[i] = 1
+            else:
+                t = right[i + 1]
+                right[i] = t + 1 if t > 0 else t - 1
+        for c in range(1, cols):
+            i = base + c
+            if walls[i - 1]:
+                continue
+            if _forced(walls, rows, cols, i - 1, i, LEFT):
+                left[i] = 1
+            else:
+                t = left[i - 1]
+                left[i] = t + 1 if t > 0 else t - 1
+    for c in range(cols):
+        for r in range(rows - 2, -1, -1):
+            i = r * cols + c
+            nxt = i + cols
+            if walls[nxt]:
+                continue
+            if _forced(walls, rows, cols, nxt, i, DOWN) or right[nxt] > 0 or left[nxt] > 0:
+                down[i] = 1
+            else:
+                t = down[nxt]
+                down[i] = t + 1 if t > 0 else t - 1
+        for r in range(1, rows):
+            i = r * cols + c
+            nxt = i - cols
+            if walls[nxt]:
+                continue
+            if _forced(walls, rows, cols, nxt, i, UP) or right[nxt] > 0 or left[nxt] > 0:
+                up[i] = 1
+            else:
+                t = up[nxt]
+                up[i] = t + 1 if t > 0 else t - 1
+    return tables
+
+# Grid bo'yicha JPS+ jadvallari; devorlar o'zgarsa qayta quriladi
+JUMP_TABLES = OrderedDict()
+JUMP_TABLES_SIZE = 4
+
+def jump_tables(grid):
+    key = id(grid)
+    entry = JUMP_TABLES.get(key)
+    if entry is not None and entry[0] is grid and entry[1] == (id(grid.walls), grid.wall_version):
+        JUMP_TABLES.move_to_end(key)
+        return entry[2]
+    tables = build_jump_tables(grid.walls, grid.rows, grid.cols)
+    JUMP_TABLES[key] = (grid, (id(grid.walls), grid.wall_version), tables)
+    JUMP_TABLES.move_to_end(key)
+    while len(JUMP_TABLES) > JUMP_TABLES_SIZE:
+        JUMP_TABLES.popitem(last=False)
+    return tables
+
+class JPS(Search):
+    """4 qo'shnili Jump Point Search (A* faqat sakrash nuqtalari ustida).
+
+    Har bir sakrash nuqtasidan kelgan yo'nalish bo'yicha oldinga va ikki
+    yon tomonga sakraladi; to'g'ri chiziqli bo'laklar oralig'idagi
+    kataklar kengaytirilmaydi. Yo'l uzunligi Dijkstra bilan bir xil.
+    """
+    name = "jps"
+
+    def jump(self, idx, d):
+        grid = self.grid
+        return scan_jump(grid.walls, grid.rows, grid.cols, idx, d)
+
+    def steps(self):
+        grid, stats = self.grid, self.stats
+        state, dist, prev = grid.state, grid.distance, grid.prev
+        cols, start, goal = grid.cols, self.start, self.goal
+        gr, gc = divmod(goal, cols)
+        step = (cols, -cols, 1, -1)
+        came = bytearray([ANY_DIR]) * (grid.rows * cols)
+        jump = self.jump
+
+        dist[start] = 0
+        h0 = manhattan(start, goal, cols)
+        pq = [(h0, h0, start)]
+        stats["pushed"] += 1
+
+        while pq:
+            _, _, cur = heapq.heappop(pq)
+            if state[cur] & PROCESSED:
+                stats["stale"] += 1
+                continue
+            state[cur] |= PROCESSED
+            stats["expanded"] += 1
+            yield cur
+
+            if cur == goal:
+                self.finish(self.fill_path(goal))
+                return
+
+            r, c = divmod(cur, cols)
+            d_in = came[cur]
+            dirs = (DOWN, UP, RIGHT, LEFT) if d_in == ANY_DIR else (d_in,) + PERPENDICULAR[d_in]
+            for d in dirs:
+                t = jump(cur, d)
+                reach = t if t > 0 else -t
+                if not reach:
+                    continue
+                # Finish qatori (vertikal) yoki finishning o'zi (gorizontal) nur ustidami
+                k = 0
+                if d == DOWN: k = gr - r
+                elif d == UP: k = r - gr
+                elif gr == r: k = gc - c if d == RIGHT else c - gc
+                if not 0 < k <= reach:
+                    if t <= 0:
+                        continue
+                    k = t
+                nb = cur + step[d] * k
+                if state[nb] & PROCESSED:
+                    continue
+                nd = dist[cur] + k
+                if nd < dist[nb]:
+                    dist[nb] = nd
+                    prev[nb] = cur
+                    came[nb] = d
+                    h = abs(nb // cols - gr) + abs(nb % cols - gc)
+                    heapq.heappush(pq, (nd + h, h, nb))
+                    state[nb] |= IN_QUEUE
+                    stats["pushed"] += 1
+
+        self.finish(None)
+
+    def fill_path(self, goal):
+        """Sakrash nuqtalari zanjirini katakma-katak yo'lga aylantiradi (``grid.prev`` ham)."""
+        cols, prev = self.grid.cols, self.grid.prev
+        jumps = walk_prev(prev, goal)
+        path = [jumps[0]]
+        for a, b in zip(jumps, jumps[1:]):
+            if a // cols == b // cols:
+                s = 1 if b > a else -1
+            else:
+                s = cols if b > a else -cols
+            for cur in range(a + s, b + s, s):
+                prev[cur] = cur - s
+                path.append(cur)
+        return path
+
+class JPSPlus(JPS):
+    """JPS, sakrash masofalari oldindan hisoblangan jadvallardan (``jump_tables``)."""
+    name = "jps_plus"
+
+    def __init__(self, grid, start, goal, queue=None):
+        super().__init__(grid, start, goal, queue)
+        self.tables = jump_tables(grid)
+
+    def jump(self, idx, d):
+        return self.tables[d][idx]
+
+# ---------------- HPA* ----------------
+class HPAStar(Search):
+    """HPA* (``hpa`` moduli): abstrakt tugunlar bo'yicha qadamlar, keyin katakma-katak yo'l."""
+    name = "hpa"
+
+    def __init__(self, grid, start, goal, queue=None):
+        # hpa o'zi solvers'dan foydalanadi, shuning uchun faqat kerak bo'lganda import
+        import hpa
+        super().__init__(grid, start, goal, queue)
+        self.graph = hpa.graph_for(grid)
+
+    def steps(self):
+        abstract = yield from self.graph.abstract_steps(self.start, self.goal, self.stats)
+        if abstract is None:
+            self.finish(None)
+            return
+        path = self.graph.refine(abstract)
+        prev = self.grid.prev
+        for a, b in zip(path, path[1:]):
+            prev[b] = a
+        self.finish(path)
+
+# ---------------- REGISTRY ----------------
+SOLVERS = {
+    Dijkstra.name: Dijkstra,
+    AStar.name: AStar,
+    BFS.name: BFS,
+    BidirectionalBFS.name: BidirectionalBFS,
+    BidirectionalAStar.name: BidirectionalAStar,
+    JPS.name: JPS,
+    JPSPlus.name: JPSPlus,
+    HPAStar.name: HPAStar,
+}
+
+def make_solver(grid, start, finish, algorithm="dijkstra", queue=None):
+    """``algorithm`` nomi bo'yicha solver yaratadi (start/finish - indeks).
+
+    ``queue`` berilsa solverning standart navbat turi o'rniga ishlatiladi.
+    """
+    if algorithm not in SOLVERS:
+        raise ValueError("Noma'lum algoritm: %r (mavjud: %s)" % (algorithm, ", ".join(SOLVERS)))
+    solver = SOLVERS[algorithm](grid, start, finish, queue=queue)
+    if queue is not None:
+        # Noto'g'ri juftlik (masalan astar + bucket) qidiruv boshlanmasdan rad etiladi
+        pqueue.check_queue(queue, *solver.edge_costs(), monotone=solver.monotone)
+    return solver
+
+def solve(grid, start, finish, algorithm="dijkstra"):
+    """Istalgan grid (Node matritsa yoki CompactGrid) uchun ``(path, stats)``.
+
+    ``start``/``finish`` tugun yoki indeks bo'lishi mumkin; ``path`` esa
+    shu grid tugunlari ro'yxati.
+    """
+    compact = grid if isinstance(grid, core.CompactGrid) else core.CompactGrid.from_nodes(grid)
+    cols = compact.cols
+    s = start if isinstance(start, int) else start.row * cols + start.col
+    f = finish if isinstance(finish, int) else finish.row * cols + finish.col
+
+    solver = make_solver(compact, s, f, algorithm)
+    path = solver.run()
+    if path is not None:
+        if compact is grid:
+            path = [grid.node(i) for i in path]
+        else:
+            path = [grid[i // cols][i % cols] for i in path]
+    return path, solver.stats
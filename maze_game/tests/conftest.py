@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modullar maze_game/ ichida yonma-yon turadi va ``import core`` kabi import qilinadi
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,72 @@
+"""Testlar uchun umumiy yordamchilar: tasodifiy gridlar va yo'l tekshiruvi."""
+import heapq
+import random
+
+import core
+import mazegen
+import pqueue
+import solvers
+
+def random_grid(rng, rows=15, cols=21, density=0.3, weighted=False):
+    """Tasodifiy devorlar (``density`` ulushi), ``weighted`` bo'lsa tasodifiy relyef."""
+    grid = core.CompactGrid(rows, cols)
+    for idx in range(rows * cols):
+        if rng.random() < density:
+            grid.walls[idx] = 1
+        elif weighted:
+            grid.terrain[idx] = rng.randrange(len(core.TERRAIN_COSTS))
+    return grid
+
+def maze_grid(seed, rows=31, cols=31, generator="kruskal", extra=40):
+    """``mazegen`` labirinti, qo'shimcha o'tishlar bilan (halqalar bor)."""
+    rng = random.Random(seed)
+    grid = core.CompactGrid(rows, cols)
+    mazegen.generate(grid, generator, rng)
+    mazegen.add_extra_paths(grid, extra, rng)
+    return grid
+
+def open_cells(grid):
+    return [idx for idx, wall in enumerate(grid.walls) if not wall]
+
+def reference_length(grid, start, goal):
+    """``core.dijkstra`` (Node grid) bo'yicha eng qisqa yo'ldagi kataklar soni yoki None."""
+    nodes = grid.to_nodes()
+    cols = grid.cols
+    path, _ = core.dijkstra(nodes[start // cols][start % cols], nodes[goal // cols][goal % cols], nodes)
+    return len(path) if path else None
+
+def weighted_distance(grid, start, goal):
+    """Relyef narxlari bilan eng arzon yo'l narxi (katakka kirish narxi) yoki None."""
+    costs = grid.costs()
+    dist = {start: 0}
+    pq = [(0, start)]
+    while pq:
+        d, cur = heapq.heappop(pq)
+        if cur == goal:
+            return d
+        if d > dist[cur]:
+            continue
+        for nb in solvers.open_neighbors(grid.walls, grid.rows, grid.cols, cur):
+            nd = d + costs[nb]
+            if nd < dist.get(nb, core.INF):
+                dist[nb] = nd
+                heapq.heappush(pq, (nd, nb))
+    return None
+
+def assert_walkable(grid, path, start, goal):
+    """Yo'l ``start`` dan ``goal`` gacha va har qadam ochiq qo'shni katakka."""
+    assert path[0] == start and path[-1] == goal
+    for a, b in zip(path, path[1:]):
+        assert b in solvers.open_neighbors(grid.walls, grid.rows, grid.cols, a)
+
+def queue_kinds(cls, grid):
+    """``cls`` uchun ruxsat etilgan barcha navbat turlari."""
+    probe = cls(grid, 0, 0)
+    kinds = []
+    for kind in ["auto"] + list(pqueue.QUEUES):
+        try:
+            pqueue.check_queue(kind, *probe.edge_costs(), monotone=cls.monotone)
+        except ValueError:
+            continue
+        kinds.append(kind)
+    return kinds
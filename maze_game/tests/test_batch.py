@@ -0,0 +1,37 @@
+"""batch.py: bitta yaroqsiz vazifa butun to'plamni to'xtatmasligi."""
+import json
+import random
+
+import batch
+import core
+from gridutil import maze_grid, open_cells
+
+def write_maze(path, seed, weighted):
+    grid = maze_grid(seed, 21, 21)
+    rng = random.Random(seed)
+    cells = open_cells(grid)
+    start, finish = rng.sample(cells, 2)
+    grid.marks[start] = core.START
+    grid.marks[finish] = core.FINISH
+    if weighted:
+        for idx in cells:
+            grid.set_terrain(idx, rng.randrange(len(core.TERRAIN_COSTS)))
+    path.write_text(grid.to_text())
+    return str(path)
+
+def test_bad_task_reported_in_its_row(tmp_path):
+    files = [write_maze(tmp_path / "plain.txt", 1, False),
+             write_maze(tmp_path / "weighted.txt", 2, True),
+             str(tmp_path / "missing.txt")]
+    out = tmp_path / "out.jsonl"
+    # fifo faqat birlik narxli gridda ishlaydi: relyefli fayl xato qatori beradi
+    assert batch.main(["--load"] + files + ["--queue", "fifo", "--workers", "1",
+                                            "--out", str(out)]) == 0
+    rows = {row["source"]: row for row in map(json.loads, out.read_text().splitlines())}
+    assert set(rows) == set(files)
+    for row in rows.values():
+        assert set(row) == set(batch.FIELDS)
+    assert rows[files[0]]["error"] is None and rows[files[0]]["found"]
+    for name in files[1:]:
+        assert rows[name]["error"] and rows[name]["found"] is False
+        assert rows[name]["path_length"] is None
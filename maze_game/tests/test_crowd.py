@@ -0,0 +1,53 @@
+"""Olomon rejimi: agentlar masofa maydoni bo'yicha nishonga yuradimi."""
+import random
+
+import crowd
+import solvers
+from gridutil import maze_grid
+
+def make_crowd(seed, count=200, goals=5):
+    grid = maze_grid(seed, 25, 25)
+    return grid, crowd.Crowd(grid, count, random.Random(seed), goals=goals)
+
+def assert_follows_fields(grid, c):
+    for cur, nxt, g in zip(c.cur, c.nxt, c.goal):
+        field = c.fields[g]
+        if field.parent[cur] < 0:
+            # Nishonda, devor ostida qolgan yoki uzilib qolgan agent joyida turadi
+            assert nxt == cur
+            continue
+        assert nxt == field.parent[cur]
+        assert nxt in solvers.open_neighbors(grid.walls, grid.rows, grid.cols, cur)
+        assert field.dist[nxt] == field.dist[cur] - 1
+
+def test_next_cells_follow_parent():
+    grid, c = make_crowd(1)
+    assert len(c) == 200 and len(c.targets) == 5
+    for _ in range(10):
+        assert_follows_fields(grid, c)
+        c.update(1.0)
+
+def test_refresh_after_wall_change():
+    grid, c = make_crowd(2)
+    assert not c.refresh()
+    # Nishonda turmagan birinchi agentning keyingi katagini devor qilamiz
+    i = next(i for i in range(len(c)) if c.cur[i] != c.targets[c.goal[i]])
+    blocked = c.nxt[i]
+    r, col = divmod(blocked, grid.cols)
+    grid[r][col].wall = True
+    assert c.refresh()
+    assert all(field.valid() for field in c.fields)
+    assert c.nxt[i] != blocked
+    assert_follows_fields(grid, c)
+    assert not c.refresh()
+
+def test_everyone_arrives():
+    # mazegen labirinti bog'langan: har bir agent nishoniga yetadi
+    grid, c = make_crowd(3)
+    longest = max(c.fields[g].dist[cur] for cur, g in zip(c.cur, c.goal))
+    for _ in range(longest):
+        assert c.arrived() < len(c)
+        c.update(1.0)
+    assert c.arrived() == len(c)
+    c.update(1.0)
+    assert c.arrived() == len(c)
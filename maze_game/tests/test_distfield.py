@@ -0,0 +1,62 @@
+"""DistanceField/FieldCache: devor o'zgarganda kesh eskirishi va qayta hisoblash."""
+import random
+
+import distfield
+from core import INF
+from gridutil import maze_grid, open_cells, reference_length
+
+def test_field_matches_dijkstra():
+    grid = maze_grid(1, 21, 21)
+    cells = open_cells(grid)
+    source = cells[0]
+    field = distfield.DistanceField(grid, source)
+    for target in random.Random(1).sample(cells, 20):
+        expected = reference_length(grid, source, target)
+        assert field.distance(target) == expected - 1
+        assert len(field.path_to(target)) == expected
+
+def cut_path(field, target):
+    """Manbadan ``target`` gacha yo'lning o'rtasidagi katakni qaytaradi."""
+    path = field.path_to(target)
+    return path[len(path) // 2]
+
+def test_wall_version_bump_invalidates():
+    grid = maze_grid(2, 21, 21, extra=0)
+    cells = open_cells(grid)
+    source, target = cells[0], cells[-1]
+    cache = distfield.FieldCache()
+    field = cache.get(grid, source)
+    assert cache.get(grid, source) is field and (cache.hits, cache.misses) == (1, 1)
+
+    # Mukammal labirintda yo'l yagona: o'rtasini devor qilsak nishon uzilib qoladi
+    r, c = divmod(cut_path(field, target), grid.cols)
+    grid[r][c].wall = True
+    assert not field.valid()
+    again = cache.get(grid, source)
+    assert cache.misses == 2
+    assert again.distance(target) == INF
+    assert again.valid()
+
+def test_replaced_walls_buffer_invalidates():
+    grid = maze_grid(3, 21, 21, extra=0)
+    cells = open_cells(grid)
+    source, target = cells[0], cells[-1]
+    cache = distfield.FieldCache()
+    field = cache.get(grid, source)
+    walls = bytearray(grid.walls)
+    walls[cut_path(field, target)] = 1
+    # Versiya o'zgarmaydi, faqat bufer almashadi (masalan, fayldan yuklash)
+    grid.walls = walls
+    assert not field.valid()
+    assert cache.get(grid, source).distance(target) == INF
+    assert cache.misses == 2
+
+def test_cache_evicts_least_recent():
+    grid = maze_grid(4, 15, 15)
+    a, b, c = open_cells(grid)[:3]
+    cache = distfield.FieldCache(maxsize=2)
+    cache.get(grid, a)
+    cache.get(grid, b)
+    cache.get(grid, a)
+    cache.get(grid, c)
+    assert list(cache.fields) == [(id(grid), a), (id(grid), c)]
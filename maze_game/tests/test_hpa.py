@@ -0,0 +1,34 @@
+"""HPA*: ``HPAGraph.update_cells`` to'liq qayta qurish bilan bir xil grafni beradimi."""
+import random
+
+import hpa
+from gridutil import assert_walkable, open_cells, random_grid
+
+def snapshot(graph):
+    """Grafni solishtirish uchun: bo'sh ``inter`` to'plamlari e'tiborga olinmaydi."""
+    inter = {node: nbs for node, nbs in graph.inter.items() if nbs}
+    return graph.borders, inter, graph.intra, graph.members
+
+def test_update_cells_matches_rebuild():
+    for seed in range(3):
+        rng = random.Random(seed)
+        grid = random_grid(rng, 37, 45, density=0.25)
+        graph = hpa.HPAGraph(grid, 8)
+        for step in range(20):
+            cells = rng.sample(range(grid.rows * grid.cols), rng.randint(1, 4))
+            for idx in cells:
+                grid.walls[idx] ^= 1
+            grid.wall_version += 1
+            graph.update_cells(cells)
+            assert graph.valid()
+
+            fresh = hpa.HPAGraph(grid, 8)
+            assert snapshot(graph) == snapshot(fresh), (seed, step)
+
+            start, goal = rng.sample(open_cells(grid), 2)
+            path = graph.path(start, goal)
+            expected = fresh.path(start, goal)
+            assert (path is None) == (expected is None), (seed, step)
+            if path is not None:
+                assert_walkable(grid, path, start, goal)
+                assert len(path) == len(expected), (seed, step)
@@ -0,0 +1,54 @@
+"""D* Lite: devorlar o'zgargandan keyingi tuzatish yangi BFS bilan bir xilmi."""
+import random
+
+import core
+import distfield
+import incremental
+from gridutil import assert_walkable, maze_grid, open_cells
+
+def test_dstar_lite_repair_matches_bfs():
+    rng = random.Random(11)
+    grid = maze_grid(11)
+    cells = open_cells(grid)
+    start, goal = cells[0], cells[-1]
+    planner = incremental.DStarLite(grid, start, goal)
+
+    for _ in range(30):
+        planner.compute()
+        field = distfield.DistanceField(grid, goal)
+        path = planner.path()
+        if field.distance(start) == core.INF:
+            assert path is None
+        else:
+            assert path is not None
+            assert_walkable(grid, path, start, goal)
+            assert len(path) - 1 == field.distance(start)
+            # Start yo'l bo'ylab bir necha qadam siljiydi
+            start = path[min(len(path) - 1, rng.randrange(1, 4))]
+            planner.move_start(start)
+
+        # Start/goaldan boshqa bir nechta katakning devori almashtiriladi
+        changed = []
+        for idx in rng.sample(range(grid.rows * grid.cols), 6):
+            if idx not in (start, goal):
+                grid.walls[idx] ^= 1
+                changed.append(idx)
+        grid.wall_version += 1
+        planner.update_cells(changed)
+
+def test_dstar_lite_no_path():
+    grid = maze_grid(3, rows=11, cols=11, extra=0)
+    cells = open_cells(grid)
+    start, goal = cells[0], cells[-1]
+    planner = incremental.DStarLite(grid, start, goal)
+    planner.compute()
+    assert planner.path() is not None
+    # Goal atrofini to'liq yopamiz
+    cols = grid.cols
+    closed = [nb for nb in (goal - 1, goal + 1, goal - cols, goal + cols) if not grid.walls[nb]]
+    for idx in closed:
+        grid.walls[idx] = 1
+    grid.wall_version += 1
+    planner.update_cells(closed)
+    planner.compute()
+    assert planner.path() is None
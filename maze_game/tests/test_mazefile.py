@@ -0,0 +1,95 @@
+"""Labirint fayli va matn ko'rinishi: aylanma saqlash va buzuq fayllarni rad etish."""
+import random
+
+import pytest
+
+import core
+import mazefile
+import mazegen
+import solvers
+from gridutil import open_cells
+
+def maze_with_terrain(seed):
+    rng = random.Random(seed)
+    grid = core.CompactGrid(21, 25, 16)
+    mazegen.generate(grid, "eller", rng)
+    mazegen.add_extra_paths(grid, 10, rng)
+    cells = open_cells(grid)
+    start, finish = rng.sample(cells, 2)
+    grid.marks[start] = core.START
+    grid.marks[finish] = core.FINISH
+    for idx in cells:
+        if idx not in (start, finish) and rng.random() < 0.3:
+            grid.set_terrain(idx, rng.randrange(1, len(core.TERRAIN_COSTS)))
+    return grid, start, finish
+
+def test_mazefile_round_trip(tmp_path):
+    grid, start, finish = maze_with_terrain(3)
+    path = solvers.make_solver(grid, start, finish, "dijkstra").run()
+    filename = str(tmp_path / "maze.bin")
+    mazefile.save(filename, grid, level="Medium", path=path, seed=1234,
+                  generator="eller", extra_paths=10)
+
+    loaded, meta = mazefile.load(filename)
+    assert (loaded.rows, loaded.cols, loaded.cell_size) == (grid.rows, grid.cols, grid.cell_size)
+    assert loaded.walls == grid.walls
+    assert loaded.terrain == grid.terrain
+    assert loaded.marks == grid.marks
+    assert (meta["start"], meta["finish"]) == (start, finish)
+    assert (meta["level"], meta["seed"], meta["generator"]) == ("Medium", 1234, "eller")
+    assert meta["config"]["EXTRA_PATHS"] == 10
+    assert list(meta["path"]) == path
+
+def test_mazefile_without_optional_sections(tmp_path):
+    grid = core.CompactGrid(11, 11)
+    mazegen.generate(grid, "sidewinder", random.Random(5))
+    filename = str(tmp_path / "plain.bin")
+    mazefile.save(filename, grid)
+    loaded, meta = mazefile.load(filename)
+    assert loaded.walls == grid.walls
+    assert meta["path"] is None and meta["seed"] is None
+    assert (meta["start"], meta["finish"]) == (-1, -1)
+
+@pytest.mark.parametrize("start, finish", [(-5, -1), (12, 11 * 11), (0, -1)],
+                         ids=["negative", "out-of-range", "wall"])
+def test_mazefile_rejects_bad_header(tmp_path, start, finish):
+    grid = core.CompactGrid(11, 11)
+    mazegen.generate(grid, "backtracker", random.Random(0))
+    filename = str(tmp_path / "bad.bin")
+    mazefile.save(filename, grid, start=start, finish=finish)
+    with pytest.raises(ValueError):
+        mazefile.load(filename)
+
+def test_mazefile_rejects_unknown_terrain(tmp_path):
+    grid, _, _ = maze_with_terrain(4)
+    filename = str(tmp_path / "terrain.bin")
+    mazefile.save(filename, grid)
+    # Relyef bo'limi faylning oxirida: oxirgi katakka noma'lum tur yozamiz
+    with open(filename, "r+b") as f:
+        f.seek(-1, 2)
+        f.write(bytes([len(core.TERRAIN_COSTS)]))
+    with pytest.raises(ValueError):
+        mazefile.load(filename)
+
+def test_mazefile_rejects_unwalkable_path(tmp_path):
+    grid, start, finish = maze_with_terrain(5)
+    path = solvers.make_solver(grid, start, finish, "bfs").run()
+    wall = grid.walls.find(1)
+    broken = {
+        "wall": path[:1] + [wall] + path[1:],
+        "jump": path[:1] + path[2:],
+    }
+    for name, bad in broken.items():
+        filename = str(tmp_path / ("%s.bin" % name))
+        mazefile.save(filename, grid, path=bad)
+        with pytest.raises(ValueError):
+            mazefile.load(filename)
+
+def test_text_round_trip():
+    grid, _, _ = maze_with_terrain(7)
+    text = grid.to_text()
+    loaded = core.CompactGrid.from_text(text)
+    assert loaded.walls == grid.walls
+    assert loaded.terrain == grid.terrain
+    assert loaded.marks == grid.marks
+    assert loaded.to_text() == text
@@ -0,0 +1,39 @@
+"""Generatorlar: mukammal labirint (daraxt) va seed bo'yicha takrorlanish."""
+import random
+from itertools import islice
+
+import pytest
+
+import core
+import distfield
+import mazegen
+from gridutil import open_cells
+
+@pytest.mark.parametrize("algorithm", list(mazegen.GENERATORS))
+def test_generator_perfect_maze(algorithm):
+    for rows, cols in [(3, 3), (8, 7), (21, 31)]:
+        grid = core.CompactGrid(rows, cols)
+        mazegen.generate(grid, algorithm, random.Random(rows * cols))
+        lr, lc = mazegen.lattice_size(rows, cols)
+        # Daraxt: lr*lc katak va lr*lc - 1 ta o'tish
+        assert grid.walls.count(0) == 2 * lr * lc - 1
+        field = distfield.DistanceField(grid, cols + 1)
+        assert all(field.distance(idx) < core.INF for idx in open_cells(grid))
+
+@pytest.mark.parametrize("algorithm", list(mazegen.GENERATORS))
+def test_generator_is_seeded(algorithm):
+    a, b = core.CompactGrid(21, 25), core.CompactGrid(21, 25)
+    mazegen.generate(a, algorithm, random.Random(42))
+    mazegen.generate(b, algorithm, random.Random(42))
+    assert a.walls == b.walls
+
+def test_eller_rows_stream():
+    # Cheksiz oqim: har qatorda har bir to'plam kamida bitta katak bilan pastga tushadi
+    for right, down in islice(mazegen.eller_rows(20, random.Random(1)), 50):
+        assert len(right) == len(down) == 20
+        assert right[-1] == 0
+        assert any(down)
+
+def test_unknown_generator():
+    with pytest.raises(ValueError):
+        mazegen.generate(core.CompactGrid(5, 5), "nope")
@@ -0,0 +1,91 @@
+"""Ustuvorlik navbatlari: tartib, decrease-key va solver bilan mos kelmaydigan turlar."""
+import random
+
+import pytest
+
+import pqueue
+import solvers
+from gridutil import assert_walkable, open_cells, queue_kinds, random_grid, reference_length
+
+@pytest.mark.parametrize("kind", ["heap", "lazy"])
+def test_heap_pops_in_key_order(kind):
+    rng = random.Random(4)
+    n = 200
+    queue = pqueue.make_queue(kind, n, 1, 9, monotone=False)
+    best = {}
+    for _ in range(600):
+        item, key = rng.randrange(n), rng.randrange(1000)
+        queue.push(item, key)
+        # decrease-key: kichikroq kalit qoladi
+        best[item] = min(key, best.get(item, key))
+    popped = []
+    while len(queue):
+        item = queue.pop()
+        popped.append((best.pop(item), item))
+    assert not best
+    assert [key for key, _ in popped] == sorted(key for key, _ in popped)
+
+def dijkstra_order(kind, edges, n):
+    """Tasodifiy graf ustida Dijkstra: ``(masofalar, chiqarilgan kalitlar)``."""
+    queue = pqueue.make_queue(kind, n, 1, 8)
+    dist, done, order = {0: 0}, set(), []
+    queue.push(0, 0)
+    while len(queue):
+        u = queue.pop()
+        done.add(u)
+        order.append(dist[u])
+        for v, w in edges[u]:
+            if v not in done and dist[u] + w < dist.get(v, 1 << 30):
+                dist[v] = dist[u] + w
+                queue.push(v, dist[v])
+    return dist, order
+
+def test_bucket_queue_matches_heap():
+    rng = random.Random(5)
+    n = 300
+    edges = [[(rng.randrange(n), rng.randint(1, 8)) for _ in range(4)] for _ in range(n)]
+    dist, order = dijkstra_order("bucket", edges, n)
+    assert order == sorted(order)
+    assert dist == dijkstra_order("heap", edges, n)[0]
+
+@pytest.mark.parametrize("algorithm", list(solvers.SOLVERS))
+def test_every_allowed_queue_is_optimal(algorithm):
+    cls = solvers.SOLVERS[algorithm]
+    for seed in range(6):
+        rng = random.Random(seed)
+        grid = random_grid(rng)
+        cells = open_cells(grid)
+        start, goal = rng.choice(cells), rng.choice(cells)
+        expected = reference_length(grid, start, goal)
+        for kind in queue_kinds(cls, grid):
+            path = solvers.make_solver(grid, start, goal, algorithm, kind).run()
+            if expected is None:
+                assert path is None, (seed, kind)
+                continue
+            assert_walkable(grid, path, start, goal)
+            if algorithm == "hpa":
+                assert len(path) >= expected, (seed, kind)
+            else:
+                assert len(path) == expected, (seed, kind)
+
+@pytest.mark.parametrize("algorithm", [name for name, cls in solvers.SOLVERS.items() if not cls.monotone])
+def test_monotone_only_queues_rejected(algorithm):
+    grid = random_grid(random.Random(0))
+    for kind in pqueue.MONOTONE_ONLY:
+        with pytest.raises(ValueError):
+            solvers.make_solver(grid, 0, 1, algorithm, kind)
+
+def test_fifo_rejected_on_weighted_grid():
+    grid = random_grid(random.Random(1), weighted=True)
+    with pytest.raises(ValueError):
+        solvers.make_solver(grid, 0, 1, "dijkstra", "fifo")
+
+def test_unknown_queue_rejected():
+    with pytest.raises(ValueError):
+        pqueue.make_queue("nope", 10)
+
+def test_pick_queue():
+    assert pqueue.pick_queue(1, 1) == "fifo"
+    assert pqueue.pick_queue(1, 8) == "bucket"
+    assert pqueue.pick_queue(1, pqueue.BUCKET_MAX_COST + 1) == "lazy"
+    assert pqueue.pick_queue(1, 1, monotone=False) == "lazy"
@@ -0,0 +1,30 @@
+"""FrameProfiler: summary() kalitlari va log fayli."""
+import profiler
+
+def test_summary_without_frames_has_every_key():
+    prof = profiler.FrameProfiler()
+    s = prof.summary()
+    for name in profiler.SECTIONS + profiler.COUNTERS + ("fps", "total_ms"):
+        assert s[name] == 0
+    assert "cache" not in s
+    prof.cache = {"hits": 0, "misses": 0}
+    assert prof.summary()["cache"] == prof.cache
+
+def test_summary_averages_frames(tmp_path):
+    prof = profiler.FrameProfiler(window=4)
+    prof.counters = {"pushed": 7, "expanded": 5}
+    log = tmp_path / "profile.log"
+    prof.open_log(str(log))
+    for _ in range(6):
+        prof.begin_frame()
+        prof.lap("input")
+        prof.lap("search")
+        prof.lap("search")
+        prof.end_frame()
+    prof.close()
+    s = prof.summary()
+    assert len(prof.frames) == 4
+    assert s["total_ms"] >= s["input"] + s["search"] - 1e-9
+    assert (s["pushed"], s["expanded"], s["stale"]) == (7, 5, 0)
+    lines = log.read_text().splitlines()
+    assert len(lines) == 7 and lines[0].startswith("frame,time,input")
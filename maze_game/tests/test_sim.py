@@ -0,0 +1,24 @@
+"""Simulation yozuvi: yozish -> saqlash -> o'qish -> qayta ijro bir xil holatga keladimi."""
+import pytest
+
+import sim
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_record_save_load_replay(tmp_path, seed):
+    rec = sim.random_session(seed, "Easy", events=30)
+    filename = str(tmp_path / "session.rec")
+    rec.save(filename)
+
+    header, events = sim.load(filename)
+    assert header == rec.header
+    assert events == [tuple(int(x) for x in event) for event in rec.events]
+
+    expected = sim.replay(rec.header, rec.events).digest()
+    assert sim.replay(header, events).digest() == expected
+    assert sim.replay(header, events).digest() == expected
+
+def test_load_rejects_other_files(tmp_path):
+    filename = tmp_path / "other.rec"
+    filename.write_bytes(b"MAZE" + bytes(20))
+    with pytest.raises(ValueError):
+        sim.load(str(filename))
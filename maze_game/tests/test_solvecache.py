@@ -0,0 +1,102 @@
+"""Yechimlar keshi: Zobrist xeshini yangilash, LRU chegaralari va Simulation bilan ishlashi."""
+import random
+
+import core
+import sim
+import solvecache
+import solvers
+from gridutil import maze_grid, open_cells
+
+def test_incremental_hash_matches_rehash():
+    rng = random.Random(1)
+    grid = maze_grid(1, 21, 21)
+    layout = solvecache.LayoutHash(grid)
+    for _ in range(200):
+        idx = rng.randrange(grid.rows * grid.cols)
+        if rng.random() < 0.5:
+            node = grid.node(idx)
+            node.wall = not node.wall
+            layout.wall_changed(idx)
+        else:
+            old = grid.terrain[idx]
+            if grid.set_terrain(idx, rng.randrange(len(core.TERRAIN_COSTS))):
+                layout.terrain_changed(idx, old)
+        assert layout.current() == solvecache.LayoutHash(grid).value
+    # Hamma o'zgarish O(1) da: qayta hisoblash faqat konstruktorda
+    assert layout.rehashes == 1
+
+def test_unreported_change_triggers_rehash():
+    grid = maze_grid(2, 15, 15)
+    layout = solvecache.LayoutHash(grid)
+    grid.reset()
+    assert layout.current() == solvecache.LayoutHash(grid).value
+    assert layout.rehashes == 2
+
+def test_key_returns_after_paint_and_unpaint():
+    grid = maze_grid(3, 21, 21)
+    cache = solvecache.SolveCache()
+    start, finish = open_cells(grid)[0], open_cells(grid)[-1]
+    key = cache.key(grid, start, finish, "astar")
+    idx = open_cells(grid)[5]
+    for wall in (True, False):
+        grid.node(idx).wall = wall
+        cache.wall_changed(grid, idx)
+        if wall:
+            assert cache.key(grid, start, finish, "astar") != key
+    assert cache.key(grid, start, finish, "astar") == key
+    assert cache.stats["rehashes"] == 1
+
+def solved(grid, start, finish):
+    solver = solvers.make_solver(grid, start, finish, "bfs")
+    solver.run()
+    return solver
+
+def test_lru_by_count_and_hit_rate():
+    grid = maze_grid(4, 21, 21)
+    cells = open_cells(grid)
+    cache = solvecache.SolveCache(maxsize=3)
+    keys = [cache.key(grid, cells[0], finish, "bfs") for finish in cells[1:5]]
+    for key in keys[:3]:
+        cache.put(key, solved(grid, key[3], key[4]))
+    assert cache.get(keys[0]) is not None       # keys[0] endi eng yangi
+    cache.put(keys[3], solved(grid, keys[3][3], keys[3][4]))
+    assert list(cache.entries) == [keys[2], keys[0], keys[3]]
+    assert cache.stats["evicted"] == 1 and cache.stats["entries"] == 3
+    assert cache.get(keys[1]) is None
+    assert cache.stats["hit_rate"] == 0.5
+
+def test_lru_by_bytes():
+    grid = maze_grid(5, 31, 31)
+    cells = open_cells(grid)
+    cache = solvecache.SolveCache(maxsize=100, max_bytes=0)
+    keys = [cache.key(grid, cells[0], finish, "bfs") for finish in cells[-3:]]
+    for key in keys:
+        entry = cache.put(key, solved(grid, key[3], key[4]))
+        # Chegaradan oshsa ham oxirgi yechim doim qoladi
+        assert list(cache.entries) == [key]
+        assert cache.stats["bytes"] == entry.size
+    assert cache.stats["evicted"] == 2
+
+    cache = solvecache.SolveCache(maxsize=100, max_bytes=entry.size * 2)
+    for key in keys:
+        cache.put(key, solved(grid, key[3], key[4]))
+    assert cache.stats["bytes"] <= cache.max_bytes
+    assert list(cache.entries)[-1] == keys[-1] and len(cache.entries) < 3
+
+def run_space(game):
+    search = game.space()
+    while game.busy():
+        game.step()
+    return search
+
+def test_second_space_is_served_from_cache():
+    game = sim.Simulation("Easy", seed=3, algorithm="astar", instant=False)
+    first = run_space(game)
+    assert first is not None and not isinstance(first, solvecache.Solved)
+    assert game.player.current_node.idx == game.finish.idx
+    second = run_space(game)
+    assert isinstance(second, solvecache.Solved)
+    assert list(second.path) == first.path
+    assert game.player.current_node.idx == game.finish.idx
+    stats = game.solves.stats
+    assert (stats["misses"], stats["hits"]) == (1, 1)
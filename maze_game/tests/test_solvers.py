@@ -0,0 +1,43 @@
+"""Har bir solver ``core.dijkstra`` bilan bir xil uzunlikdagi yo'l topadimi."""
+import random
+
+import pytest
+
+import solvers
+from gridutil import assert_walkable, open_cells, random_grid, reference_length
+
+SEEDS = range(8)
+
+@pytest.mark.parametrize("algorithm", list(solvers.SOLVERS))
+def test_solver_matches_dijkstra(algorithm):
+    for seed in SEEDS:
+        rng = random.Random(seed)
+        grid = random_grid(rng)
+        cells = open_cells(grid)
+        start, goal = rng.choice(cells), rng.choice(cells)
+        expected = reference_length(grid, start, goal)
+        path = solvers.make_solver(grid, start, goal, algorithm).run()
+        if expected is None:
+            assert path is None, seed
+            continue
+        assert path is not None, seed
+        assert_walkable(grid, path, start, goal)
+        if algorithm == "hpa":
+            # HPA* optimalga yaqin, lekin har doim ham eng qisqa emas
+            assert len(path) >= expected, seed
+        else:
+            assert len(path) == expected, seed
+
+@pytest.mark.parametrize("algorithm", list(solvers.SOLVERS))
+def test_solver_unreachable_goal(algorithm):
+    grid = random_grid(random.Random(0), density=0.0)
+    # Goal to'rt tomondan devor bilan o'ralgan
+    goal = 7 * grid.cols + 10
+    for nb in (goal - 1, goal + 1, goal - grid.cols, goal + grid.cols):
+        grid.walls[nb] = 1
+    assert solvers.make_solver(grid, 0, goal, algorithm).run() is None
+
+def test_unknown_algorithm():
+    grid = random_grid(random.Random(0))
+    with pytest.raises(ValueError):
+        solvers.make_solver(grid, 0, 1, "nope")
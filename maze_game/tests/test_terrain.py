@@ -0,0 +1,56 @@
+"""Relyef narxlari: og'irlikli solverlar eng arzon yo'lni topadimi."""
+import random
+
+import pytest
+
+import core
+import sim
+import solvers
+from gridutil import (assert_walkable, open_cells, queue_kinds, random_grid, reference_length,
+                      weighted_distance)
+
+SEEDS = range(8)
+
+@pytest.mark.parametrize("algorithm", list(solvers.SOLVERS))
+def test_solver_on_weighted_grid(algorithm):
+    cls = solvers.SOLVERS[algorithm]
+    for seed in SEEDS:
+        rng = random.Random(seed)
+        grid = random_grid(rng, weighted=True)
+        cells = open_cells(grid)
+        start, goal = rng.choice(cells), rng.choice(cells)
+        steps = reference_length(grid, start, goal)
+        for kind in queue_kinds(cls, grid):
+            path = solvers.make_solver(grid, start, goal, algorithm, kind).run()
+            if steps is None:
+                assert path is None, (seed, kind)
+                continue
+            assert_walkable(grid, path, start, goal)
+            if cls.weighted:
+                cost = sum(grid.costs()[idx] for idx in path[1:])
+                assert cost == weighted_distance(grid, start, goal), (seed, kind)
+            elif algorithm == "hpa":
+                assert len(path) >= steps, (seed, kind)
+            else:
+                # Og'irliksiz solverlar relyefni e'tiborsiz qoldirib, eng kam qadamli yo'lni beradi
+                assert len(path) == steps, (seed, kind)
+
+def test_cost_range_and_set_terrain():
+    grid = core.CompactGrid(5, 5)
+    assert grid.cost_range() == (core.TERRAIN_COSTS[core.GROUND],) * 2
+    version = grid.terrain_version
+    assert grid.set_terrain(6, core.WATER)
+    assert not grid.set_terrain(6, core.WATER)
+    assert grid.terrain_version == version + 1
+    assert grid.costs()[6] == core.TERRAIN_COSTS[core.WATER]
+    assert grid.cost_range() == (core.TERRAIN_COSTS[core.GROUND], core.TERRAIN_COSTS[core.WATER])
+
+def test_painting_terrain_drops_unit_cost_planner():
+    game = sim.Simulation("Easy", seed=3, instant=True)
+    game.space()
+    while game.busy():
+        game.step()
+    assert game.planner is not None
+    idx = next(i for i in open_cells(game.grid) if not game.grid.marks[i])
+    assert game.set_terrain(idx, core.MUD)
+    assert game.planner is None
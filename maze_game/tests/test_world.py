@@ -0,0 +1,63 @@
+"""Bo'lakli dunyo: LRU chiqarish, diskdan qayta o'qish va bo'laklararo yo'l."""
+import os
+
+import core
+import world
+from gridutil import reference_length
+
+def test_evicted_chunks_reload_or_regenerate():
+    with world.World(seed=7, size=8, max_chunks=2) as w:
+        original = bytes(w.chunk(0, 1).walls)
+        # (0, 0) bo'lagida devorni teskarisiga o'zgartiramiz: u "dirty" bo'ladi
+        was_wall = w.is_wall(3, 3)
+        w.set_wall(3, 3, not was_wall)
+        for cx in range(1, 5):
+            w.chunk(0, cx)
+        assert (0, 0) not in w.chunks and (0, 1) not in w.chunks
+        assert w.stats["evicted"] >= 3
+        assert w.saved == {(0, 0)}
+        directory = w.cache_dir
+        assert os.path.exists(w.path_for(0, 0))
+
+        assert w.is_wall(3, 3) == (not was_wall)
+        assert w.stats["loaded"] == 1
+        # O'zgarmagan bo'lak diskka yozilmaydi, balki aynan qayta yaratiladi
+        assert bytes(w.chunk(0, 1).walls) == original
+    assert not os.path.exists(directory)
+    assert w.cache_dir is None and not w.saved
+
+def test_close_keeps_caller_directory(tmp_path):
+    w = world.World(seed=1, size=8, max_chunks=1, cache_dir=str(tmp_path))
+    w.set_wall(1, 1, not w.is_wall(1, 1))
+    w.chunk(5, 5)
+    w.close()
+    assert os.listdir(tmp_path) == ["0_0.chunk"]
+
+def test_find_path_across_chunks():
+    size = 16
+    w = world.World(seed=3, size=size)
+    start, goal = (1, 1), (2 * size + 5, -size - 3)
+    stats = {"pushed": 0}
+    path = world.find_path(w, start, goal, stats)
+    assert path[0] == start and path[-1] == goal
+    for (r, c), (nr, nc) in zip(path, path[1:]):
+        assert abs(r - nr) + abs(c - nc) == 1
+        assert not w.is_wall(nr, nc)
+    assert {(r // size, c // size) for r, c in path} >= {(0, 0), (2, -2)}
+    assert stats["path_length"] == len(path) and stats["time"] > 0
+    assert stats["expanded"] > 0
+
+    # Yo'l oynaga sig'sa oynadagi eng qisqa yo'l bilan bir xil uzunlikda
+    r0, c0 = -size, -3 * size
+    rows, cols = 5 * size, 5 * size
+    assert all(r0 <= r < r0 + rows and c0 <= c < c0 + cols for r, c in path)
+    grid = w.window(r0, c0, rows, cols)
+    to_idx = lambda rc: (rc[0] - r0) * cols + rc[1] - c0
+    assert reference_length(grid, to_idx(start), to_idx(goal)) == len(path)
+
+def test_find_path_limit_is_per_search():
+    w = world.World(seed=3, size=16)
+    stats = core.new_stats()
+    stats["expanded"] = 10 ** 9
+    assert world.find_path(w, (1, 1), (21, 21), stats) is not None
+    assert world.find_path(w, (1, 1), (201, 201), max_expanded=10) is None
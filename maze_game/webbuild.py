@@ -0,0 +1,144 @@
+"""Brauzer (pygbag) uchun ixcham ilova papkasini yig'adi.
+
+pygbag ilova papkasidagi hamma narsani ``.apk`` ga joylaydi: bench/batch
+kabi vositalar, ``index.html``, katta PNG rasmlar ham brauzerga yuklanadi.
+Bu vosita faqat ``main.py`` dan import qilinadigan modullarni va eng katta
+katak o'lchamigacha kichraytirilgan rasmlarni ``--out`` papkasiga
+ko'chiradi. ``main.CHEAP_RENDER`` brauzerda devor rasmini ishlatmaydi,
+shuning uchun ``wall.png`` umuman olinmaydi.
+
+    python webbuild.py                       # build/webapp ga yig'adi
+    pygbag build/webapp                      # so'ng odatdagidek
+    python webbuild.py --sprite-size 48 --out /tmp/webapp
+
+Oxirida butun papka va yig'ilgan ilovaning siqilgan (``.apk`` kabi
+deflate 9) hajmi chiqariladi.
+"""
+import argparse
+import ast
+import io
+import os
+import shutil
+import sys
+import zipfile
+
+import core
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ENTRY = "main.py"
+SKIP_ASSETS = ("wall.png",)     # main.CHEAP_RENDER da devorlar rang bilan chiziladi
+# pygbag o'zi tashlab yuboradigan papkalar va kengaytmalar (pygbag.filtering)
+PYGBAG_IGNORE_DIRS = ("build", "dist", "static", "ignore", "__pycache__", ".git")
+PYGBAG_SKIP_EXT = (".pyc", ".log")
+# Shu vosita yig'gan papka belgisi: faqat shunday papka qayta yig'ishda o'chiriladi
+MARKER = ".webbuild"
+
+def sprite_size():
+    """Eng katta sprite o'lchami: eng katta katak (finish pulsatsiyasi brauzerda yo'q)."""
+    return max(cfg["CELL_SIZE"] for cfg in core.LEVELS.values())
+
+def runtime_modules(entry=ENTRY, folder=HERE):
+    """``entry`` dan (funksiya ichidagilar ham) import qilinadigan qo'shni modullar."""
+    found = set()
+    todo = [entry]
+    while todo:
+        filename = todo.pop()
+        if filename in found:
+            continue
+        found.add(filename)
+        with open(os.path.join(folder, filename), encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and not node.level:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                candidate = name.split(".")[0] + ".py"
+                if os.path.isfile(os.path.join(folder, candidate)):
+                    todo.append(candidate)
+    return sorted(found)
+
+def shrink_image(src, dst, size):
+    """Rasmni ``size`` piksellik kvadratga sig'adigan qilib kichraytiradi."""
+    import pygame
+
+    img = pygame.image.load(src)
+    if img.get_bitsize() < 24:
+        # Palitrali PNG: smoothscale faqat 24/32 bitli sirt bilan ishlaydi
+        rgba = pygame.Surface(img.get_size(), pygame.SRCALPHA, 32)
+        rgba.blit(img, (0, 0))
+        img = rgba
+    w, h = img.get_size()
+    scale = size / max(w, h)
+    if scale < 1:
+        img = pygame.transform.smoothscale(img, (max(int(w * scale), 1), max(int(h * scale), 1)))
+    pygame.image.save(img, dst)
+
+def pygbag_files(folder):
+    """pygbag ``folder`` dan bundle'ga oladigan fayllar (nisbiy yo'llar)."""
+    for current, dirnames, filenames in os.walk(folder):
+        dirnames[:] = [d for d in dirnames if d not in PYGBAG_IGNORE_DIRS]
+        for filename in filenames:
+            if not filename.endswith(PYGBAG_SKIP_EXT):
+                yield os.path.relpath(os.path.join(current, filename), folder)
+
+def bundle_size(folder):
+    """``(fayllar soni, xom bayt, deflate 9 bilan siqilgan bayt)``."""
+    buf = io.BytesIO()
+    count = raw = 0
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+        for name in pygbag_files(folder):
+            path = os.path.join(folder, name)
+            zf.write(path, name)
+            count += 1
+            raw += os.path.getsize(path)
+    return count, raw, len(buf.getvalue())
+
+def build(out, size=None, force=False):
+    """``out`` ga ilovani yig'adi.
+
+    Oldin shu vosita yig'gan (``MARKER`` bor) papka almashtiriladi; boshqa
+    bo'sh bo'lmagan papka ``force`` siz o'chirilmaydi (``ValueError``).
+    """
+    size = size or sprite_size()
+    if os.path.isdir(out) and os.listdir(out):
+        if not force and not os.path.isfile(os.path.join(out, MARKER)):
+            raise ValueError("%s bo'sh emas va webbuild yig'gan papka emas (--force bilan o'chiriladi)" % out)
+        if os.path.samefile(out, HERE) or os.path.samefile(out, os.path.expanduser("~")) \
+                or os.path.dirname(os.path.abspath(out)) == os.path.abspath(out):
+            raise ValueError("%s ni o'chirib bo'lmaydi" % out)
+        shutil.rmtree(out)
+    os.makedirs(os.path.join(out, "assets"), exist_ok=True)
+    with open(os.path.join(out, MARKER), "w") as f:
+        f.write("webbuild.py\n")
+    for filename in runtime_modules():
+        shutil.copy2(os.path.join(HERE, filename), os.path.join(out, filename))
+    assets = os.path.join(HERE, "assets")
+    for filename in sorted(os.listdir(assets)):
+        if filename.endswith(".png") and filename not in SKIP_ASSETS:
+            shrink_image(os.path.join(assets, filename), os.path.join(out, "assets", filename), size)
+    return out
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=os.path.join(HERE, "build", "webapp"))
+    parser.add_argument("--sprite-size", type=int, help="rasmlar shu o'lchamgacha kichraytiriladi "
+                                                        "(standart: eng katta CELL_SIZE)")
+    parser.add_argument("--force", action="store_true", help="bo'sh bo'lmagan begona --out papkasini ham o'chirish")
+    args = parser.parse_args(argv)
+
+    try:
+        build(args.out, args.sprite_size, args.force)
+    except ValueError as e:
+        parser.error(str(e))
+    for label, folder in (("butun papka", HERE), ("web ilova", args.out)):
+        count, raw, packed = bundle_size(folder)
+        print("%-12s %3d fayl, %8.1f KiB, siqilgan %8.1f KiB" % (label, count, raw / 1024, packed / 1024))
+    print("Keyingi qadam: pygbag %s" % os.path.relpath(args.out))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
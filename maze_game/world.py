@@ -0,0 +1,258 @@
+"""Bo'laklarga (chunk) bo'lingan cheksiz labirint dunyosi.
+
+Dunyo ``size`` x ``size`` bo'laklardan iborat: global ``(r, c)`` katak
+``(r // size, c // size)`` bo'lagida (manfiy koordinatalar ham bo'ladi).
+Har bir bo'lak seed va o'z koordinatalaridan deterministik yaratiladi:
+ichi ``mazegen`` labirinti, yuqori qatori va chap ustuni esa bo'lakning
+o'ziga tegishli chegara devori bo'lib, unda yuqoridagi va chapdagi qo'shni
+bilan bir nechta o'tish joyi ochiladi. Shuning uchun bo'lakni istalgan
+paytda tashlab yuborib, keyin aynan o'zini qayta yaratish mumkin va butun
+dunyo bog'langan.
+
+Bo'laklar LRU keshda (``max_chunks``) turadi. Devori o'zgartirilgan bo'lak
+keshdan chiqarilganda ``cache_dir`` ga yoziladi va keyingi safar diskdan
+o'qiladi; o'zgarmaganlari shunchaki qayta yaratiladi. Xotira bo'laklar
+soni bilan chegaralangan, xarita o'lchami bilan emas. ``cache_dir``
+berilmasa vaqtinchalik papka ochiladi va ``close()`` (yoki ``with``) uni
+o'chiradi.
+
+    with World(seed=42) as world:
+        world.prefetch(r0, c0, r1, c1)           # kamera yaqinlashganda
+        world.is_wall(r, c), world.set_wall(r, c, True)
+        path = find_path(world, (1, 1), (501, -299))
+        grid = world.window(r0, c0, rows, cols)  # solverlar/renderer uchun CompactGrid
+
+Hozircha dunyoni faqat ``bench.py`` ishlatadi; ``main.py`` kamerasi bitta
+daraja chegarasida qoladi va ``prefetch`` ni chaqirmaydi.
+"""
+import heapq
+import os
+import random
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+
+import core
+import mazefile
+import mazegen
+
+CHUNK_SIZE = 32              # juft bo'lishi kerak (toq kataklar - labirint kataklari)
+MAX_CHUNKS = 256
+BORDER_OPENINGS = 2          # har bir chegara devoridagi o'tish joylari
+EXTRA_PATHS = 12             # bo'lak ichidagi qo'shimcha o'tishlar (halqalar)
+MAX_EXPANDED = 200000        # find_path shundan ko'p tugun ochmaydi
+
+class Chunk:
+    __slots__ = ("walls", "dirty")
+
+    def __init__(self, walls, dirty=False):
+        self.walls = walls
+        self.dirty = dirty
+
+class World:
+    def __init__(self, seed=0, size=CHUNK_SIZE, max_chunks=MAX_CHUNKS, cache_dir=None,
+                 generator="backtracker"):
+        if size < 4 or size % 2:
+            raise ValueError("Bo'lak o'lchami juft va kamida 4 bo'lishi kerak: %r" % size)
+        self.seed = seed
+        self.size = size
+        self.max_chunks = max_chunks
+        self.cache_dir = cache_dir
+        self.temp_dir = None            # o'zimiz ochgan papka (close() o'chiradi)
+        self.generator = generator
+        self.chunks = OrderedDict()     # (cy, cx) -> Chunk
+        self.saved = set()              # diskka yozilgan bo'laklar
+        self.version = 0                # devor chizilganda oshadi
+        self.stats = {"hits": 0, "misses": 0, "generated": 0, "loaded": 0, "saved": 0, "evicted": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Vaqtinchalik papkani o'chiradi; undagi bo'laklar unutiladi."""
+        if self.temp_dir is not None:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self.cache_dir = self.temp_dir = None
+            self.saved.clear()
+
+    # ---------------- BO'LAKLAR ----------------
+    def rng(self, cy, cx):
+        # str seed random.Random ichida sha512 orqali o'tadi: jarayonlar orasida ham bir xil
+        return random.Random("%s:%d:%d" % (self.seed, cy, cx))
+
+    def generate(self, cy, cx):
+        """``(cy, cx)`` bo'lagining devorlari (``bytearray``, ``size * size``)."""
+        size = self.size
+        rng = self.rng(cy, cx)
+        # Pastki qator va o'ng ustun keyingi bo'laklarning chegarasi, ular tashlanadi
+        grid = core.CompactGrid(size + 1, size + 1)
+        mazegen.generate(grid, self.generator, rng)
+        mazegen.add_extra_paths(grid, EXTRA_PATHS, rng)
+        walls = bytearray()
+        for r in range(size):
+            walls += grid.walls[r * (size + 1):r * (size + 1) + size]
+        # Yuqori va chap chegaralarda o'tish joylari (toq koordinatalarda)
+        odd = range(1, size, 2)
+        for c in rng.sample(odd, min(BORDER_OPENINGS, len(odd))):
+            walls[c] = 0
+        for r in rng.sample(odd, min(BORDER_OPENINGS, len(odd))):
+            walls[r * size] = 0
+        self.stats["generated"] += 1
+        return walls
+
+    def path_for(self, cy, cx):
+        return os.path.join(self.cache_dir, "%d_%d.chunk" % (cy, cx))
+
+    def save_chunk(self, key, chunk):
+        if self.cache_dir is None:
+            self.cache_dir = self.temp_dir = tempfile.mkdtemp(prefix="maze_world_")
+        size = self.size
+        with open(self.path_for(*key), "wb") as f:
+            for r in range(size):
+                f.write(mazefile.pack_row(chunk.walls[r * size:(r + 1) * size]))
+        self.saved.add(key)
+        self.stats["saved"] += 1
+
+    def load_chunk(self, key):
+        size = self.size
+        row_size = mazefile.row_bytes(size)
+        with open(self.path_for(*key), "rb") as f:
+            data = f.read()
+        walls = bytearray()
+        for r in range(size):
+            walls += mazefile.unpack_row(data[r * row_size:(r + 1) * row_size], size)
+        self.stats["loaded"] += 1
+        return walls
+
+    def chunk(self, cy, cx):
+        """Bo'lak (keshdan, diskdan yoki yangi yaratilgan)."""
+        key = (cy, cx)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            self.stats["hits"] += 1
+            return chunk
+        self.stats["misses"] += 1
+        if key in self.saved:
+            # Diskdagi nusxa - chizilgan devorlar bilan; yana o'zgarsa qayta yoziladi
+            chunk = Chunk(self.load_chunk(key))
+        else:
+            chunk = Chunk(self.generate(cy, cx))
+        self.chunks[key] = chunk
+        while len(self.chunks) > self.max_chunks:
+            old_key, old = self.chunks.popitem(last=False)
+            self.stats["evicted"] += 1
+            if old.dirty:
+                self.save_chunk(old_key, old)
+        return chunk
+
+    def prefetch(self, r0, c0, r1, c1):
+        """``[r0, r1) x [c0, c1)`` oralig'ini qamraydigan bo'laklarni oldindan yuklaydi."""
+        size = self.size
+        for cy in range(r0 // size, (r1 - 1) // size + 1):
+            for cx in range(c0 // size, (c1 - 1) // size + 1):
+                self.chunk(cy, cx)
+
+    # ---------------- KATAKLAR ----------------
+    def is_wall(self, r, c):
+        size = self.size
+        cy, lr = divmod(r, size)
+        cx, lc = divmod(c, size)
+        return bool(self.chunk(cy, cx).walls[lr * size + lc])
+
+    def set_wall(self, r, c, value):
+        size = self.size
+        cy, lr = divmod(r, size)
+        cx, lc = divmod(c, size)
+        chunk = self.chunk(cy, cx)
+        if chunk.walls[lr * size + lc] != bool(value):
+            chunk.walls[lr * size + lc] = bool(value)
+            chunk.dirty = True
+            self.version += 1
+
+    def window(self, r0, c0, rows, cols, cell_size=0, view_cls=None):
+        """Dunyoning ``rows`` x ``cols`` bo'lagidan ``CompactGrid`` (nusxa)."""
+        grid = core.CompactGrid(rows, cols, cell_size, view_cls)
+        size, walls = self.size, grid.walls
+        for r in range(rows):
+            cy, lr = divmod(r0 + r, size)
+            c = 0
+            while c < cols:
+                cx, lc = divmod(c0 + c, size)
+                n = min(size - lc, cols - c)
+                src = self.chunk(cy, cx).walls
+                walls[r * cols + c:r * cols + c + n] = src[lr * size + lc:lr * size + lc + n]
+                c += n
+        return grid
+
+# ---------------- YO'L QIDIRISH ----------------
+def find_path(world, start, goal, stats=None, max_expanded=MAX_EXPANDED):
+    """Global ``(r, c)`` kataklar orasida A*; bo'lak chegaralaridan bemalol o'tadi.
+
+    Yo'l ``(r, c)`` ro'yxati yoki None (yo'l yo'q yoki ``max_expanded`` tugadi).
+    Kerakli bo'laklar qidiruv davomida yuklanadi/yaratiladi. ``stats`` da
+    yetishmagan kalitlar ``core.new_stats()`` dan qo'shiladi.
+    """
+    if stats is None:
+        stats = core.new_stats()
+    else:
+        for key, value in core.new_stats().items():
+            stats.setdefault(key, value)
+    t0 = time.perf_counter()
+    try:
+        if world.is_wall(*start) or world.is_wall(*goal):
+            return None
+        size = world.size
+        gr, gc = goal
+        g = {start: 0}
+        parent = {start: None}
+        closed = set()
+        h0 = abs(start[0] - gr) + abs(start[1] - gc)
+        pq = [(h0, h0, start)]
+        stats["pushed"] += 1
+        # Oxirgi bo'lak devorlari: qo'shnilarning ko'pi shu bo'lakda bo'ladi
+        last_key, last_walls = None, None
+        # stats avvalgi qidiruvlardan to'planishi mumkin, chegara esa shu qidiruv uchun
+        expanded = 0
+        while pq:
+            _, _, cur = heapq.heappop(pq)
+            if cur in closed:
+                stats["stale"] += 1
+                continue
+            closed.add(cur)
+            stats["expanded"] += 1
+            expanded += 1
+            if cur == goal:
+                path = []
+                while cur is not None:
+                    path.append(cur)
+                    cur = parent[cur]
+                stats["path_length"] = len(path)
+                return path[::-1]
+            if expanded >= max_expanded:
+                return None
+
+            r, c = cur
+            nd = g[cur] + 1
+            for nb in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)):
+                if nb in closed:
+                    continue
+                cy, lr = divmod(nb[0], size)
+                cx, lc = divmod(nb[1], size)
+                if (cy, cx) != last_key:
+                    last_key, last_walls = (cy, cx), world.chunk(cy, cx).walls
+                if last_walls[lr * size + lc]:
+                    continue
+                if nd < g.get(nb, core.INF):
+                    g[nb] = nd
+                    parent[nb] = cur
+                    h = abs(nb[0] - gr) + abs(nb[1] - gc)
+                    heapq.heappush(pq, (nd + h, h, nb))
+                    stats["pushed"] += 1
+        return None
+    finally:
+        stats["time"] += time.perf_counter() - t0